@@ -0,0 +1,104 @@
+"""Forecast parsing: per-block dict path versus ColumnarForecast, and the
+public get_5day_forecast / get_daily_summary calls on generated payloads
+
+Run from the repository root:
+
+    python -m benchmarks.bench_forecast
+"""
+import json
+import time
+from datetime import datetime
+
+from benchmarks.common import fixture_paths, measure, print_results
+from tools.forecast_columns import ColumnarForecast
+from tools.weather_api import WeatherAPI
+
+
+def legacy_daily_summary(forecast_data):
+    """Daily reduction over the per-block dicts, as get_daily_summary used to do"""
+    summaries = []
+    for date, blocks in forecast_data["forecast"].items():
+        temps = [b["temperature"] for b in blocks]
+        mid = blocks[len(blocks) // 2]
+        summaries.append({
+            "date": date,
+            "day_name": datetime.strptime(date, "%Y-%m-%d").strftime("%A"),
+            "temp_min": min(temps),
+            "temp_max": max(temps),
+            "temp_avg": sum(temps) / len(temps),
+            "description": mid["description"],
+            "icon": mid["icon"],
+            "id": mid["id"],
+            "humidity": sum(b["humidity"] for b in blocks) / len(blocks),
+            "wind_speed": sum(b["wind_speed"] for b in blocks) / len(blocks),
+        })
+    return summaries
+
+
+def load_payloads():
+    payloads = []
+    for path in fixture_paths("owm", "forecast_"):
+        with open(path, 'r') as f:
+            payloads.append(json.load(f))
+    return payloads
+
+
+def prime_response_cache(api, payloads):
+    """Serve the generated payloads from the response cache instead of the network"""
+    for payload in payloads:
+        city = payload["city"]
+        for query in (city["name"].lower(), str(city["id"])):
+            api.cache.put(("forecast", query, "metric"), payload, expires_at=time.time() + 86400)
+    return [payload["city"]["name"] for payload in payloads]
+
+
+def run():
+    api = WeatherAPI("benchmark")
+    payloads = load_payloads()
+    cities = prime_response_cache(api, payloads)
+
+    def dict_parse():
+        for payload in payloads:
+            api._parse_forecast(payload)
+
+    def dict_parse_and_summary():
+        for payload in payloads:
+            legacy_daily_summary(api._parse_forecast(payload))
+
+    def columnar_parse():
+        for payload in payloads:
+            ColumnarForecast.from_payload(payload)
+
+    def columnar_parse_and_summary():
+        for payload in payloads:
+            ColumnarForecast.from_payload(payload).daily()
+
+    def api_cold(method):
+        def call():
+            # Drop parsed forecasts so every call re-parses its payload
+            api.forecasts.clear()
+            for city in cities:
+                method(city)
+        return call
+
+    def api_warm(method):
+        def call():
+            for city in cities:
+                method(city)
+        return call
+
+    per_payload = len(payloads)
+    return {
+        "forecast.dict.parse": measure(dict_parse) / per_payload,
+        "forecast.dict.parse+daily": measure(dict_parse_and_summary) / per_payload,
+        "forecast.columnar.parse": measure(columnar_parse) / per_payload,
+        "forecast.columnar.parse+daily": measure(columnar_parse_and_summary) / per_payload,
+        "forecast.get_5day_forecast.cold": measure(api_cold(api.get_5day_forecast)) / per_payload,
+        "forecast.get_5day_forecast.warm": measure(api_warm(api.get_5day_forecast)) / per_payload,
+        "forecast.get_daily_summary.cold": measure(api_cold(api.get_daily_summary)) / per_payload,
+        "forecast.get_daily_summary.warm": measure(api_warm(api.get_daily_summary)) / per_payload,
+    }
+
+
+if __name__ == "__main__":
+    print_results("Forecast parsing (per 40-block payload)", run())
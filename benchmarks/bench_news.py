@@ -0,0 +1,123 @@
+"""News pipeline: relevance filter (word-set matcher against the substring
+checks it replaced, which it should not be slower than), HTML stripping
+and feed parsing (streaming RSS parser against feedparser) over the
+generated feeds, near-duplicate grouping of headlines at two sizes
+(per-title cost should stay flat), and full NewsWorker.run calls against
+the local stand-in server, with and without the news cache
+
+Run from the repository root:
+
+    python -m benchmarks.bench_news
+"""
+import random
+
+import feedparser
+
+from benchmarks.common import fixture_paths, measure, print_results
+from benchmarks.standin_server import Faults, StandinServer
+from tools.keyword_matcher import BLOCKED_KEYWORDS, WEATHER_KEYWORDS
+from tools.news_api import NewsWorker
+from tools.news_cache import NewsCache
+from tools.story_index import StoryIndex
+
+# Articles per filter pass; the fixture feeds are repeated to reach it
+ARTICLE_COUNT = 2000
+# Per-feed latency of the stand-in for the end-to-end run
+FEED_LATENCY_MS = 50
+
+
+def load_articles(count=ARTICLE_COUNT):
+    """(title, summary) pairs as feedparser hands them to NewsWorker"""
+    entries = []
+    for path in fixture_paths("news", "rss_"):
+        entries.extend(feedparser.parse(path).entries)
+
+    articles = [(entry.title, entry.get("summary", "")) for entry in entries]
+    return (articles * (count // len(articles) + 1))[:count]
+
+
+def random_headlines(articles, count):
+    """count distinct headlines of 8-12 words drawn from the fixture titles' vocabulary"""
+    rng = random.Random(0)
+    vocabulary = sorted({word for title, _ in articles for word in title.split()})
+    return [" ".join(rng.choices(vocabulary, k=rng.randint(8, 12))) for _ in range(count)]
+
+
+def substring_filter(title, summary):
+    """The relevance check before KeywordMatcher: plain substring scans"""
+    text = f"{title} {summary}".lower()
+    if not any(word in text for word in WEATHER_KEYWORDS):
+        return False
+    return not any(word in text for word in BLOCKED_KEYWORDS)
+
+
+def run():
+    worker = NewsWorker("benchmark")
+    articles = load_articles()
+    stripped = [(worker.strip_html(title), worker.strip_html(summary)) for title, summary in articles]
+
+    def filter_articles():
+        for title, summary in stripped:
+            worker.is_weather_article(title, summary)
+
+    def filter_articles_substring():
+        for title, summary in stripped:
+            substring_filter(title, summary)
+
+    feeds = [open(path, "rb").read() for path in fixture_paths("news", "rss_")]
+
+    def parse_feeds():
+        for body in feeds:
+            worker.parse_feed(body, {})
+
+    def parse_feeds_feedparser():
+        for body in feeds:
+            worker.feed_records(feedparser.parse(body).entries)
+
+    def group_stories(headlines):
+        index = StoryIndex()
+        for text in headlines:
+            index.find_or_add(text, text)
+
+    small = random_headlines(articles, len(articles))
+    large = random_headlines(articles, 4 * len(articles))
+
+    def strip_articles():
+        for title, summary in articles:
+            worker.strip_html(title)
+            worker.strip_html(summary)
+
+    server = StandinServer(faults=Faults(latency=str(FEED_LATENCY_MS))).start()
+    try:
+        fetch_worker = NewsWorker("London", server.url)
+        fetch_and_filter = measure(fetch_worker.run, number=1, repeat=5)
+
+        # Fresh cache entries: no request, no parsing, no filtering
+        cached_worker = NewsWorker("London", server.url, cache=NewsCache())
+        cached_worker.run()
+        cached = measure(cached_worker.run)
+
+        # Stale entries answered with 304
+        revalidate_worker = NewsWorker("London", server.url, cache=NewsCache(ttl=0))
+        revalidate_worker.run()
+        revalidated = measure(revalidate_worker.run, number=1, repeat=5)
+    finally:
+        server.stop()
+
+    per_article = len(articles)
+    return {
+        "news.is_weather_article": measure(filter_articles) / per_article,
+        "news.is_weather_article.substring": measure(filter_articles_substring) / per_article,
+        "news.strip_html": measure(strip_articles) / per_article,
+        "news.parse_feed": measure(parse_feeds) / len(feeds),
+        "news.parse_feed.feedparser": measure(parse_feeds_feedparser) / len(feeds),
+        f"news.story_index.{len(small)}": measure(lambda: group_stories(small), number=1) / len(small),
+        f"news.story_index.{len(large)}": measure(lambda: group_stories(large), number=1) / len(large),
+        f"news.run.standin_{FEED_LATENCY_MS}ms": fetch_and_filter,
+        "news.run.cached": cached,
+        f"news.run.not_modified_{FEED_LATENCY_MS}ms": revalidated,
+    }
+
+
+if __name__ == "__main__":
+    print_results(f"News pipeline (per article, {ARTICLE_COUNT} articles; parse per feed; run per city)", run())
@@ -0,0 +1,182 @@
+"""UI hot paths, offscreen: MainWindow construction, sidebar and news cards,
+and update_background for every background asset
+
+Runs in a scratch directory with its own settings and saved cities, with
+the weather and news hosts pointed at the local stand-in server, so the
+numbers don't depend on the network or on the user's files.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_ui
+"""
+import json
+import os
+import shutil
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("OPENWEATHER_API_KEY", "benchmark")
+
+from benchmarks.common import REPO_ROOT, measure, print_results
+from benchmarks.fixtures.generate import CITIES
+from benchmarks.standin_server import StandinServer
+
+CARD_COUNT = 50
+NEWS_COUNT = 20
+# Items per streamed news batch
+NEWS_BATCH = 7
+CONSTRUCTION_REPEAT = 5
+
+SETTINGS = {
+    "temperature_unit": "celsius",
+    "wind_unit": "metric",
+    "auto_refresh": False,
+    "default_city": "London",
+    "news_count": str(NEWS_COUNT),
+    "refresh_interval": "manual",
+    "sidebar_default": "expanded",
+    "time_format": "24h",
+    "location_services": "disabled",
+}
+
+# One OWM weather ID per branch of update_background (asset name, ID)
+BACKGROUNDS = [
+    ("thunderstorm", 211),
+    ("drizzle", 300),
+    ("rain", 500),
+    ("heavy_rain", 511),
+    ("snow", 601),
+    ("mist", 701),
+    ("fog", 741),
+    ("dust", 761),
+    ("squall", 771),
+    ("tornado", 781),
+    ("clear", 800),
+    ("few_clouds", 801),
+    ("overcast", 804),
+]
+
+
+def prepare_scratch_dir(path):
+    """Settings, saved cities and assets the window expects in its working directory"""
+    try:
+        os.symlink(os.path.join(REPO_ROOT, "assets"), os.path.join(path, "assets"))
+    except OSError:
+        shutil.copytree(os.path.join(REPO_ROOT, "assets"), os.path.join(path, "assets"))
+    shutil.copy(os.path.join(REPO_ROOT, "window_config.json"), path)
+    with open(os.path.join(path, "settings.json"), 'w') as f:
+        json.dump(SETTINGS, f, indent=2)
+    with open(os.path.join(path, "saved_cities.json"), 'w') as f:
+        json.dump([city[0] for city in CITIES], f, indent=2)
+
+
+def news_items(count=NEWS_COUNT):
+    """Processed news items shaped like NewsWorker.run output"""
+    return [{
+        "title": f"Heavy rain expected across the region as storm {i} moves in",
+        "source": "BBC News",
+        "published": "Oct 09, 2025",
+        "published_relative": f"{i + 1} hours ago",
+        "summary": "Forecasters warn of flooding and strong winds through the weekend.",
+        "link": f"https://news.google.com/rss/articles/{i}",
+        "date": None,
+    } for i in range(count)]
+
+
+def run():
+    from PyQt5.QtWidgets import QApplication, QVBoxLayout, QWidget
+
+    app = QApplication.instance() or QApplication([])
+    server = StandinServer().start()
+    os.environ["OPENWEATHER_API_HOST"] = server.url
+    os.environ["GOOGLE_NEWS_HOST"] = server.url
+
+    from ui.main_window import MainWindow
+    from ui.news_card import NewsCard
+    from ui.sidebar_card import WeatherCard
+
+    previous_dir = os.getcwd()
+    scratch = tempfile.TemporaryDirectory(prefix="weatherly-bench-")
+    try:
+        prepare_scratch_dir(scratch.name)
+        os.chdir(scratch.name)
+
+        # Construction only; the fetches it starts are drained before the next one
+        construction = []
+        for _ in range(CONSTRUCTION_REPEAT):
+            started_at = time.perf_counter()
+            window = MainWindow()
+            construction.append((time.perf_counter() - started_at) * 1e6)
+            window.close()
+            window.deleteLater()
+            app.processEvents()
+
+        window = MainWindow()
+        window.resize(1200, 750)
+        app.processEvents()
+
+        container = QWidget()
+        layout = QVBoxLayout(container)
+
+        def build_weather_cards():
+            cards = [WeatherCard(f"City {i}", "18°", "Clear Sky", "H: 21°", "L: 12°") for i in range(CARD_COUNT)]
+            for card in cards:
+                layout.addWidget(card)
+            for card in cards:
+                card.setParent(None)
+                card.deleteLater()
+            app.processEvents()
+
+        def build_news_cards():
+            cards = [NewsCard(item["title"], item["source"], item["published"], item["summary"], item["link"])
+                     for item in news_items()]
+            for card in cards:
+                layout.addWidget(card)
+            for card in cards:
+                card.setParent(None)
+                card.deleteLater()
+            app.processEvents()
+
+        items = news_items()
+
+        def update_news():
+            # From an empty section, as after a city switch
+            window.clear_news()
+            window.update_news(items)
+            app.processEvents()
+
+        def stream_news():
+            window.clear_news()
+            for start in range(0, len(items), NEWS_BATCH):
+                window.merge_news(items[start:start + NEWS_BATCH])
+                app.processEvents()
+            window.update_news(items)
+            app.processEvents()
+
+        results = {
+            "ui.main_window.construct": min(construction),
+            "ui.weather_card.build": measure(build_weather_cards, number=5) / CARD_COUNT,
+            "ui.news_card.build": measure(build_news_cards, number=5) / NEWS_COUNT,
+            "ui.update_news": measure(update_news, number=5),
+            "ui.merge_news.batches": measure(stream_news, number=5),
+        }
+        for name, weather_id in BACKGROUNDS:
+            # Each call decodes and smooth-scales a full-size JPEG
+            results[f"ui.update_background.{name}"] = measure(
+                lambda: window.update_background(weather_id), number=1, repeat=5
+            )
+
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+    finally:
+        os.chdir(previous_dir)
+        server.stop()
+        scratch.cleanup()
+
+    return results
+
+
+if __name__ == "__main__":
+    print_results(f"UI (per card for builds, {CARD_COUNT} weather / {NEWS_COUNT} news cards)", run())
@@ -0,0 +1,52 @@
+import json
+import os
+import statistics
+import sys
+import timeit
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+FIXTURE_DIR = os.path.join(BENCH_DIR, "fixtures")
+
+# Benchmarks import the app modules the same way main.py does
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def load_fixture(*parts):
+    """Load a JSON fixture relative to benchmarks/fixtures"""
+    with open(os.path.join(FIXTURE_DIR, *parts), 'r') as f:
+        return json.load(f)
+
+
+def load_text_fixture(*parts):
+    with open(os.path.join(FIXTURE_DIR, *parts), 'r', encoding="utf-8") as f:
+        return f.read()
+
+
+def fixture_paths(folder, prefix):
+    folder_path = os.path.join(FIXTURE_DIR, folder)
+    return sorted(
+        os.path.join(folder_path, name)
+        for name in os.listdir(folder_path)
+        if name.startswith(prefix)
+    )
+
+
+def measure(fn, number=None, repeat=9):
+    """Median-of-repeat time per call in microseconds
+
+    The median moves less between runs than the best time, which a
+    single lucky repeat can pull down.
+    """
+    timer = timeit.Timer(fn)
+    if number is None:
+        number, _ = timer.autorange()
+    return statistics.median(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def print_results(title, results):
+    print(title)
+    width = max(len(name) for name in results)
+    for name, usec in results.items():
+        print(f"  {name:<{width}}  {usec:>10.1f} µs")
@@ -0,0 +1,229 @@
+"""Regenerate the OWM-shaped and Google News-shaped fixtures used by the benchmarks
+
+The payloads follow the structure of real api.openweathermap.org/data/2.5
+responses (field names, nesting, 3-hour forecast blocks) and of
+news.google.com/rss/search feeds, with deterministic values, so benchmark
+runs are comparable across machines and over time.
+"""
+import json
+import math
+import os
+import random
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
+
+FIXTURE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# name, OWM id, country, lat, lon, UTC offset (s), base temp (°C)
+CITIES = [
+    ("London", 2643743, "GB", 51.5085, -0.1257, 3600, 14.0),
+    ("Tokyo", 1850147, "JP", 35.6895, 139.6917, 32400, 19.0),
+    ("New York", 5128581, "US", 40.7143, -74.006, -14400, 17.0),
+    ("Bengaluru", 1277333, "IN", 12.9762, 77.6033, 19800, 24.0),
+    ("Sydney", 2147714, "AU", -33.8679, 151.2073, 36000, 16.0),
+]
+
+CONDITIONS = [
+    (800, "Clear", "clear sky", "01"),
+    (801, "Clouds", "few clouds", "02"),
+    (802, "Clouds", "scattered clouds", "03"),
+    (803, "Clouds", "broken clouds", "04"),
+    (804, "Clouds", "overcast clouds", "04"),
+    (500, "Rain", "light rain", "10"),
+    (501, "Rain", "moderate rain", "10"),
+    (211, "Thunderstorm", "thunderstorm", "11"),
+]
+
+# Fixed reference time so fixtures never change between runs
+NOW = 1760000400
+
+
+def condition(rng, hour):
+    cid, main, desc, icon = rng.choice(CONDITIONS)
+    return {"id": cid, "main": main, "description": desc, "icon": icon + ("d" if 6 <= hour < 18 else "n")}
+
+
+def current_payload(city, rng):
+    name, cid, country, lat, lon, tz, base = city
+    temp = round(base + rng.uniform(-3, 3), 2)
+    payload = {
+        "coord": {"lon": lon, "lat": lat},
+        "weather": [condition(rng, 12)],
+        "base": "stations",
+        "main": {
+            "temp": temp,
+            "feels_like": round(temp - rng.uniform(0, 2), 2),
+            "temp_min": round(temp - rng.uniform(0, 2), 2),
+            "temp_max": round(temp + rng.uniform(0, 2), 2),
+            "pressure": rng.randint(995, 1030),
+            "humidity": rng.randint(30, 95),
+        },
+        "visibility": 10000,
+        "wind": {"speed": round(rng.uniform(0, 9), 2), "deg": rng.randint(0, 359)},
+        "clouds": {"all": rng.randint(0, 100)},
+        "dt": NOW,
+        "sys": {"type": 2, "id": 2000000 + cid % 1000, "country": country,
+                "sunrise": NOW - 6 * 3600, "sunset": NOW + 6 * 3600},
+        "timezone": tz,
+        "id": cid,
+        "name": name,
+        "cod": 200,
+    }
+    if payload["weather"][0]["main"] == "Rain":
+        payload["rain"] = {"1h": round(rng.uniform(0.1, 3), 2)}
+    return payload
+
+
+def forecast_payload(city, rng):
+    name, cid, country, lat, lon, tz, base = city
+    start = NOW - NOW % 10800 + 10800
+    blocks = []
+    for i in range(40):
+        dt = start + i * 10800
+        hour = ((dt + tz) // 3600) % 24
+        temp = round(base + 5 * math.sin((hour - 9) / 24 * 2 * math.pi) + rng.uniform(-1.5, 1.5), 2)
+        blocks.append({
+            "dt": dt,
+            "main": {
+                "temp": temp,
+                "feels_like": round(temp - rng.uniform(0, 2), 2),
+                "temp_min": round(temp - rng.uniform(0, 1), 2),
+                "temp_max": round(temp + rng.uniform(0, 1), 2),
+                "pressure": rng.randint(995, 1030),
+                "sea_level": rng.randint(995, 1030),
+                "grnd_level": rng.randint(980, 1020),
+                "humidity": rng.randint(30, 95),
+                "temp_kf": 0,
+            },
+            "weather": [condition(rng, hour)],
+            "clouds": {"all": rng.randint(0, 100)},
+            "wind": {"speed": round(rng.uniform(0, 9), 2), "deg": rng.randint(0, 359), "gust": round(rng.uniform(0, 14), 2)},
+            "visibility": 10000,
+            "pop": round(rng.random(), 2),
+            "sys": {"pod": "d" if 6 <= hour < 18 else "n"},
+            "dt_txt": datetime.fromtimestamp(dt, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+        })
+    return {
+        "cod": "200",
+        "message": 0,
+        "cnt": len(blocks),
+        "list": blocks,
+        "city": {
+            "id": cid, "name": name, "coord": {"lat": lat, "lon": lon}, "country": country,
+            "population": 1000000, "timezone": tz, "sunrise": NOW - 6 * 3600, "sunset": NOW + 6 * 3600,
+        },
+    }
+
+
+SOURCES = [
+    ("BBC News", "https://www.bbc.co.uk"),
+    ("Reuters", "https://www.reuters.com"),
+    ("The Guardian", "https://www.theguardian.com"),
+    ("AccuWeather", "https://www.accuweather.com"),
+    ("Times of India", "https://timesofindia.indiatimes.com"),
+    ("NHK WORLD", "https://www3.nhk.or.jp"),
+    ("ABC News", "https://abcnews.go.com"),
+    ("Sky News", "https://news.sky.com"),
+]
+
+# Headlines the weather filter should keep
+WEATHER_HEADLINES = [
+    "{city} weather: heavy rain and thunderstorm warning issued for tonight",
+    "Heatwave to push {city} temperatures past seasonal records this week",
+    "{city} forecast: cold wave expected as winds turn northerly",
+    "Storm brings flooding and travel disruption across {city}",
+    "Met office issues yellow rain alert for {city} and surrounding areas",
+    "{city} braces for snowfall as temperature drops below freezing",
+    "Weekend weather for {city}: sunshine after a wet start",
+    "Cyclone track shifts, {city} told to expect strong winds",
+    "Rainfall totals in {city} highest for October in a decade",
+    "{city} weather live: latest updates as thunderstorm moves in",
+]
+
+# Headlines that mention weather words but should be filtered out, plus off-topic ones
+OTHER_HEADLINES = [
+    "New thriller novel set in stormy {city} tops the charts",
+    "Movie review: the {city} weather drama nobody asked for",
+    "{city} football match postponed after board meeting",
+    "Property prices in {city} rise for third straight month",
+    "{city} council approves new cycle lanes",
+    "Celebrity chef opens {city} restaurant",
+    "{city} music festival announces weather-proof main stage",
+    "Transport strike planned in {city} next Tuesday",
+]
+
+
+def rss_item(city, rng, published):
+    if rng.random() < 0.65:
+        headline = rng.choice(WEATHER_HEADLINES)
+    else:
+        headline = rng.choice(OTHER_HEADLINES)
+    source, source_url = rng.choice(SOURCES)
+    title = f"{headline.format(city=city)} - {source}"
+    article_id = "CBMi" + "".join(rng.choice("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789") for _ in range(40))
+    link = f"https://news.google.com/rss/articles/{article_id}?oc=5"
+    # Google News puts an HTML snippet in the description
+    description = (f'<a href="{link}" target="_blank">{escape(title)}</a>'
+                   f'&nbsp;&nbsp;<font color="#6f6f6f">{escape(source)}</font>')
+    return (
+        "<item>"
+        f"<title>{escape(title)}</title>"
+        f"<link>{link}</link>"
+        f'<guid isPermaLink="false">{article_id}</guid>'
+        f"<pubDate>{format_datetime(published, usegmt=True)}</pubDate>"
+        f"<description>{escape(description)}</description>"
+        f'<source url="{source_url}">{escape(source)}</source>'
+        "</item>"
+    )
+
+
+def rss_feed(city, rng, count=40):
+    name = city[0]
+    items = []
+    for i in range(count):
+        # Newest first, spread over the last ~40 days
+        age = i * 86400 + rng.randint(0, 20 * 3600)
+        published = datetime.fromtimestamp(NOW - age, tz=timezone.utc)
+        items.append(rss_item(name, rng, published))
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"><channel>'
+        "<generator>NFE/5.0</generator>"
+        f"<title>&quot;{escape(name)} weather&quot; - Google News</title>"
+        "<link>https://news.google.com/search?hl=en-US&amp;gl=US&amp;ceid=US:en</link>"
+        "<language>en-US</language>"
+        "<webMaster>news-webmaster@google.com</webMaster>"
+        "<copyright>2025 Google LLC</copyright>"
+        f"<lastBuildDate>{format_datetime(datetime.fromtimestamp(NOW, tz=timezone.utc), usegmt=True)}</lastBuildDate>"
+        "<description>Google News</description>"
+        + "\n".join(items) +
+        "</channel></rss>"
+    )
+
+
+def slug(name):
+    return name.lower().replace(" ", "_")
+
+
+def main():
+    rng = random.Random(42)
+    for city in CITIES:
+        for kind, build in (("weather", current_payload), ("forecast", forecast_payload)):
+            path = os.path.join(FIXTURE_DIR, "owm", f"{kind}_{slug(city[0])}.json")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                json.dump(build(city, rng), f, indent=1)
+            print(f"Wrote {path}")
+
+    rng = random.Random(7)
+    for city in CITIES:
+        path = os.path.join(FIXTURE_DIR, "news", f"rss_{slug(city[0])}.xml")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(rss_feed(city, rng))
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Run the benchmark suites and compare the results with a stored baseline
+
+Run from the repository root:
+
+    python -m benchmarks.run                     # all suites, compare with baseline.json
+    python -m benchmarks.run --suite news        # one suite
+    python -m benchmarks.run --save-baseline     # record the current numbers as the baseline
+    python -m benchmarks.run --output bench.json # also write the results as JSON
+    python -m benchmarks.run --suite news --only news.parse_feed --save-baseline --runs 3
+                                                 # re-record only the benchmarks a change touches
+
+Timings are median-of-repeat microseconds per call, lower is better;
+with --runs, the median over several runs in fresh processes is used. The
+exit status is 1 when a benchmark is slower than its baseline by more
+than the threshold, so the suite can gate a change. Benchmarks under
+SMALL_BENCHMARK_USEC swing more from run to run and get a wider
+threshold.
+"""
+import argparse
+import importlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.common import BENCH_DIR
+
+SUITES = ("forecast", "news", "ui")
+BASELINE_FILE = os.path.join(BENCH_DIR, "baseline.json")
+# Slower than baseline by more than this fraction counts as a regression
+DEFAULT_THRESHOLD = 0.25
+# Microsecond-scale timings are noisier, so they need a bigger slowdown to count
+SMALL_BENCHMARK_USEC = 10.0
+SMALL_THRESHOLD = 0.5
+
+
+def environment():
+    """Where the numbers came from; baselines only compare on similar machines"""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "timestamp": int(time.time()),
+    }
+
+
+def run_suites(suites):
+    results = {}
+    for suite in suites:
+        print(f"Running {suite}...", file=sys.stderr)
+        module = importlib.import_module(f"benchmarks.bench_{suite}")
+        results.update(module.run())
+    return results
+
+
+def run_passes(suites, runs):
+    """Median of each benchmark over runs passes, each in a fresh interpreter
+
+    A second pass in the same process would start with warm caches and
+    imports, so it wouldn't measure what a single run does.
+    """
+    samples = {}
+    with tempfile.TemporaryDirectory() as scratch:
+        for run in range(runs):
+            print(f"Pass {run + 1}/{runs}", file=sys.stderr)
+            output = os.path.join(scratch, f"pass{run}.json")
+            command = [sys.executable, "-m", "benchmarks.run", "--output", output]
+            for suite in suites:
+                command += ["--suite", suite]
+            # The pass's own comparison isn't used; only its results are
+            subprocess.run(command, stdout=subprocess.DEVNULL, check=False)
+            with open(output) as f:
+                for name, usec in json.load(f)["results"].items():
+                    samples.setdefault(name, []).append(usec)
+    return {name: statistics.median(values) for name, values in samples.items()}
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r') as f:
+            return json.load(f).get("results", {})
+    except Exception as e:
+        print(f"Error loading baseline: {e}", file=sys.stderr)
+        return {}
+
+
+def compare(results, baseline, threshold):
+    """{name: {"usec", "baseline", "change", "status"}}"""
+    comparison = {}
+    for name, usec in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            comparison[name] = {"usec": usec, "baseline": None, "change": None, "status": "new"}
+            continue
+
+        change = usec / reference - 1 if reference else 0.0
+        limit = max(threshold, SMALL_THRESHOLD) if reference < SMALL_BENCHMARK_USEC else threshold
+        if change > limit:
+            status = "regression"
+        elif change < -limit:
+            status = "improvement"
+        else:
+            status = "ok"
+        comparison[name] = {"usec": usec, "baseline": reference, "change": change, "status": status}
+    return comparison
+
+
+def print_comparison(comparison):
+    width = max(len(name) for name in comparison)
+    for name, row in comparison.items():
+        line = f"  {name:<{width}}  {row['usec']:>12.1f} µs"
+        if row["baseline"] is not None:
+            line += f"  {row['baseline']:>12.1f} µs  {row['change']:>+7.1%}"
+        if row["status"] != "ok":
+            line += f"  {row['status']}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Weatherly benchmarks")
+    parser.add_argument("--suite", action="append", choices=SUITES, help="suite to run (repeatable, default all)")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline JSON to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results to the baseline file")
+    parser.add_argument("--output", help="write the results and comparison to this JSON file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown fraction that counts as a regression")
+    parser.add_argument("--runs", type=int, default=1,
+                        help="run the suites this many times, each in a fresh process, and use the medians")
+    parser.add_argument("--only", action="append",
+                        help="benchmark name prefix to keep (repeatable); others are not compared or saved")
+    args = parser.parse_args()
+
+    suites = args.suite or list(SUITES)
+    results = run_passes(suites, args.runs) if args.runs > 1 else run_suites(suites)
+    if args.only:
+        results = {name: usec for name, usec in results.items() if name.startswith(tuple(args.only))}
+    report = {"environment": environment(), "suites": suites, "results": results}
+
+    if args.save_baseline:
+        # Keep baseline entries that weren't run (or were filtered out) this time
+        merged = dict(load_baseline(args.baseline), **results)
+        with open(args.baseline, 'w') as f:
+            json.dump(dict(report, results=merged), f, indent=2, sort_keys=True)
+        print(f"Saved baseline to {args.baseline}")
+
+    comparison = compare(results, load_baseline(args.baseline), args.threshold)
+    report["comparison"] = comparison
+    print_comparison(comparison)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    regressions = [name for name, row in comparison.items() if row["status"] == "regression"]
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,344 @@
+"""Local stand-in for api.openweathermap.org and news.google.com
+
+Serves the generated OWM-shaped and Google News-shaped fixtures in
+benchmarks/fixtures (written by benchmarks/fixtures/generate.py, not
+captured from the live services) with optional fault injection, so the
+fetch layer can be benchmarked and load-tested offline:
+
+    python -m benchmarks.standin_server --port 8765 --latency lognormal:120:0.5 \\
+        --error-rate 0.02 --rate-429 0.01 --drip 256:20 --drip-rate 0.05
+
+then point the app at it through .env:
+
+    OPENWEATHER_API_HOST=http://127.0.0.1:8765
+    GOOGLE_NEWS_HOST=http://127.0.0.1:8765
+
+Routes: /data/2.5/weather, /data/2.5/forecast, /data/2.5/group and
+/rss/search. Fixture timestamps are shifted so "now" in the fixtures is
+the moment the server started. RSS responses carry an ETag and
+Last-Modified and answer conditional requests with 304.
+"""
+import argparse
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+import zlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.common import FIXTURE_DIR
+from benchmarks.fixtures.generate import NOW
+
+OWM_TIME_FIELDS = ("dt", "sunrise", "sunset")
+
+
+class Latency:
+    """Response delay distribution, parsed from a spec string (milliseconds)
+
+    "0"                 no delay
+    "50"                fixed 50 ms
+    "20-200"            uniform between 20 and 200 ms
+    "lognormal:80:0.6"  log-normal with median 80 ms and sigma 0.6 (long tail)
+    """
+
+    def __init__(self, spec="0"):
+        self.spec = spec
+        self._sample = self._parse(spec)
+
+    def _parse(self, spec):
+        spec = str(spec).strip()
+        if spec.startswith("lognormal:"):
+            _, median, sigma = spec.split(":")
+            mu = math.log(float(median))
+            return lambda rng: rng.lognormvariate(mu, float(sigma))
+        if "-" in spec:
+            low, high = (float(part) for part in spec.split("-", 1))
+            return lambda rng: rng.uniform(low, high)
+        fixed = float(spec)
+        return lambda rng: fixed
+
+    def sample(self, rng):
+        """Delay in seconds"""
+        return max(0.0, self._sample(rng)) / 1000
+
+
+class Faults:
+    """What to do to responses: delay, fail, throttle, or drip slowly"""
+
+    def __init__(self, latency="0", error_rate=0.0, rate_429=0.0, retry_after=1,
+                 drip_rate=0.0, drip_chunk=256, drip_interval=20, seed=None):
+        self.latency = Latency(latency)
+        self.error_rate = error_rate
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.drip_rate = drip_rate
+        self.drip_chunk = drip_chunk
+        self.drip_interval = drip_interval / 1000
+        self.rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def roll(self):
+        """(delay, fault) for one request; fault is None, "error", "429" or "drip" """
+        with self._lock:
+            delay = self.latency.sample(self.rng)
+            r = self.rng.random()
+        if r < self.error_rate:
+            return delay, "error"
+        if r < self.error_rate + self.rate_429:
+            return delay, "429"
+        if r < self.error_rate + self.rate_429 + self.drip_rate:
+            return delay, "drip"
+        return delay, None
+
+
+class Fixtures:
+    """Generated OWM payloads and RSS feeds, with timestamps moved to the present"""
+
+    def __init__(self, shift=True):
+        self.shift = int(time.time()) - NOW if shift else 0
+        self.weather = {}
+        self.forecast = {}
+        self.by_id = {}
+        self.feeds = {}
+
+        owm_dir = os.path.join(FIXTURE_DIR, "owm")
+        for name in sorted(os.listdir(owm_dir)):
+            kind, _, rest = name.partition("_")
+            with open(os.path.join(owm_dir, name), 'r') as f:
+                payload = self._shift_owm(json.load(f))
+            city = payload["name"] if kind == "weather" else payload["city"]["name"]
+            getattr(self, kind)[city.lower()] = payload
+            if kind == "weather":
+                self.by_id[payload["id"]] = city.lower()
+
+        news_dir = os.path.join(FIXTURE_DIR, "news")
+        for name in sorted(os.listdir(news_dir)):
+            with open(os.path.join(news_dir, name), 'r', encoding="utf-8") as f:
+                feed = f.read()
+            city = name[len("rss_"):-len(".xml")].replace("_", " ")
+            self.feeds[city] = self._split_feed(self._shift_rss(feed))
+
+    def _shift_owm(self, value):
+        if isinstance(value, dict):
+            shifted = {}
+            for key, item in value.items():
+                if key in OWM_TIME_FIELDS and isinstance(item, int):
+                    shifted[key] = item + self.shift
+                else:
+                    shifted[key] = self._shift_owm(item)
+            if "dt_txt" in shifted:
+                shifted["dt_txt"] = datetime.fromtimestamp(shifted["dt"], tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+            return shifted
+        if isinstance(value, list):
+            return [self._shift_owm(item) for item in value]
+        return value
+
+    def _shift_rss(self, feed):
+        def shift(match):
+            published = parsedate_to_datetime(match.group(1)).timestamp() + self.shift
+            return f"<pubDate>{format_datetime(datetime.fromtimestamp(published, tz=timezone.utc), usegmt=True)}</pubDate>"
+        return re.sub(r"<pubDate>(.*?)</pubDate>", shift, feed)
+
+    def _split_feed(self, feed):
+        """(head, [item, ...], tail) so a feed can be served in slices"""
+        first = feed.index("<item>")
+        last = feed.rindex("</item>") + len("</item>")
+        items = re.findall(r"<item>.*?</item>", feed[first:last], re.S)
+        return feed[:first], items, feed[last:]
+
+    def city_for(self, params):
+        """Fixture city named by an OWM q= or id= parameter"""
+        if "id" in params:
+            try:
+                return self.by_id.get(int(params["id"]))
+            except ValueError:
+                return None
+        # "London,GB" style queries
+        return params.get("q", "").split(",")[0].strip().lower() or None
+
+    def rss(self, query):
+        """A feed for the city in a Google News query; different queries overlap"""
+        query = query.lower()
+        city = next((name for name in self.feeds if name in query), None)
+        if city is None:
+            return None
+        head, items, tail = self.feeds[city]
+        variant = zlib.crc32(query.encode()) % 4
+        chosen = [item for i, item in enumerate(items) if i % 4 != variant]
+        return head + "\n".join(chosen) + tail
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    server_version = "WeatherlyStandin/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        route = url.path.rstrip("/")
+        self.server.count(route)
+
+        delay, fault = self.server.faults.roll()
+        if delay:
+            time.sleep(delay)
+
+        if fault == "error":
+            self.server.count("fault:error")
+            return self.send_json(self.server.faults.rng.choice((500, 502, 503)), {"cod": 502, "message": "Bad gateway"})
+        if fault == "429":
+            self.server.count("fault:429")
+            return self.send_json(429, {"cod": 429, "message": "Your account is temporary blocked due to exceeding of requests limitation"},
+                                  headers={"Retry-After": str(self.server.faults.retry_after)})
+
+        status, body, content_type = self.route(route, params)
+        headers = {}
+        if route == "/rss/search" and status == 200:
+            # Feeds don't change while the server runs, so validators always match
+            headers = {"ETag": f'"{zlib.crc32(body.encode()):08x}"', "Last-Modified": self.server.started}
+            if self.headers.get("If-None-Match") == headers["ETag"] or (
+                    "If-None-Match" not in self.headers and self.headers.get("If-Modified-Since") == headers["Last-Modified"]):
+                self.server.count("not_modified")
+                return self.send_body(304, "", content_type, headers=headers)
+        self.send_body(status, body, content_type, headers=headers, drip=fault == "drip")
+
+    def route(self, route, params):
+        fixtures = self.server.fixtures
+        if route in ("/data/2.5/weather", "/data/2.5/forecast"):
+            kind = route.rsplit("/", 1)[-1]
+            payload = getattr(fixtures, kind).get(fixtures.city_for(params))
+            if payload is None:
+                return 404, json.dumps({"cod": "404", "message": "city not found"}), "application/json"
+            return 200, json.dumps(payload), "application/json"
+
+        if route == "/data/2.5/group":
+            entries = []
+            for city_id in params.get("id", "").split(","):
+                city = fixtures.city_for({"id": city_id})
+                if city in fixtures.weather:
+                    entry = dict(fixtures.weather[city])
+                    # Group entries carry the UTC offset under "sys"
+                    entry["sys"] = dict(entry["sys"], timezone=entry.pop("timezone"))
+                    entries.append(entry)
+            return 200, json.dumps({"cnt": len(entries), "list": entries}), "application/json"
+
+        if route == "/rss/search":
+            feed = fixtures.rss(params.get("q", ""))
+            if feed is None:
+                feed = '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Google News</title></channel></rss>'
+            return 200, feed, "application/rss+xml; charset=utf-8"
+
+        return 404, json.dumps({"cod": "404", "message": "Internal error"}), "application/json"
+
+    def send_json(self, status, payload, headers=None):
+        self.send_body(status, json.dumps(payload), "application/json", headers=headers)
+
+    def send_body(self, status, body, content_type, headers=None, drip=False):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+        if not drip:
+            self.wfile.write(data)
+            return
+
+        # Slow-drip: the whole body arrives, a few bytes at a time
+        self.server.count("fault:drip")
+        faults = self.server.faults
+        try:
+            for start in range(0, len(data), faults.drip_chunk):
+                self.wfile.write(data[start:start + faults.drip_chunk])
+                self.wfile.flush()
+                time.sleep(faults.drip_interval)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up waiting, which is what drip is there to test
+            self.server.count("client_abort")
+            self.close_connection = True
+
+
+class StandinServer(ThreadingHTTPServer):
+    """Threaded HTTP server around the fixtures; usable from benchmarks"""
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, faults=None, verbose=False):
+        super().__init__((host, port), StandinHandler)
+        self.fixtures = Fixtures()
+        self.started = format_datetime(datetime.now(timezone.utc), usegmt=True)
+        self.faults = faults or Faults()
+        self.verbose = verbose
+        self.counts = {}
+        self._counts_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, name):
+        with self._counts_lock:
+            self.counts[name] = self.counts.get(name, 0) + 1
+
+    def stats(self):
+        with self._counts_lock:
+            return dict(self.counts)
+
+    def start(self):
+        """Serve on a background thread; returns self"""
+        self._thread = threading.Thread(target=self.serve_forever, name="standin-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", default="0", help='ms: "50", "20-200" or "lognormal:MEDIAN:SIGMA"')
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 5xx responses")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="fraction of 429 responses")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds on 429s")
+    parser.add_argument("--drip", default="256:20", help="slow-drip CHUNK_BYTES:INTERVAL_MS")
+    parser.add_argument("--drip-rate", type=float, default=0.0, help="fraction of slow-drip bodies")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    chunk, interval = (int(part) for part in args.drip.split(":"))
+    faults = Faults(args.latency, args.error_rate, args.rate_429, args.retry_after,
+                    args.drip_rate, chunk, interval, args.seed)
+    server = StandinServer(args.host, args.port, faults, verbose=args.verbose)
+    print(f"Stand-in server on {server.url} (latency {args.latency} ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Requests: {server.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import unittest
+
+from tools.api_errors import CircuitOpenError, InvalidKeyError
+from tools.circuit_breaker import CircuitBreaker
+from tools.weather_api import WeatherAPI
+
+
+def open_breaker(reset_timeout):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=reset_timeout)
+    breaker.record_failure()
+    breaker.record_failure()
+    return breaker
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        breaker.record_failure()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(breaker.times_opened, 1)
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_open_refuses_until_timeout(self):
+        breaker = open_breaker(reset_timeout=60)
+        self.assertFalse(breaker.allow())
+        self.assertEqual(breaker.rejected, 1)
+        self.assertGreater(breaker.retry_in(), 0)
+
+    def test_half_open_lets_one_trial_through(self):
+        breaker = open_breaker(reset_timeout=0)
+        self.assertTrue(breaker.allow())
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertFalse(breaker.allow())
+
+    def test_trial_success_closes(self):
+        breaker = open_breaker(reset_timeout=0)
+        breaker.allow()
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertTrue(breaker.allow())
+        self.assertTrue(breaker.allow())
+
+    def test_trial_failure_reopens(self):
+        breaker = open_breaker(reset_timeout=60)
+        breaker.reset_timeout = 0
+        breaker.allow()
+        breaker.reset_timeout = 60
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(breaker.times_opened, 2)
+        self.assertFalse(breaker.allow())
+
+    def test_released_trial_can_be_taken_again(self):
+        breaker = open_breaker(reset_timeout=0)
+        self.assertTrue(breaker.allow())
+        breaker.release_trial()
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(breaker.allow())
+
+
+class WeatherAPIBreakerTest(unittest.TestCase):
+    def setUp(self):
+        self.api = WeatherAPI(["key_one", "key_two"], api_host="http://127.0.0.1:9")
+        self.addCleanup(self.api.close)
+
+    def test_no_key_does_not_hold_half_open_trial(self):
+        for state in self.api.keys.keys:
+            self.api.keys.disable(state, InvalidKeyError("rejected", 401))
+        self.api.breaker = open_breaker(reset_timeout=0)
+
+        for _ in range(3):
+            with self.assertRaises(InvalidKeyError):
+                self.api._fetch(("weather", "london", "metric"), "weather", {"q": "London"})
+        self.assertEqual(self.api.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(self.api.breaker.allow())
+
+    def test_open_circuit_refuses_without_a_request(self):
+        self.api.breaker = open_breaker(reset_timeout=60)
+        with self.assertRaises(CircuitOpenError):
+            self.api._fetch(("weather", "london", "metric"), "weather", {"q": "London"})
+        self.assertEqual(sum(state.calls for state in self.api.keys.keys), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from tools.city_resolver import CityResolver
+
+
+def weather_entry(city_id, name):
+    return {"id": city_id, "name": name, "coord": {"lat": 1.0, "lon": 2.0},
+            "sys": {"country": "GB", "timezone": 3600}}
+
+
+class CityResolverTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.index_file = os.path.join(directory.name, "city_index.json")
+
+    def test_record_group_entry(self):
+        resolver = CityResolver(self.index_file)
+        entry = resolver.record("london ", weather_entry(2643743, "London"))
+        self.assertEqual(entry["country"], "GB")
+        self.assertEqual(entry["timezone"], 3600)
+        self.assertEqual(resolver.query_params("LONDON"), {"id": 2643743})
+
+    def test_concurrent_saves_leave_a_readable_index(self):
+        resolver = CityResolver(self.index_file)
+
+        def record(offset):
+            for i in range(50):
+                resolver.record(f"city {offset}-{i}", weather_entry(offset * 1000 + i + 1, f"City {offset}-{i}"))
+
+        threads = [threading.Thread(target=record, args=(offset,)) for offset in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with open(self.index_file) as f:
+            index = json.load(f)
+        self.assertEqual(len(index["cities"]), 200)
+        self.assertEqual(len(CityResolver(self.index_file).cities), 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
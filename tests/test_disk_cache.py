@@ -0,0 +1,49 @@
+import os
+import tempfile
+import time
+import unittest
+
+from tools.disk_cache import DiskCache
+
+
+class DiskCacheTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache.db")
+
+    def test_get_does_not_write(self):
+        cache = DiskCache(self.path)
+        self.addCleanup(cache.close)
+        cache.put("current", "London", "metric", {"temperature": 14})
+        changes = cache._conn.total_changes
+        self.assertEqual(cache.get("current", "london", "metric")[0], {"temperature": 14})
+        self.assertEqual(cache._conn.total_changes, changes)
+
+    def test_reads_count_for_eviction(self):
+        cache = DiskCache(self.path, max_entries=2)
+        self.addCleanup(cache.close)
+        cache.put("current", "London", "metric", {})
+        time.sleep(0.01)
+        cache.put("current", "Tokyo", "metric", {})
+        time.sleep(0.01)
+        cache.get("current", "London", "metric")
+        cache.put("current", "Sydney", "metric", {})
+        self.assertIsNotNone(cache.get("current", "London", "metric"))
+        self.assertIsNone(cache.get("current", "Tokyo", "metric"))
+
+    def test_access_times_saved_on_close(self):
+        cache = DiskCache(self.path)
+        cache.put("current", "London", "metric", {})
+        cache.get("current", "London", "metric")
+        accessed_at = cache._touched[("current", "london", "metric")]
+        cache.close()
+
+        reopened = DiskCache(self.path)
+        self.addCleanup(reopened.close)
+        row = reopened._conn.execute("SELECT accessed_at FROM entries").fetchone()
+        self.assertEqual(row[0], accessed_at)
+
+
+if __name__ == "__main__":
+    unittest.main()
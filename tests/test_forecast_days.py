@@ -0,0 +1,48 @@
+import json
+import os
+import time
+import unittest
+
+from benchmarks.common import fixture_paths
+from tools.forecast_columns import ColumnarForecast
+from tools.weather_api import WeatherAPI
+
+
+@unittest.skipUnless(hasattr(time, "tzset"), "needs time.tzset")
+class ForecastDaysTest(unittest.TestCase):
+    """The block view and the daily summary agree on days, whatever this machine's timezone"""
+
+    def setUp(self):
+        self.saved_tz = os.environ.get("TZ")
+        os.environ["TZ"] = "America/Los_Angeles"
+        time.tzset()
+        self.api = WeatherAPI("test", api_host="http://127.0.0.1:9")
+        self.addCleanup(self.api.close)
+
+    def tearDown(self):
+        if self.saved_tz is None:
+            os.environ.pop("TZ", None)
+        else:
+            os.environ["TZ"] = self.saved_tz
+        time.tzset()
+
+    def test_block_days_match_daily_summary(self):
+        for path in fixture_paths("owm", "forecast_"):
+            with open(path) as f:
+                payload = json.load(f)
+            blocks = self.api._parse_forecast(payload)["forecast"]
+            daily = ColumnarForecast.from_payload(payload).daily()
+            self.assertEqual(list(blocks), [day.date for day in daily], path)
+
+    def test_block_times_are_city_local(self):
+        for path in fixture_paths("owm", "forecast_tokyo"):
+            with open(path) as f:
+                payload = json.load(f)
+            item = payload["list"][0]
+            block = next(iter(self.api._parse_forecast(payload)["forecast"].values()))[0]
+            local = (item["dt"] + payload["city"]["timezone"]) % 86400
+            self.assertEqual(block.time, f"{local // 3600:02d}:{local % 3600 // 60:02d}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from tools.keyword_matcher import KeywordMatcher
+
+
+class KeywordMatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.matcher = KeywordMatcher()
+
+    def test_whole_words_only(self):
+        self.assertTrue(self.matcher.matches("Showers expected as the weather turns"))
+        self.assertFalse(self.matcher.matches("Brainstorming session on city budgets"))
+        self.assertFalse(self.matcher.matches("storm_chaser app update"))
+
+    def test_plurals(self):
+        self.assertTrue(self.matcher.matches("Storms lash the coast"))
+        self.assertFalse(self.matcher.matches("Weather shows on TV tonight"))
+
+    def test_punctuation_and_case(self):
+        self.assertTrue(self.matcher.matches("STORM-hit town rebuilds"))
+        self.assertTrue(self.matcher.matches("“Cyclone” nears the coast"))
+        self.assertTrue(self.matcher.matches("Météo: forecast for Paris"))
+
+    def test_phrases(self):
+        self.assertTrue(self.matcher.matches("Cold waves grip the north"))
+        self.assertTrue(self.matcher.matches("Rain\nalert issued"))
+        self.assertFalse(self.matcher.matches("Cold, wave goodbye"))
+        self.assertFalse(self.matcher.matches("A mystery novel set in a storm"))
+        self.assertFalse(self.matcher.matches("Set in stone: storm season plans"))
+
+    def test_blocked_wins(self):
+        matcher = KeywordMatcher(required=["storm", "set"], blocked=["Set"])
+        self.assertFalse(matcher.matches("Storm set to arrive"))
+        self.assertTrue(matcher.matches("Storm arrives"))
+
+    def test_signature_follows_lists(self):
+        self.assertEqual(self.matcher.signature, KeywordMatcher().signature)
+        self.assertNotEqual(self.matcher.signature, KeywordMatcher(blocked=["movie"]).signature)
+
+    def test_needs_a_required_keyword(self):
+        with self.assertRaises(ValueError):
+            KeywordMatcher(required=[" "])
+
+
+if __name__ == "__main__":
+    unittest.main()
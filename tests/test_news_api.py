@@ -0,0 +1,112 @@
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from tools.news_api import FeedTimeout, NewsWorker
+
+
+class DripBody:
+    """Raw body that hands out a few bytes per receive"""
+
+    def __init__(self, size, interval):
+        self.left = size
+        self.interval = interval
+
+    def read1(self, amt, decode_content=None):
+        if not self.left:
+            return b""
+        time.sleep(self.interval)
+        part = min(self.left, 64, amt)
+        self.left -= part
+        return b"x" * part
+
+
+class DripResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, size, interval):
+        self.raw = DripBody(size, interval)
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class DripSession:
+    def __init__(self, size, interval):
+        self.size = size
+        self.interval = interval
+
+    def get(self, url, **kwargs):
+        return DripResponse(self.size, self.interval)
+
+
+class FetchFeedTest(unittest.TestCase):
+    def test_slow_body_stops_at_feed_timeout(self):
+        worker = NewsWorker("London", session=DripSession(size=100000, interval=0.05), feed_timeout=0.3)
+        started_at = time.perf_counter()
+        with self.assertRaises(FeedTimeout):
+            worker.fetch_feed("http://feeds.test/rss")
+        self.assertLess(time.perf_counter() - started_at, 0.6)
+
+    def test_abandoned_download_stops(self):
+        worker = NewsWorker("London", session=DripSession(size=100000, interval=0.01), feed_timeout=30)
+        worker.abandoned.set()
+        with self.assertRaises(FeedTimeout):
+            worker.fetch_feed("http://feeds.test/rss")
+
+    def test_whole_body_is_returned(self):
+        worker = NewsWorker("London", session=DripSession(size=1000, interval=0), feed_timeout=5)
+        body, _ = worker.fetch_feed("http://feeds.test/rss")
+        self.assertEqual(len(body), 1000)
+
+    def test_timings_of_stragglers_stay_put(self):
+        worker = NewsWorker("London", session=DripSession(size=100000, interval=0.05),
+                            feed_timeout=30, deadline=0.2)
+        self.assertEqual(worker.fetch_feeds(worker.feed_urls()), [[], [], []])
+        timings = [dict(timing) for timing in worker.feed_timings]
+        time.sleep(0.2)
+        self.assertEqual(worker.feed_timings, timings)
+        self.assertTrue(all(timing["status"] == "timeout" for timing in timings))
+
+
+class FixedFeedsWorker(NewsWorker):
+    """Serves canned records; feeds earlier in rss_urls arrive later"""
+
+    def __init__(self, feed_count=3, per_feed=20):
+        super().__init__("London")
+        self.urls = [f"http://feeds.test/{index}" for index in range(feed_count)]
+        now = datetime.now()
+        self.records = {}
+        for index, url in enumerate(self.urls):
+            self.records[url] = [{
+                "title": f"t{index}x{i}",
+                # Unrelated words, so no two headlines count as one story
+                "item": {"title": f"a{index}x{i} b{index}y{i} c{index}z{i}", "source": f"Outlet {index}",
+                         "summary": "", "link": f"{url}/{i}", "published": "",
+                         "date": now - timedelta(minutes=index * per_feed + i)},
+            } for i in range(per_feed)]
+
+    def feed_urls(self):
+        return self.urls
+
+    def load_feed(self, rss_url):
+        time.sleep(0.05 * (len(self.urls) - self.urls.index(rss_url)))
+        return self.records[rss_url], "ok"
+
+
+class RunTest(unittest.TestCase):
+    def test_streaming_returns_the_same_list(self):
+        batches = []
+        streamed = FixedFeedsWorker().run(progress=batches.append)
+        fetched = FixedFeedsWorker().run()
+        self.assertEqual([item["link"] for item in streamed], [item["link"] for item in fetched])
+        self.assertGreater(len(batches), 1)
+        self.assertTrue({item["link"] for item in fetched} <= {item["link"] for batch in batches for item in batch})
+
+
+if __name__ == "__main__":
+    unittest.main()
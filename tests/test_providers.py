@@ -0,0 +1,73 @@
+import unittest
+
+from tools.api_errors import ServerError
+from tools.providers import HedgedProvider, StubProvider, WeatherProvider
+from tools.rate_limiter import BACKGROUND, FOREGROUND
+from tools.weather_api import WeatherAPI
+
+
+class WeatherProviderTest(unittest.TestCase):
+    def test_interface_cannot_be_instantiated(self):
+        with self.assertRaises(TypeError):
+            WeatherProvider()
+
+    def test_stub_is_stable_per_city(self):
+        stub = StubProvider()
+        first = stub.get_current_weather("London")
+        second = stub.get_current_weather("london")
+        self.assertEqual(first.temperature, second.temperature)
+        self.assertEqual(len(stub.get_daily_summary("London")["daily"]), 5)
+
+
+class HedgedProviderTest(unittest.TestCase):
+    def hedged(self, primary, secondary):
+        provider = HedgedProvider(primary, secondary)
+        self.addCleanup(provider.close)
+        return provider
+
+    def test_fast_primary_wins(self):
+        primary, secondary = StubProvider(), StubProvider()
+        provider = self.hedged(primary, secondary)
+        provider.get_current_weather("London", priority=FOREGROUND)
+        self.assertEqual(secondary.calls, 0)
+        self.assertEqual(provider.hedge_stats()["hedged"], 0)
+
+    def test_slow_primary_is_hedged(self):
+        primary = StubProvider(latency=0.5)
+        primary.record_latency(0.05)
+        secondary = StubProvider(current={"London": "secondary"})
+        provider = self.hedged(primary, secondary)
+        self.assertEqual(provider.get_current_weather("London", priority=FOREGROUND), "secondary")
+        self.assertEqual(provider.hedge_stats()["secondary_wins"], 1)
+
+    def test_outage_fails_over(self):
+        primary = StubProvider(fail_with=ServerError("down", 503))
+        secondary = StubProvider(current={"London": "secondary"})
+        provider = self.hedged(primary, secondary)
+        self.assertEqual(provider.get_current_weather("London", priority=FOREGROUND), "secondary")
+
+    def test_background_calls_are_not_hedged(self):
+        primary = StubProvider(fail_with=ServerError("down", 503))
+        secondary = StubProvider()
+        provider = self.hedged(primary, secondary)
+        with self.assertRaises(ServerError):
+            provider.get_current_weather("London", priority=BACKGROUND)
+        self.assertEqual(secondary.calls, 0)
+
+
+class OwnConnectionsTest(unittest.TestCase):
+    def test_copy_shares_budgets(self):
+        api = WeatherAPI(["key_one", "key_two"], api_host="http://127.0.0.1:9")
+        replica = api.with_own_connections()
+        self.addCleanup(api.close)
+        self.addCleanup(replica.close)
+        self.assertIs(replica.keys, api.keys)
+        self.assertIs(replica.limiter, api.limiter)
+        self.assertIs(replica.quota, api.quota)
+        self.assertIs(replica.breaker, api.breaker)
+        self.assertIsNot(replica.session, api.session)
+        self.assertIsNot(replica.flights, api.flights)
+
+
+if __name__ == "__main__":
+    unittest.main()
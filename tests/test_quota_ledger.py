@@ -0,0 +1,55 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from tools import quota_ledger
+from tools.quota_ledger import QuotaLedger
+
+
+class QuotaLedgerTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.ledger_file = os.path.join(directory.name, "api_usage.json")
+
+    def test_saves_survive_a_restart(self):
+        ledger = QuotaLedger(self.ledger_file)
+        ledger.record("weather", 3)
+        ledger.flush()
+        self.assertEqual(QuotaLedger(self.ledger_file).calls_today(), 3)
+        self.assertFalse(os.path.exists(f"{self.ledger_file}.tmp"))
+
+    def test_concurrent_saves_keep_the_latest_counts(self):
+        ledger = QuotaLedger(self.ledger_file)
+
+        def record():
+            for _ in range(100):
+                ledger.record("weather")
+
+        # Every record is due for a save
+        with mock.patch.object(quota_ledger, "SAVE_INTERVAL", 0):
+            threads = [threading.Thread(target=record) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        ledger.flush()
+
+        with open(self.ledger_file) as f:
+            self.assertEqual(json.load(f)["total"], 400)
+
+    def test_failed_save_stays_pending(self):
+        ledger = QuotaLedger(self.ledger_file)
+        ledger.record("weather")
+        with mock.patch("tools.quota_ledger.json.dump", side_effect=OSError("disk full")):
+            ledger.save_ledger()
+        self.assertTrue(ledger._dirty)
+        ledger.flush()
+        self.assertEqual(QuotaLedger(self.ledger_file).calls_today(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import threading
+import time
+import unittest
+
+from tools.rate_limiter import BACKGROUND, FOREGROUND, RateLimiter
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_no_window_exceeds_rate(self):
+        limiter = RateLimiter(rate=10, per=0.5)
+        granted_at = []
+        for _ in range(25):
+            limiter.acquire()
+            granted_at.append(time.monotonic())
+
+        for index, start in enumerate(granted_at):
+            in_window = [t for t in granted_at[index:] if t - start < limiter.per - 0.01]
+            self.assertLessEqual(len(in_window), limiter.rate)
+
+    def test_first_window_is_not_doubled(self):
+        limiter = RateLimiter(rate=10, per=1.0)
+        started_at = time.monotonic()
+        granted = 0
+        while time.monotonic() - started_at < 0.9:
+            if limiter.remaining() == 0:
+                break
+            limiter.acquire()
+            granted += 1
+        self.assertEqual(granted, 10)
+        self.assertEqual(limiter.stats()["remaining"], 0)
+
+    def test_foreground_goes_first(self):
+        limiter = RateLimiter(rate=1, per=0.2)
+        limiter.acquire()
+        order = []
+
+        def call(priority, name):
+            limiter.acquire(priority)
+            order.append(name)
+
+        background = threading.Thread(target=call, args=(BACKGROUND, "background"))
+        background.start()
+        time.sleep(0.05)
+        foreground = threading.Thread(target=call, args=(FOREGROUND, "foreground"))
+        foreground.start()
+        background.join()
+        foreground.join()
+        self.assertEqual(order, ["foreground", "background"])
+
+
+if __name__ == "__main__":
+    unittest.main()
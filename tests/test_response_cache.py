@@ -0,0 +1,33 @@
+import time
+import unittest
+
+from tools.response_cache import ResponseCache
+from tools.weather_api import WeatherAPI
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def test_is_fresh_counts_nothing(self):
+        cache = ResponseCache()
+        cache.put("london", {"temp": 14})
+        cache.put("paris", {"temp": 18}, expires_at=time.time() - 1)
+        self.assertTrue(cache.is_fresh("london"))
+        self.assertFalse(cache.is_fresh("paris"))
+        self.assertFalse(cache.is_fresh("tokyo"))
+        self.assertEqual((cache.hits, cache.misses, cache.expirations), (0, 0, 0))
+
+
+class FreshCurrentWeatherTest(unittest.TestCase):
+    def setUp(self):
+        self.api = WeatherAPI(["key_one"], api_host="http://127.0.0.1:9")
+        self.addCleanup(self.api.close)
+
+    def test_follows_the_in_memory_cache(self):
+        self.assertFalse(self.api.has_fresh_current_weather("London"))
+        key = self.api._cache_key("weather", self.api._location_params("London", "metric"))
+        self.api.cache.put(key, {"name": "London"})
+        self.assertTrue(self.api.has_fresh_current_weather("London"))
+        self.assertFalse(self.api.has_fresh_current_weather("London", units="imperial"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import time
+from email.utils import parsedate_to_datetime
+
+
+class WeatherAPIError(Exception):
+    """A failed OWM request, classified so callers can react to the cause
+
+    retryable: the same request may succeed if sent again later
+    is_outage: the failure says OWM itself is unhealthy (feeds the circuit breaker)
+    """
+    kind = "error"
+    retryable = False
+    is_outage = False
+
+    def __init__(self, message, status=None, retry_after=None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class CityNotFoundError(WeatherAPIError):
+    kind = "not_found"
+
+
+class InvalidKeyError(WeatherAPIError):
+    kind = "invalid_key"
+
+
+class RateLimitedError(WeatherAPIError):
+    kind = "rate_limited"
+    retryable = True
+
+
+class ServerError(WeatherAPIError):
+    kind = "server"
+    retryable = True
+    is_outage = True
+
+
+class RequestTimeoutError(WeatherAPIError):
+    kind = "timeout"
+    retryable = True
+    is_outage = True
+
+
+class ConnectionFailedError(WeatherAPIError):
+    kind = "connection"
+    retryable = True
+    is_outage = True
+
+
+class CircuitOpenError(WeatherAPIError):
+    """Raised without touching the network while the circuit breaker is open"""
+    kind = "circuit_open"
+    is_outage = True
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def error_for_response(response):
+    """Classified error for an HTTP error response from OWM"""
+    status = response.status_code
+    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+    try:
+        message = str(response.json().get("message", "")) or response.reason
+    except ValueError:
+        message = response.reason
+    message = (message or f"HTTP {status}").capitalize()
+
+    if status == 404:
+        return CityNotFoundError(message, status)
+    if status == 401:
+        return InvalidKeyError(message, status)
+    if status == 429:
+        return RateLimitedError(message, status, retry_after)
+    if status >= 500:
+        return ServerError(message, status, retry_after)
+    return WeatherAPIError(message, status)
@@ -0,0 +1,136 @@
+import time
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from tools.rate_limiter import FOREGROUND
+
+
+class CityBundle(QObject):
+    """Fetches current weather, forecast and news for one city as a unit
+
+    The three fetches run concurrently on the shared TaskExecutor and the
+    combined result is emitted once, so the right panel can repaint in a
+    single pass. If OWM has not resolved the city name yet, the current
+    weather call runs first and the forecast and news fetches reuse the
+    identity it resolved. Its weather calls are served ahead of sidebar
+    and background refreshes when the API budget runs short. News items
+    are also emitted in batches through news_batch as each feed arrives.
+    """
+    finished = pyqtSignal(dict)
+    news_batch = pyqtSignal(list)
+
+    STAGES = ("current", "forecast", "news")
+
+    def __init__(self, executor, weather_api, news_api, city):
+        super().__init__()
+        self.executor = executor
+        self.weather_api = weather_api
+        self.news_api = news_api
+        self.city = city
+
+        self.tasks = []
+        self.is_cancelled = False
+        self.result = {
+            "city": city,
+            "current": None,
+            "forecast": None,
+            "news": None,
+            "errors": {},
+            "timings": {},
+        }
+        self._pending = set(self.STAGES)
+        self._started_at = None
+
+    def start(self):
+        self._started_at = time.perf_counter()
+
+        resolved = self.weather_api.resolve_city(self.city)
+        if resolved:
+            self._start_stage("current", self._fetch_current)
+            self._start_dependent_stages(resolved["name"])
+        else:
+            self._start_stage("current", self._fetch_current, on_done=self._on_resolved)
+        return self
+
+    def cancel(self):
+        """Cancel every stage that has not finished yet"""
+        self.is_cancelled = True
+        for task in self.tasks:
+            task.cancel()
+
+    # ---------------------------
+    # Stages
+    # ---------------------------
+    def _start_dependent_stages(self, query):
+        self._start_stage("forecast", self._fetch_forecast)
+        self._start_news(query)
+
+    def _on_resolved(self):
+        if self.is_cancelled:
+            return
+
+        resolved = self.weather_api.resolve_city(self.city)
+        if resolved:
+            self._start_dependent_stages(resolved["name"])
+            return
+        if self.result["current"]:
+            # Answered by a provider that doesn't feed the OWM index
+            self._start_dependent_stages(self.city)
+            return
+
+        # The city didn't resolve; a forecast call would fail the same way
+        self._complete("forecast", time.perf_counter(), error=self.result["errors"].get("current"))
+        self._start_news(self.city)
+
+    def _start_stage(self, stage, fn, on_done=None):
+        started_at = time.perf_counter()
+
+        def finished(data):
+            self._complete(stage, started_at, data=data)
+            if on_done:
+                on_done()
+
+        def failed(error):
+            self._complete(stage, started_at, error=error)
+            if on_done:
+                on_done()
+
+        self.tasks.append(self.executor.submit(fn, on_finished=finished, on_error=failed))
+
+    def _start_news(self, query):
+        started_at = time.perf_counter()
+        self.tasks.append(self.news_api.get_weather_news(
+            query,
+            lambda items: self._complete("news", started_at, data=items),
+            lambda error: self._complete("news", started_at, error=error),
+            self._on_news_batch
+        ))
+
+    def _on_news_batch(self, items):
+        if not self.is_cancelled:
+            self.news_batch.emit(items)
+
+    def _fetch_current(self):
+        data = self.weather_api.get_current_weather(self.city, priority=FOREGROUND)
+        if not data:
+            raise RuntimeError(f"Could not fetch weather for {self.city}")
+        return data
+
+    def _fetch_forecast(self):
+        data = self.weather_api.get_daily_summary(self.city, priority=FOREGROUND)
+        if not data:
+            raise RuntimeError(f"Could not fetch weather for {self.city}")
+        return data
+
+    def _complete(self, stage, started_at, data=None, error=None):
+        now = time.perf_counter()
+        self.result["timings"][stage] = (now - started_at) * 1000
+        if error is not None:
+            self.result["errors"][stage] = error
+        else:
+            self.result[stage] = data
+
+        self._pending.discard(stage)
+        if not self._pending and not self.is_cancelled:
+            self.result["timings"]["total"] = (now - self._started_at) * 1000
+            self.finished.emit(self.result)
@@ -0,0 +1,117 @@
+import json
+import os
+import threading
+
+
+class CityResolver:
+    """Persistent index mapping user-typed city names to OWM city identities
+
+    Every name that has been resolved once ("Bangalore", "bengaluru ") is
+    stored as an alias of the canonical OWM city ID, together with the
+    coordinates, country and UTC offset OWM returned for it. Requests can
+    then go out by ID instead of making OWM geocode the raw text again.
+    """
+
+    def __init__(self, index_file="city_index.json"):
+        self.index_file = index_file
+        self._lock = threading.Lock()
+        # Serializes writers, so the file always holds the latest snapshot
+        self._save_lock = threading.Lock()
+        self.aliases = {}
+        self.cities = {}
+        self.load_index()
+
+    @staticmethod
+    def normalize(name):
+        """Case- and whitespace-insensitive form of a city name"""
+        return " ".join(str(name).split()).lower()
+
+    def load_index(self):
+        """Load the resolution index from JSON file"""
+        if not self.index_file or not os.path.exists(self.index_file):
+            return
+        try:
+            with open(self.index_file, 'r') as f:
+                index = json.load(f)
+            self.aliases = index.get("aliases", {})
+            # JSON object keys are strings, OWM IDs are ints
+            self.cities = {int(city_id): city for city_id, city in index.get("cities", {}).items()}
+        except Exception as e:
+            print(f"Error loading city index: {e}")
+
+    def save_index(self):
+        """Save the resolution index to JSON file"""
+        if not self.index_file:
+            return
+        try:
+            with self._save_lock:
+                with self._lock:
+                    index = {"aliases": dict(self.aliases), "cities": dict(self.cities)}
+                # Write a temporary file and swap it in, so readers never see half an index
+                temp_file = f"{self.index_file}.tmp"
+                with open(temp_file, 'w') as f:
+                    json.dump(index, f, indent=2)
+                os.replace(temp_file, self.index_file)
+        except Exception as e:
+            print(f"Error saving city index: {e}")
+
+    def lookup(self, name):
+        """Return the canonical city record for name, or None if unresolved"""
+        with self._lock:
+            city_id = self.aliases.get(self.normalize(name))
+            return self.cities.get(city_id) if city_id is not None else None
+
+    def lookup_id(self, name):
+        with self._lock:
+            return self.aliases.get(self.normalize(name))
+
+    def query_params(self, name):
+        """Location parameters for an OWM request: by ID once resolved"""
+        city_id = self.lookup_id(name)
+        if city_id is not None:
+            return {"id": city_id}
+        return {"q": name}
+
+    def record(self, name, data):
+        """Remember the identity OWM returned for name
+
+        Accepts a 'weather' payload (or group entry) or a 'forecast' payload,
+        whose city block carries the same fields under different keys.
+        """
+        city = data["city"] if isinstance(data.get("city"), dict) else data
+        city_id = city.get("id")
+        if not city_id:
+            return None
+
+        coord = city.get("coord", {})
+        sys_block = city.get("sys", {})
+        entry = {
+            "id": city_id,
+            "name": city.get("name", name),
+            "lat": coord.get("lat"),
+            "lon": coord.get("lon"),
+            "country": city.get("country", sys_block.get("country")),
+            "timezone": city.get("timezone", sys_block.get("timezone")),
+        }
+
+        alias = self.normalize(name)
+        with self._lock:
+            changed = self.aliases.get(alias) != city_id or self.cities.get(city_id) != entry
+            self.aliases[alias] = city_id
+            self.aliases.setdefault(self.normalize(entry["name"]), city_id)
+            self.cities[city_id] = entry
+
+        if changed:
+            self.save_index()
+        return entry
+
+    def learn_id(self, name, city_id):
+        """Record an alias for an ID known from elsewhere (e.g. the disk cache)"""
+        if not city_id:
+            return
+        with self._lock:
+            if self.aliases.get(self.normalize(name)) == city_id:
+                return
+            self.aliases[self.normalize(name)] = city_id
+            self.cities.setdefault(city_id, {"id": city_id, "name": name})
+        self.save_index()
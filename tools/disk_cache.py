@@ -0,0 +1,136 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+class DiskCache:
+    """SQLite-backed cache of normalized weather results
+
+    Entries are never treated as expired here: callers render them straight
+    away on startup and revalidate in the background. Size is bounded by
+    entry count and total payload bytes, evicting least recently used rows.
+    Reads never write: access times are kept in memory and saved with the
+    next put (before anything is evicted) or on close.
+    """
+
+    def __init__(self, path="weather_cache.db", max_entries=500, max_bytes=5 * 1024 * 1024):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # {key: accessed_at} for reads not yet written to the database
+        self._touched = {}
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                kind TEXT NOT NULL,
+                city TEXT NOT NULL,
+                units TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (kind, city, units)
+            )
+        """)
+        self._conn.commit()
+
+    def _key(self, kind, city, units):
+        return (kind, str(city).strip().lower(), units or "")
+
+    def get(self, kind, city, units="metric"):
+        """Return (data, stored_at) for the entry, or None if not cached"""
+        key = self._key(kind, city, units)
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload, stored_at FROM entries WHERE kind = ? AND city = ? AND units = ?",
+                    key
+                ).fetchone()
+                if row is None:
+                    return None
+                self._touched[key] = time.time()
+            return json.loads(row[0]), row[1]
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Disk cache read error: {e}")
+            return None
+
+    def put(self, kind, city, units, data):
+        """Store a normalized result and evict old entries if over the limits"""
+        try:
+            payload = json.dumps(data)
+        except (TypeError, ValueError) as e:
+            print(f"Disk cache cannot store {kind} for {city}: {e}")
+            return
+
+        now = time.time()
+        try:
+            with self._lock:
+                self._write_touched()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (*self._key(kind, city, units), payload, len(payload), now, now)
+                )
+                self._evict()
+                self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"Disk cache write error: {e}")
+
+    def _write_touched(self):
+        """Save the access times of reads since the last write (lock held)"""
+        if not self._touched:
+            return
+        self._conn.executemany(
+            "UPDATE entries SET accessed_at = ? WHERE kind = ? AND city = ? AND units = ?",
+            [(accessed_at, *key) for key, accessed_at in self._touched.items()]
+        )
+        self._touched.clear()
+
+    def _evict(self):
+        """Drop least recently used rows until both limits hold (lock held)"""
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute("SELECT kind, city, units, size FROM entries ORDER BY accessed_at ASC").fetchall()
+        for kind, city, units, size in rows:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            self._conn.execute(
+                "DELETE FROM entries WHERE kind = ? AND city = ? AND units = ?",
+                (kind, city, units)
+            )
+            count -= 1
+            total -= size
+
+    def clear(self):
+        with self._lock:
+            self._touched.clear()
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def stats(self):
+        """Entry count, payload bytes and on-disk file size"""
+        with self._lock:
+            count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+
+        file_size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        return {
+            "entries": count,
+            "payload_bytes": total,
+            "file_bytes": file_size,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+    def close(self):
+        with self._lock:
+            try:
+                self._write_touched()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"Disk cache write error: {e}")
+            self._conn.close()
@@ -0,0 +1,120 @@
+from array import array
+from datetime import datetime, timezone
+
+from tools.weather_records import DailySummary, intern_text
+
+SECONDS_PER_DAY = 86400
+
+
+class ColumnarForecast:
+    """5-day / 3-hour forecast stored as parallel typed arrays
+
+    One pass over the OWM payload fills one array per field instead of
+    building a 16-key dict per block. Days are bucketed by the city's own
+    UTC offset, so "Tuesday" means Tuesday where the city is rather than
+    where this machine is. Conditions are stored once in a small table and
+    referenced by index.
+    """
+
+    __slots__ = (
+        "city", "country", "tz_offset",
+        "timestamps", "temps", "humidity", "wind_speed", "pop", "conditions",
+        "condition_table", "days",
+    )
+
+    def __init__(self, city, country, tz_offset):
+        self.city = city
+        self.country = country
+        self.tz_offset = tz_offset
+
+        self.timestamps = array("q")
+        self.temps = array("d")
+        self.humidity = array("d")
+        self.wind_speed = array("d")
+        self.pop = array("d")
+        self.conditions = array("H")
+
+        # (description, icon, id) per distinct condition
+        self.condition_table = []
+        # (local day number, start index, end index) per calendar day
+        self.days = []
+
+    @classmethod
+    def from_payload(cls, data):
+        """Parse a 'forecast' payload in a single pass"""
+        city = data["city"]
+        tz_offset = city.get("timezone", 0)
+        forecast = cls(city["name"], city["country"], tz_offset)
+
+        timestamps = forecast.timestamps
+        temps = forecast.temps
+        humidity = forecast.humidity
+        wind_speed = forecast.wind_speed
+        pop = forecast.pop
+        conditions = forecast.conditions
+        table = forecast.condition_table
+        table_index = {}
+        days = forecast.days
+
+        current_day = None
+        day_start = 0
+        for i, item in enumerate(data["list"]):
+            ts = item["dt"]
+            main = item["main"]
+            w = item["weather"][0]
+
+            timestamps.append(ts)
+            temps.append(main["temp"])
+            humidity.append(main["humidity"])
+            wind_speed.append(item["wind"]["speed"])
+            pop.append(item.get("pop", 0) * 100)
+
+            condition = (intern_text(w["description"]), intern_text(w["icon"]), w["id"])
+            index = table_index.get(condition)
+            if index is None:
+                index = table_index[condition] = len(table)
+                table.append(condition)
+            conditions.append(index)
+
+            # Blocks arrive in time order, so a day is a contiguous run
+            day = (ts + tz_offset) // SECONDS_PER_DAY
+            if day != current_day:
+                if current_day is not None:
+                    days.append((current_day, day_start, i))
+                current_day = day
+                day_start = i
+
+        if current_day is not None:
+            days.append((current_day, day_start, len(timestamps)))
+
+        return forecast
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def local_date(self, day):
+        return datetime.fromtimestamp(day * SECONDS_PER_DAY, tz=timezone.utc)
+
+    def daily(self):
+        """Per-day min/max/avg computed with C-level reductions on array slices"""
+        summaries = []
+        for day, start, end in self.days:
+            temps = self.temps[start:end]
+            count = end - start
+            description, icon, condition_id = self.condition_table[self.conditions[start + count // 2]]
+            date = self.local_date(day)
+
+            summaries.append(DailySummary(
+                date=date.strftime("%Y-%m-%d"),
+                day_name=date.strftime("%A"),
+                temp_min=min(temps),
+                temp_max=max(temps),
+                temp_avg=sum(temps) / count,
+                description=description,
+                icon=icon,
+                id=condition_id,
+                humidity=sum(self.humidity[start:end]) / count,
+                wind_speed=sum(self.wind_speed[start:end]) / count,
+                pop_max=max(self.pop[start:end]),
+            ))
+        return summaries
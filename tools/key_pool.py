@@ -0,0 +1,139 @@
+import threading
+import time
+import zlib
+
+# How long a key sits out after OWM rejects it. New OWM keys can take
+# up to a couple of hours to activate, so a 401 is not treated as final.
+INVALID_KEY_COOLDOWN = 3600
+RATE_LIMITED_COOLDOWN = 60
+
+
+class ApiKeyState:
+    """Usage and health of one API key"""
+
+    def __init__(self, key, onecall=False):
+        self.key = key
+        self.label = f"…{key[-4:]}"
+        # Key has a One Call subscription
+        self.onecall = onecall
+        self.calls = 0
+        self.minute = None
+        self.minute_calls = 0
+        self.disabled_until = 0.0
+        self.last_error = None
+
+    def is_active(self, now):
+        return now >= self.disabled_until
+
+
+class KeyPool:
+    """Routes OWM requests across several API keys
+
+    "least_used" sends each request to the key with the fewest calls this
+    minute. "shard" pins each city to one key by rendezvous hashing, so a
+    city keeps its key when another key drops out, and spills over to the
+    least used key once its own key has spent its per-minute budget.
+    Keys that OWM answers with 401/429 are taken out of rotation for a
+    cool-down period.
+
+    A key written as "KEY:onecall" is also used for One Call requests.
+    """
+
+    STRATEGIES = ("least_used", "shard")
+
+    def __init__(self, keys, strategy="least_used", per_key_rate=60):
+        # {key: One Call enabled}, in the order given
+        parsed = {}
+        for entry in keys:
+            key, _, mode = entry.strip().partition(":")
+            if key:
+                parsed[key] = parsed.get(key, False) or mode.strip().lower() == "onecall"
+        if not parsed:
+            raise ValueError("KeyPool needs at least one API key")
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown key routing strategy: {strategy}")
+
+        self.keys = [ApiKeyState(key, onecall=onecall) for key, onecall in parsed.items()]
+        self.strategy = strategy
+        self.per_key_rate = per_key_rate
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _minute_calls(self, state, minute):
+        return state.minute_calls if state.minute == minute else 0
+
+    def _shard_owner(self, active, shard):
+        return max(active, key=lambda state: zlib.crc32(f"{state.key}:{shard}".encode()))
+
+    def acquire(self, shard=None, onecall=False):
+        """Pick a key for one request and count the call against it; None if all are out"""
+        now = time.time()
+        minute = int(now // 60)
+        with self._lock:
+            active = [state for state in self.keys if state.is_active(now) and (state.onecall or not onecall)]
+            if not active:
+                return None
+
+            state = None
+            if self.strategy == "shard" and shard is not None:
+                owner = self._shard_owner(active, shard)
+                if self._minute_calls(owner, minute) < self.per_key_rate:
+                    state = owner
+            if state is None:
+                state = min(active, key=lambda s: (self._minute_calls(s, minute), s.calls))
+
+            if state.minute != minute:
+                state.minute = minute
+                state.minute_calls = 0
+            state.minute_calls += 1
+            state.calls += 1
+            return state
+
+    def disable(self, state, error):
+        """Take a key out of rotation after OWM rejected it"""
+        cooldown = error.retry_after if error.retry_after else RATE_LIMITED_COOLDOWN
+        if error.kind == "invalid_key":
+            cooldown = INVALID_KEY_COOLDOWN
+        with self._lock:
+            state.disabled_until = time.time() + cooldown
+            state.last_error = error.kind
+        print(f"API key {state.label} out of rotation for {cooldown:.0f} s ({error.kind})")
+
+    def revoke_onecall(self, state):
+        """Stop using a key for One Call after OWM refused it there"""
+        with self._lock:
+            state.onecall = False
+        print(f"API key {state.label} has no One Call access; using the classic endpoints")
+
+    def has_onecall(self):
+        """Whether any key in rotation can make One Call requests"""
+        now = time.time()
+        with self._lock:
+            return any(state.onecall and state.is_active(now) for state in self.keys)
+
+    def active_count(self):
+        now = time.time()
+        with self._lock:
+            return sum(1 for state in self.keys if state.is_active(now))
+
+    def retry_in(self):
+        """Seconds until the next disabled key comes back"""
+        now = time.time()
+        with self._lock:
+            return max(0.0, min(state.disabled_until for state in self.keys) - now)
+
+    def stats(self):
+        now = time.time()
+        minute = int(now // 60)
+        with self._lock:
+            return [{
+                "label": state.label,
+                "active": state.is_active(now),
+                "onecall": state.onecall,
+                "calls": state.calls,
+                "calls_this_minute": self._minute_calls(state, minute),
+                "disabled_for": max(0.0, state.disabled_until - now),
+                "last_error": state.last_error,
+            } for state in self.keys]
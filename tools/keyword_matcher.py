@@ -0,0 +1,102 @@
+import re
+import zlib
+
+# Strong weather keywords (an article must contain at least one)
+WEATHER_KEYWORDS = [
+    "weather", "forecast", "temperature", "rainfall",
+    "storm", "cyclone", "hurricane", "tornado",
+    "heatwave", "cold wave", "imd", "met office",
+    "snowfall", "thunderstorm", "rain alert"
+]
+
+# Blocklist for irrelevant content
+BLOCKED_KEYWORDS = [
+    "book", "novel", "review", "movie", "show",
+    "series", "trailer", "podcast", "author",
+    "set in", "mystery", "crime", "celebrity",
+    "music", "sports", "match", "fashion"
+]
+
+
+_WORD = re.compile(r"\w+")
+
+# ASCII byte table for splitting like \w+: letters lowercased, digits and
+# "_" kept, everything else a space
+_ASCII_WORDS = bytes(
+    ord(char.lower()) if char.isalnum() or char == "_" else ord(" ")
+    for char in map(chr, range(128))
+) + bytes(range(128, 256))
+
+
+def _words(text):
+    """Lowercase words of text, as \w+ would find them"""
+    if text.isascii():
+        # Same words as the regex, several times faster
+        return text.encode().translate(_ASCII_WORDS).decode().split()
+    return _WORD.findall(text.lower())
+
+
+def _forms(word):
+    """word with its plural "s" and "es" endings"""
+    return (word, word + "s", word + "es")
+
+
+class KeywordMatcher:
+    """Word-boundary keyword filter for news articles
+
+    The text is split into words once and matched against a set of all
+    single-word keywords with their plural "s"/"es" forms, so "storm"
+    matches "storms" but "show" does not match "showers". Phrases such
+    as "cold wave" are only searched for (with their own small regex)
+    when their first word is among the text's words. An article is
+    relevant if it names a required keyword and no blocked keyword.
+    """
+
+    def __init__(self, required=None, blocked=None):
+        self.required = self._normalize(WEATHER_KEYWORDS if required is None else required)
+        self.blocked = self._normalize(BLOCKED_KEYWORDS if blocked is None else blocked)
+        if not self.required:
+            raise ValueError("KeywordMatcher needs at least one required keyword")
+
+        # A keyword on both lists counts as blocked
+        required = [word for word in self.required if word not in self.blocked]
+        self._required_words, self._required_phrases = self._compile(required)
+        self._blocked_words, self._blocked_phrases = self._compile(self.blocked)
+        # Every word that can start a match; most articles share none with it
+        self._lookup = self._required_words | self._blocked_words | frozenset(
+            first for first, _ in self._required_phrases + self._blocked_phrases
+        )
+        # Identifies the lists, so results filtered with other lists aren't reused
+        lists = "\n".join(["\t".join(required), "\t".join(self.blocked)])
+        self.signature = f"{zlib.crc32(lists.encode()):08x}"
+
+    @staticmethod
+    def _normalize(words):
+        return sorted({" ".join(str(word).lower().split()) for word in words if str(word).strip()})
+
+    @staticmethod
+    def _compile(keywords):
+        """(frozenset of single words and their plurals, [(first word, phrase regex)])"""
+        words = set()
+        phrases = []
+        for keyword in keywords:
+            if " " in keyword:
+                parts = keyword.split()
+                pattern = r"\b" + r"\s+".join(map(re.escape, parts)) + r"(?:e?s)?\b"
+                phrases.append((parts[0], re.compile(pattern, re.IGNORECASE)))
+            else:
+                words.update(_forms(keyword))
+        return frozenset(words), phrases
+
+    @staticmethod
+    def _has_phrase(phrases, hits, text):
+        return any(first in hits and pattern.search(text) for first, pattern in phrases)
+
+    def matches(self, text):
+        """True if text names a required keyword and no blocked one"""
+        hits = self._lookup.intersection(_words(text))
+        if not hits:
+            return False
+        if not self._blocked_words.isdisjoint(hits) or self._has_phrase(self._blocked_phrases, hits, text):
+            return False
+        return not self._required_words.isdisjoint(hits) or self._has_phrase(self._required_phrases, hits, text)
@@ -1,43 +1,46 @@
 import feedparser
-from PyQt5.QtCore import QThread, pyqtSignal
+import requests
+import threading
+import time
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
 from urllib.parse import quote_plus
 from datetime import datetime, timedelta
-import re
 
+from tools.keyword_matcher import KeywordMatcher
+from tools.news_cache import NewsCache
+from tools.rss_parser import UnknownFeed, parse_rss, strip_tags
+from tools.story_index import StoryIndex, headline
 
-class NewsWorker(QThread):
-    """Background thread for fetching news"""
-    finished = pyqtSignal(list)
-    error = pyqtSignal(str)
+DEFAULT_NEWS_HOST = "https://news.google.com"
 
-    def is_weather_article(self, title, summary):
-        """Return True only if the article is genuinely weather-related."""
+# A feed that hasn't fully arrived after FEED_TIMEOUT seconds is dropped;
+# after NEWS_DEADLINE seconds the news section uses whatever feeds are in
+FEED_TIMEOUT = 6
+NEWS_DEADLINE = 8
+FEED_CONNECT_TIMEOUT = 3.05
+# Most bytes taken per read; each read returns with whatever one receive
+# brought, so the deadline is checked while a slow body trickles in
+FEED_CHUNK_SIZE = 16384
 
-        text = f"{title} {summary}".lower()
+# Distinct stories checked per city, and items kept
+ENTRY_WINDOW = 40
+MAX_NEWS_ITEMS = 15
 
-        # Strong weather keywords (must contain at least one)
-        must_have = [
-            "weather", "forecast", "temperature", "rainfall",
-            "storm", "cyclone", "hurricane", "tornado",
-            "heatwave", "cold wave", "imd", "met office",
-            "snowfall", "thunderstorm", "rain alert"
-        ]
 
-        if not any(word in text for word in must_have):
-            return False
+class FeedTimeout(Exception):
+    """A feed body took longer than its deadline"""
 
-        # Blocklist for irrelevant content
-        blocklist = [
-            "book", "novel", "review", "movie", "show",
-            "series", "trailer", "podcast", "author",
-            "set in", "mystery", "crime", "celebrity",
-            "music", "sports", "match", "fashion"
-        ]
 
-        if any(word in text for word in blocklist):
-            return False
+class NewsWorker:
+    """News fetch task, run on the shared TaskExecutor"""
+
+    # Relevance filter shared by all workers unless one is passed in
+    matcher = KeywordMatcher()
 
-        return True
+    def is_weather_article(self, title, summary):
+        """Return True only if the article is genuinely weather-related."""
+        return self.matcher.matches(f"{title} {summary}")
     
     def time_ago(self, dt):
         """Convert datetime to 'time-ago' text."""
@@ -70,110 +73,324 @@ class NewsWorker(QThread):
 
 
     
-    def __init__(self, city):
-        super().__init__()
+    def __init__(self, city, base_url=DEFAULT_NEWS_HOST, session=None, pool=None,
+                 feed_timeout=FEED_TIMEOUT, deadline=NEWS_DEADLINE, cache=None, matcher=None):
         self.city = city
+        self.base_url = base_url.rstrip("/")
+        self.session = session or requests
+        self.pool = pool
+        self.feed_timeout = feed_timeout
+        self.deadline = deadline
+        # NewsCache shared by all workers, or None
+        self.cache = cache
+        if matcher is not None:
+            self.matcher = matcher
+        # [{"feed", "ms", "status", "entries"}] for the last run
+        self.feed_timings = []
+        # Set once the run has stopped waiting, so straggling downloads quit
+        self.abandoned = threading.Event()
     
     def strip_html(self, text):
         """Remove all HTML tags from text"""
-        # Remove HTML tags
-        clean = re.sub('<.*?>', '', text)
-        # Remove extra whitespace
-        clean = ' '.join(clean.split())
-        return clean
+        return strip_tags(text)
     
-    def run(self):
-        try:
-            # Properly encode the city name for URL
-            city_encoded = quote_plus(self.city)
-            
-            # Try multiple RSS feeds to get the most recent news
-            rss_urls = [
-                # Recent news with "when:7d" parameter for last 7 days
-                f"https://news.google.com/rss/search?q={city_encoded}+weather+when:7d&hl=en-US&gl=US&ceid=US:en",
-                # Broader search with location
-                f"https://news.google.com/rss/search?q={city_encoded}+(weather+OR+forecast+OR+temperature)&hl=en-US&gl=US&ceid=US:en",
-                # Alternative with "after:" parameter
-                f"https://news.google.com/rss/search?q={city_encoded}+weather&hl=en-US&gl=US&ceid=US:en",
-            ]
-            
-            all_entries = []
-            
-            # Try each RSS feed
-            for rss_url in rss_urls:
-                feed = feedparser.parse(rss_url)
-                if feed.entries:
-                    all_entries.extend(feed.entries)
-            
-            # Remove duplicates based on title
-            seen_titles = set()
-            unique_entries = []
-            for entry in all_entries:
-                if entry.title not in seen_titles:
-                    seen_titles.add(entry.title)
-                    unique_entries.append(entry)
-            
-            # Parse and filter entries
-            news_items = []
-            current_date = datetime.now()
-            thirty_days_ago = current_date - timedelta(days=30)
-            
-            for entry in unique_entries[:20]:  # Check more entries
-                # Parse published date
-                published_date = None
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    try:
-                        published_date = datetime(*entry.published_parsed[:6])
-                    except:
-                        pass
-                
-                # Skip if older than 30 days
-                if published_date and published_date < thirty_days_ago:
+    def feed_urls(self):
+        """Google News searches for the city, most specific first"""
+        # Properly encode the city name for URL
+        city_encoded = quote_plus(self.city)
+        
+        # Try multiple RSS feeds to get the most recent news
+        return [
+            # Recent news with "when:7d" parameter for last 7 days
+            f"{self.base_url}/rss/search?q={city_encoded}+weather+when:7d&hl=en-US&gl=US&ceid=US:en",
+            # Broader search with location
+            f"{self.base_url}/rss/search?q={city_encoded}+(weather+OR+forecast+OR+temperature)&hl=en-US&gl=US&ceid=US:en",
+            # Alternative with "after:" parameter
+            f"{self.base_url}/rss/search?q={city_encoded}+weather&hl=en-US&gl=US&ceid=US:en",
+        ]
+
+    def run(self, progress=None):
+        """Fetch, filter and sort news items for the city
+
+        With progress, feeds are processed as they arrive and new items are
+        passed to progress(items) right away, so the first headlines show
+        after one round trip. The return value is always the complete,
+        sorted list, picked from the feeds in rss_urls order, so it doesn't
+        depend on which feed arrived first.
+        """
+        rss_urls = self.feed_urls()
+        if progress is None:
+            return self.select_items(self.fetch_feeds(rss_urls))
+        
+        feeds = [[] for _ in rss_urls]
+        news_items = []
+        sent = set()
+        for index, records in self.iter_feeds(rss_urls):
+            feeds[index] = records
+            # Picked again from the start, as an earlier feed arriving late can change the window
+            news_items = self.select_items(feeds)
+            batch = [item for item in news_items if item["link"] not in sent]
+            sent.update(item["link"] for item in batch)
+            if batch:
+                progress(batch)
+        return news_items
+
+    def select_items(self, feeds):
+        """Sorted news items from record lists, taken in the order given"""
+        # Exact repeats are skipped by title, and syndicated copies of a story are
+        # folded into the first one; only the first ENTRY_WINDOW other entries are checked
+        seen_titles = set()
+        stories = StoryIndex()
+        checked = 0
+        news_items = []
+        thirty_days_ago = datetime.now() - timedelta(days=30)
+        
+        for records in feeds:
+            for record in records:
+                if checked >= ENTRY_WINDOW or len(news_items) >= MAX_NEWS_ITEMS:
+                    break
+                if record["title"] in seen_titles:
                     continue
+                seen_titles.add(record["title"])
                 
-                # Clean all text fields of HTML
-                title = self.strip_html(entry.title)
-                source = entry.get("source", {}).get("title", "Unknown")
-                summary = self.strip_html(entry.get("summary", ""))
-                link = entry.link
-
-                # Check if genuinely weather-related
-                if not self.is_weather_article(title, summary):
-                    continue
+                item = record["item"]
+                if item is not None:
+                    item = dict(item, title=headline(item["title"], item["source"]), sources=[item["source"]])
+                    story = stories.find_or_add(item["title"], item)
+                    if story is not None:
+                        if item["source"] not in story["sources"]:
+                            story["sources"].append(item["source"])
+                        continue
+                checked += 1
                 
-                news_items.append({
-                    "title": title,
-                    "source": source,
-                    "published": published_date.strftime("%b %d, %Y") if published_date else "Unknown",
-                    "published_relative": self.time_ago(published_date),
-                    "summary": summary,
-                    "link": link,
-                    "date": published_date
-                })
+                # Skip if off-topic or older than 30 days
+                if item is None or (item["date"] and item["date"] < thirty_days_ago):
+                    continue
+                item["published_relative"] = self.time_ago(item["date"])
+                news_items.append(item)
+        
+        return self.sort_items(news_items)
 
-                
-                # Stop once we have 5 recent items
-                if len(news_items) >= 15:
+    def parse_feed(self, body, headers):
+        """Records for a downloaded feed
+
+        Google News' RSS goes through the streaming rss_parser; any other
+        feed (Atom, RDF, malformed XML) falls back to feedparser.
+        """
+        try:
+            articles = parse_rss(body)
+        except UnknownFeed:
+            return self.feed_records(feedparser.parse(body, response_headers=headers).entries)
+        return [{"title": article["title"], "item": self.article_item(article)} for article in articles]
+
+    def feed_records(self, entries):
+        """[{"title", "item"}] per feedparser entry; item is None for off-topic entries
+
+        Records don't depend on the current time, so they can be cached;
+        the age check and relative time are applied when they are used.
+        """
+        return [{"title": entry.title, "item": self.news_item(entry)} for entry in entries]
+
+    def news_item(self, entry):
+        """Display item for a feedparser entry, or None if it isn't weather news"""
+        # Parse published date
+        published_date = None
+        if hasattr(entry, 'published_parsed') and entry.published_parsed:
+            try:
+                published_date = datetime(*entry.published_parsed[:6])
+            except:
+                pass
+        
+        # Clean all text fields of HTML
+        return self.article_item({
+            "title": self.strip_html(entry.title),
+            "source": entry.get("source", {}).get("title"),
+            "summary": self.strip_html(entry.get("summary", "")),
+            "link": entry.link,
+            "date": published_date
+        })
+
+    def article_item(self, article):
+        """Display item for a parsed article, or None if it isn't weather news"""
+        # Check if genuinely weather-related
+        if not self.is_weather_article(article["title"], article["summary"]):
+            return None
+        
+        published_date = article["date"]
+        return {
+            "title": article["title"],
+            "source": article["source"] or "Unknown",
+            "published": published_date.strftime("%b %d, %Y") if published_date else "Unknown",
+            "summary": article["summary"],
+            "link": article["link"],
+            "date": published_date
+        }
+
+    @staticmethod
+    def sort_items(news_items):
+        """Most recent first"""
+        return sorted(news_items, key=lambda x: x.get("date") or datetime.min, reverse=True)
+
+    def load_feed(self, rss_url):
+        """(records, status) for one feed, from the cache where possible
+
+        status is "cached" (fresh, no request), "not_modified" (304),
+        "stale" (request failed, older copy used) or "ok" (downloaded).
+        """
+        cached = self.cache.get(self.city, rss_url) if self.cache else None
+        # Records filtered with other keyword lists are of no use, nor are their validators
+        if cached and cached.get("filter") != self.matcher.signature:
+            cached = None
+        if cached and self.cache.is_fresh(cached):
+            self.cache.count_fresh_hit()
+            return cached["records"], "cached"
+
+        try:
+            response = self.fetch_feed(rss_url, cached)
+        except Exception:
+            if cached:
+                return cached["records"], "stale"
+            raise
+
+        if response is None:
+            return self.cache.revalidated(self.city, rss_url, cached)["records"], "not_modified"
+
+        body, headers = response
+        records = self.parse_feed(body, headers)
+        if self.cache:
+            self.cache.put(self.city, rss_url, records, headers.get("ETag"), headers.get("Last-Modified"),
+                           self.matcher.signature)
+        return records, "ok"
+
+    def fetch_feed(self, rss_url, cached=None):
+        """Download one feed, giving up after feed_timeout seconds
+
+        Returns (body, headers), or None if the server says the cached
+        copy is still current.
+        """
+        headers = {"User-Agent": feedparser.USER_AGENT}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("modified"):
+            headers["If-Modified-Since"] = cached["modified"]
+
+        started_at = time.perf_counter()
+        response = self.session.get(
+            rss_url,
+            headers=headers,
+            timeout=(FEED_CONNECT_TIMEOUT, self.feed_timeout),
+            stream=True
+        )
+        try:
+            if response.status_code == 304 and cached:
+                return None
+            response.raise_for_status()
+            # The read timeout only bounds each receive; a slow-drip body is cut off here.
+            # read1 returns after one receive instead of waiting for a full chunk
+            chunks = []
+            while True:
+                chunk = response.raw.read1(FEED_CHUNK_SIZE, decode_content=True)
+                if not chunk:
                     break
-            
-            # Sort by date (most recent first)
-            news_items.sort(key=lambda x: x.get("date") or datetime.min, reverse=True)
-            
-            
-            
-            self.finished.emit(news_items)
-        except Exception as e:
-            self.error.emit(str(e))
+                chunks.append(chunk)
+                if time.perf_counter() - started_at > self.feed_timeout:
+                    raise FeedTimeout(f"feed took over {self.feed_timeout} s")
+                if self.abandoned.is_set():
+                    raise FeedTimeout("news deadline passed")
+        finally:
+            response.close()
+        return b"".join(chunks), dict(response.headers)
+
+    def iter_feeds(self, rss_urls):
+        """Fetch all feeds at once; yield (index, records) as each finishes within the deadline"""
+        pool = self.pool or ThreadPoolExecutor(max_workers=len(rss_urls), thread_name_prefix="news-feed")
+        started_at = time.perf_counter()
+        self.feed_timings = [
+            {"feed": index, "ms": None, "status": "timeout", "entries": 0}
+            for index in range(len(rss_urls))
+        ]
+
+        def timed(index):
+            try:
+                return self.load_feed(rss_urls[index])
+            finally:
+                # Past the deadline the row already reads "timeout" with its final time
+                if not self.abandoned.is_set():
+                    self.feed_timings[index]["ms"] = (time.perf_counter() - started_at) * 1000
+
+        futures = {pool.submit(timed, index): index for index in range(len(rss_urls))}
+        if self.pool is None:
+            pool.shutdown(wait=False)
+
+        try:
+            for future in as_completed(futures, timeout=self.deadline):
+                index = futures[future]
+                timing = self.feed_timings[index]
+                records = []
+                if isinstance(future.exception(), (FeedTimeout, requests.exceptions.Timeout)):
+                    timing["status"] = "timeout"
+                elif future.exception() is not None:
+                    print(f"News feed error: {future.exception()}")
+                    timing["status"] = "error"
+                else:
+                    records, timing["status"] = future.result()
+                    timing["entries"] = len(records)
+                yield index, records
+        except FuturesTimeout:
+            # Past the overall deadline: the stragglers are dropped
+            self.abandoned.set()
+            for future, index in futures.items():
+                if not future.done():
+                    future.cancel()
+                    self.feed_timings[index]["ms"] = (time.perf_counter() - started_at) * 1000
+
+    def fetch_feeds(self, rss_urls):
+        """Record lists of the feeds that finished in time, in rss_urls order"""
+        results = [[] for _ in rss_urls]
+        for index, records in self.iter_feeds(rss_urls):
+            results[index] = records
+        return results
 
 
 class NewsAPI:
-    def __init__(self):
-        pass
+    def __init__(self, executor, base_url=DEFAULT_NEWS_HOST, cache_file=None, max_feeds=6, matcher=None):
+        self.executor = executor
+        self.base_url = base_url
+        # KeywordMatcher for the relevance filter; None keeps the built-in lists
+        self.matcher = matcher
+        # Processed feeds per city, revalidated with conditional GETs
+        self.cache = NewsCache(cache_file)
+        # Feed downloads run here, not on the executor the news task itself runs on
+        self.pool = ThreadPoolExecutor(max_workers=max_feeds, thread_name_prefix="news-feed")
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_feeds)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.last_feed_timings = []
     
-    def get_weather_news(self, city, callback, error_callback):
-        """Fetch weather-related news for a city"""
-        worker = NewsWorker(city)
-        worker.finished.connect(callback)
-        worker.error.connect(error_callback)
-        worker.start()
-        return worker  # Return to keep reference
\ No newline at end of file
+    def get_weather_news(self, city, callback, error_callback, batch_callback=None):
+        """Fetch weather-related news for a city
+
+        batch_callback, if given, receives each feed's new items as soon
+        as that feed arrives; callback still gets the complete list.
+        """
+        worker = NewsWorker(city, self.base_url, session=self.session, pool=self.pool, cache=self.cache,
+                            matcher=self.matcher)
+
+        def run(progress=None):
+            try:
+                return worker.run(progress)
+            finally:
+                # A copy, so the developer console isn't changed by stragglers
+                self.last_feed_timings = [dict(timing) for timing in worker.feed_timings]
+
+        return self.executor.submit(run, on_finished=callback, on_error=error_callback,
+                                    on_progress=batch_callback)
+
+    def cache_stats(self):
+        return self.cache.stats()
+
+    def close(self):
+        self.pool.shutdown(wait=False)
+        self.session.close()
+        self.cache.close()
\ No newline at end of file
@@ -0,0 +1,114 @@
+import threading
+import time
+from datetime import datetime
+
+from tools.disk_cache import DiskCache
+from tools.response_cache import ResponseCache
+
+# A feed fetched within NEWS_TTL seconds is used without asking the server
+NEWS_TTL = 600
+# After that it is revalidated with a conditional GET; entries are kept
+# in memory this long so the validators are still around
+STALE_AFTER = 24 * 3600
+
+
+class NewsCache:
+    """Processed news feeds per city and feed URL, with their HTTP validators
+
+    An entry holds the feed's records (each entry's title and its display
+    item, or None if the filter rejected it), the signature of that
+    filter, the ETag / Last-Modified the server sent, and when it was
+    fetched. Fresh entries skip the
+    network; stale ones are revalidated, and a 304 reuses the records
+    without parsing or filtering anything. Entries live in memory and,
+    with a path, in a DiskCache that survives restarts.
+    """
+
+    def __init__(self, path=None, ttl=NEWS_TTL, max_entries=64):
+        self.ttl = ttl
+        self.memory = ResponseCache(max_entries=max_entries, ttl=STALE_AFTER)
+        # The disk tier's "units" column holds the feed URL
+        self.disk = DiskCache(path, max_entries=200, max_bytes=2 * 1024 * 1024) if path else None
+        self._lock = threading.Lock()
+        self.fresh_hits = 0
+        self.not_modified = 0
+        self.downloads = 0
+
+    def _key(self, city, url):
+        return (city.strip().lower(), url)
+
+    def get(self, city, url):
+        """Cached entry for the feed, however old, or None"""
+        entry = self.memory.get(self._key(city, url))
+        if entry is None and self.disk:
+            stored = self.disk.get("feed", city, url)
+            if stored:
+                entry = self._from_plain(stored[0])
+                self.memory.put(self._key(city, url), entry)
+        return entry
+
+    def is_fresh(self, entry):
+        return time.time() - entry["fetched_at"] < self.ttl
+
+    def put(self, city, url, records, etag=None, modified=None, filter=None):
+        """Store a freshly downloaded and processed feed
+
+        filter identifies the keyword lists the records were filtered with.
+        """
+        entry = {"records": records, "etag": etag, "modified": modified, "filter": filter,
+                 "fetched_at": time.time()}
+        self._save(city, url, entry)
+        with self._lock:
+            self.downloads += 1
+        return entry
+
+    def revalidated(self, city, url, entry):
+        """The server answered 304: the entry is fresh again"""
+        entry = dict(entry, fetched_at=time.time())
+        self._save(city, url, entry)
+        with self._lock:
+            self.not_modified += 1
+        return entry
+
+    def count_fresh_hit(self):
+        with self._lock:
+            self.fresh_hits += 1
+
+    def _save(self, city, url, entry):
+        self.memory.put(self._key(city, url), entry)
+        if self.disk:
+            self.disk.put("feed", city, url, self._to_plain(entry))
+
+    def _to_plain(self, entry):
+        """JSON-ready copy: item dates become timestamps"""
+        records = []
+        for record in entry["records"]:
+            item = record["item"]
+            if item is not None and item.get("date"):
+                item = dict(item, date=item["date"].timestamp())
+            records.append({"title": record["title"], "item": item})
+        return dict(entry, records=records)
+
+    def _from_plain(self, entry):
+        records = []
+        for record in entry["records"]:
+            item = record["item"]
+            if item is not None and item.get("date"):
+                item = dict(item, date=datetime.fromtimestamp(item["date"]))
+            records.append({"title": record["title"], "item": item})
+        return dict(entry, records=records)
+
+    def stats(self):
+        with self._lock:
+            stats = {
+                "fresh_hits": self.fresh_hits,
+                "not_modified": self.not_modified,
+                "downloads": self.downloads,
+            }
+        stats["memory"] = self.memory.stats()
+        stats["disk"] = self.disk.stats() if self.disk else None
+        return stats
+
+    def close(self):
+        if self.disk:
+            self.disk.close()
@@ -0,0 +1,221 @@
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from tools.rate_limiter import FOREGROUND, VISIBLE
+from tools.weather_records import CurrentObservation, DailySummary
+
+# Hedge deadline bounds when the primary's p95 is unknown or extreme
+DEFAULT_HEDGE_DELAY = 1.5
+MIN_HEDGE_DELAY = 0.2
+MAX_HEDGE_DELAY = 5.0
+
+
+class WeatherProvider(ABC):
+    """Interface for weather backends
+
+    A provider returns the normalized structures MainWindow renders:
+    get_current_weather gives a CurrentObservation-shaped record and
+    get_daily_summary gives {"city", "country", "daily": [DailySummary]}.
+    Failures are raised as exceptions. Providers also keep a window of
+    network latencies, which the hedging policy uses as its deadline.
+    """
+    name = "provider"
+
+    def __init__(self, latency_window=200):
+        self._latencies = deque(maxlen=latency_window)
+        self._latency_lock = threading.Lock()
+
+    @abstractmethod
+    def get_current_weather(self, city, units="metric", priority=VISIBLE):
+        """Current conditions for city"""
+
+    @abstractmethod
+    def get_daily_summary(self, city, units="metric", priority=VISIBLE):
+        """Five-day summary for city"""
+
+    def get_current_weather_group(self, cities, units="metric", priority=VISIBLE):
+        """Current weather for many cities; providers with a batch endpoint override this"""
+        results = {}
+        for city in cities:
+            try:
+                results[city] = self.get_current_weather(city, units, priority)
+            except Exception:
+                results[city] = None
+        return results
+
+    def resolve_city(self, city):
+        """Canonical city record if the provider has one, else None"""
+        return None
+
+    def record_latency(self, seconds):
+        with self._latency_lock:
+            self._latencies.append(seconds)
+
+    def latency_p95(self):
+        """95th percentile network latency in seconds, or None without samples"""
+        with self._latency_lock:
+            latencies = sorted(self._latencies)
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+
+
+class StubProvider(WeatherProvider):
+    """Local provider returning canned data, for tests and offline runs
+
+    Pass records (or plain dicts) per city in current / daily, or let it
+    synthesize stable values from the city name. latency delays every
+    call; fail_with makes every call raise that exception.
+    """
+    name = "stub"
+
+    def __init__(self, current=None, daily=None, latency=0.0, fail_with=None):
+        super().__init__()
+        self.current = current or {}
+        self.daily = daily or {}
+        self.latency = latency
+        self.fail_with = fail_with
+        self.calls = 0
+
+    def _call(self):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        self.record_latency(self.latency)
+        if self.fail_with is not None:
+            raise self.fail_with
+
+    def _seed(self, city):
+        return zlib.crc32(city.strip().lower().encode())
+
+    def get_current_weather(self, city, units="metric", priority=VISIBLE):
+        self._call()
+        if city in self.current:
+            return self.current[city]
+
+        seed = self._seed(city)
+        temperature = seed % 35 - 5
+        now = int(time.time())
+        return CurrentObservation(
+            city=city.title(), city_id=seed % 10 ** 7, country="XX",
+            temperature=temperature, feels_like=temperature - 1,
+            temp_min=temperature - 3, temp_max=temperature + 3,
+            humidity=seed % 60 + 30, pressure=1000 + seed % 30,
+            description="clear sky", main="Clear", icon="01d", id=800,
+            wind_speed=seed % 12, wind_deg=seed % 360, clouds=0, visibility=10000,
+            rain={}, snow={},
+            timestamp=now, sunrise=now - 6 * 3600, sunset=now + 6 * 3600, timezone=0,
+        )
+
+    def get_daily_summary(self, city, units="metric", priority=VISIBLE):
+        self._call()
+        if city in self.daily:
+            return self.daily[city]
+
+        seed = self._seed(city)
+        today = int(time.time()) // 86400 * 86400
+        days = []
+        for offset in range(5):
+            date = time.gmtime(today + offset * 86400)
+            temp = seed % 35 - 5 + offset
+            days.append(DailySummary(
+                date=time.strftime("%Y-%m-%d", date), day_name=time.strftime("%A", date),
+                temp_min=temp - 4, temp_max=temp + 4, temp_avg=temp,
+                description="clear sky", icon="01d", id=800,
+                humidity=seed % 60 + 30, wind_speed=seed % 12, pop_max=0,
+            ))
+        return {"city": city.title(), "country": "XX", "daily": days}
+
+
+class HedgedProvider(WeatherProvider):
+    """Sends slow foreground requests to a secondary provider as well
+
+    Foreground calls go to the primary first. If it has not answered by
+    the primary's p95 network latency, the same call goes to the secondary
+    and whichever succeeds first wins. A primary that fails fast with an
+    outage-type error fails over right away. Other priorities go straight
+    to the primary.
+    """
+
+    def __init__(self, primary, secondary, max_workers=4):
+        super().__init__()
+        self.primary = primary
+        self.secondary = secondary
+        self.name = f"{primary.name}+{secondary.name}"
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+        self._stats_lock = threading.Lock()
+        self.calls = 0
+        self.hedged = 0
+        self.secondary_wins = 0
+
+    def hedge_delay(self):
+        p95 = self.primary.latency_p95()
+        if p95 is None:
+            return DEFAULT_HEDGE_DELAY
+        return min(MAX_HEDGE_DELAY, max(MIN_HEDGE_DELAY, p95))
+
+    def get_current_weather(self, city, units="metric", priority=VISIBLE):
+        return self._call("get_current_weather", city, units, priority)
+
+    def get_daily_summary(self, city, units="metric", priority=VISIBLE):
+        return self._call("get_daily_summary", city, units, priority)
+
+    def get_current_weather_group(self, cities, units="metric", priority=VISIBLE):
+        return self.primary.get_current_weather_group(cities, units, priority)
+
+    def resolve_city(self, city):
+        return self.primary.resolve_city(city)
+
+    def _call(self, method, city, units, priority):
+        if priority != FOREGROUND:
+            return getattr(self.primary, method)(city, units, priority)
+
+        with self._stats_lock:
+            self.calls += 1
+        primary = self._pool.submit(getattr(self.primary, method), city, units, priority)
+        done, _ = wait([primary], timeout=self.hedge_delay())
+        if done and not self._should_fail_over(primary):
+            return primary.result()
+
+        with self._stats_lock:
+            self.hedged += 1
+        secondary = self._pool.submit(getattr(self.secondary, method), city, units, priority)
+        pending = {primary, secondary}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None and future.result():
+                    if future is secondary:
+                        with self._stats_lock:
+                            self.secondary_wins += 1
+                    return future.result()
+
+        # Both failed; the primary's error is the one worth reporting
+        if primary.exception() is not None:
+            raise primary.exception()
+        return secondary.result()
+
+    def _should_fail_over(self, future):
+        """A primary that failed for reasons another backend may not share"""
+        error = future.exception()
+        return error is not None and (getattr(error, "is_outage", False) or getattr(error, "retryable", False))
+
+    def hedge_stats(self):
+        with self._stats_lock:
+            return {
+                "secondary": self.secondary.name,
+                "foreground_calls": self.calls,
+                "hedged": self.hedged,
+                "secondary_wins": self.secondary_wins,
+                "hedge_delay_ms": self.hedge_delay() * 1000,
+            }
+
+    def close(self):
+        self._pool.shutdown(wait=False)
+        for provider in (self.primary, self.secondary):
+            if hasattr(provider, "close"):
+                provider.close()
@@ -0,0 +1,197 @@
+import json
+import math
+import os
+import threading
+import time
+
+# Per-minute buckets older than this are dropped
+MINUTE_HISTORY = 60
+# Per-day buckets older than this are dropped
+DAY_HISTORY = 31
+# Flush counters to disk at most this often while calls are being made
+SAVE_INTERVAL = 30
+
+SECONDS_PER_DAY = 86400
+
+
+class QuotaLedger:
+    """Persistent count of API calls per endpoint, per minute and per day
+
+    Counters are updated under a lock from any worker thread and written to
+    a JSON file periodically, so the day's usage survives restarts. Days are
+    UTC days, matching how OWM resets its quotas.
+    """
+
+    def __init__(self, ledger_file="api_usage.json", daily_limit=1000):
+        self.ledger_file = ledger_file
+        self.daily_limit = daily_limit
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+        # {minute number: {endpoint: calls}}, {"YYYY-MM-DD": {endpoint: calls}}
+        self.minutes = {}
+        self.days = {}
+        # {"YYYY-MM-DD": {key label: calls}} when several API keys are in use
+        self.key_days = {}
+        self.total = 0
+
+        self._dirty = False
+        self._saved_at = time.time()
+        self.load_ledger()
+
+    def load_ledger(self):
+        """Load recorded usage from JSON file"""
+        if not self.ledger_file or not os.path.exists(self.ledger_file):
+            return
+        try:
+            with open(self.ledger_file, 'r') as f:
+                ledger = json.load(f)
+            # JSON object keys are strings, minute numbers are ints
+            self.minutes = {int(minute): counts for minute, counts in ledger.get("minutes", {}).items()}
+            self.days = ledger.get("days", {})
+            self.key_days = ledger.get("key_days", {})
+            self.total = ledger.get("total", 0)
+        except Exception as e:
+            print(f"Error loading API usage: {e}")
+
+    def save_ledger(self):
+        """Save recorded usage to JSON file"""
+        if not self.ledger_file:
+            return
+        try:
+            with self._save_lock:
+                # Snapshot inside the save lock, so saves land on disk in the order taken
+                with self._lock:
+                    self._prune(time.time())
+                    ledger = {
+                        "minutes": {minute: dict(counts) for minute, counts in self.minutes.items()},
+                        "days": {day: dict(counts) for day, counts in self.days.items()},
+                        "key_days": {day: dict(counts) for day, counts in self.key_days.items()},
+                        "total": self.total,
+                    }
+                    self._dirty = False
+                    self._saved_at = time.time()
+                # Write a temporary file and swap it in, so a crash never leaves half a ledger
+                temp_file = f"{self.ledger_file}.tmp"
+                with open(temp_file, 'w') as f:
+                    json.dump(ledger, f, indent=2)
+                os.replace(temp_file, self.ledger_file)
+        except Exception as e:
+            # Keep the counts pending so the next save or flush tries again
+            self._dirty = True
+            print(f"Error saving API usage: {e}")
+
+    @staticmethod
+    def day_key(ts):
+        return time.strftime("%Y-%m-%d", time.gmtime(ts))
+
+    def _prune(self, now):
+        oldest_minute = int(now // 60) - MINUTE_HISTORY
+        for minute in [m for m in self.minutes if m <= oldest_minute]:
+            del self.minutes[minute]
+
+        oldest_day = self.day_key(now - DAY_HISTORY * SECONDS_PER_DAY)
+        for day in [d for d in self.days if d <= oldest_day]:
+            del self.days[day]
+        for day in [d for d in self.key_days if d <= oldest_day]:
+            del self.key_days[day]
+
+    def record(self, endpoint, calls=1, key=None):
+        """Count calls made to endpoint just now (with the given key label)"""
+        now = time.time()
+        with self._lock:
+            minute = self.minutes.setdefault(int(now // 60), {})
+            minute[endpoint] = minute.get(endpoint, 0) + calls
+            day = self.days.setdefault(self.day_key(now), {})
+            day[endpoint] = day.get(endpoint, 0) + calls
+            if key is not None:
+                by_key = self.key_days.setdefault(self.day_key(now), {})
+                by_key[key] = by_key.get(key, 0) + calls
+            self.total += calls
+
+            self._dirty = True
+            due = now - self._saved_at >= SAVE_INTERVAL
+
+        if due:
+            self.save_ledger()
+
+    def flush(self):
+        """Write pending counts to disk (used on shutdown)"""
+        if self._dirty:
+            self.save_ledger()
+
+    def calls_today(self):
+        with self._lock:
+            return sum(self.days.get(self.day_key(time.time()), {}).values())
+
+    def calls_last_minute(self):
+        """Calls made in the trailing 60 seconds (current and previous minute bucket)"""
+        now = time.time()
+        minute = int(now // 60)
+        with self._lock:
+            current = sum(self.minutes.get(minute, {}).values())
+            previous = sum(self.minutes.get(minute - 1, {}).values())
+        # Weight the previous bucket by how much of it is still in the window
+        return current + previous * (1 - (now % 60) / 60)
+
+    def seconds_left_today(self, now=None):
+        now = time.time() if now is None else now
+        return SECONDS_PER_DAY - now % SECONDS_PER_DAY
+
+    def projected_limit_time(self, calls_per_refresh, interval_minutes):
+        """When today's limit will be reached at this refresh rate
+
+        Returns a Unix timestamp, or None if the limit holds until the
+        UTC day resets.
+        """
+        if not self.daily_limit or calls_per_refresh <= 0 or interval_minutes <= 0:
+            return None
+
+        now = time.time()
+        remaining = self.daily_limit - self.calls_today()
+        if remaining <= 0:
+            return now
+
+        refreshes_left = math.ceil(remaining / calls_per_refresh)
+        hits_at = now + (refreshes_left - 1) * interval_minutes * 60
+        return hits_at if hits_at < now + self.seconds_left_today(now) else None
+
+    def budget_interval(self, calls_per_refresh, interval_minutes, budget=None):
+        """Shortest refresh interval (minutes, >= interval_minutes) that stays under budget
+
+        Checks both the steady-state rate (a whole day of refreshes) and
+        what is left of today's budget after the calls already made.
+        """
+        budget = budget or self.daily_limit
+        if not budget or calls_per_refresh <= 0:
+            return interval_minutes
+
+        now = time.time()
+        minutes_left = self.seconds_left_today(now) / 60
+        remaining = budget - self.calls_today()
+        if remaining < calls_per_refresh:
+            # Nothing left today: wait for the reset
+            return max(interval_minutes, math.ceil(minutes_left))
+
+        steady = calls_per_refresh * 1440 / budget
+        today = calls_per_refresh * minutes_left / remaining
+        return max(interval_minutes, math.ceil(max(steady, today)))
+
+    def stats(self):
+        """Usage counters for monitoring"""
+        now = time.time()
+        with self._lock:
+            today = dict(self.days.get(self.day_key(now), {}))
+            today_by_key = dict(self.key_days.get(self.day_key(now), {}))
+            total = self.total
+
+        used = sum(today.values())
+        return {
+            "total": total,
+            "today": used,
+            "today_by_endpoint": today,
+            "today_by_key": today_by_key,
+            "last_minute": self.calls_last_minute(),
+            "daily_limit": self.daily_limit,
+            "remaining_today": max(0, self.daily_limit - used) if self.daily_limit else None,
+        }
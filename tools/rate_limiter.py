@@ -0,0 +1,116 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+
+# Priority classes, most urgent first
+FOREGROUND = 0   # the city the user just opened
+VISIBLE = 1      # sidebar cards currently on screen
+BACKGROUND = 2   # auto-refresh and off-screen cards
+
+PRIORITY_NAMES = {
+    FOREGROUND: "foreground",
+    VISIBLE: "visible",
+    BACKGROUND: "background",
+}
+
+
+class RateLimiter:
+    """Sliding-window limiter that queues callers by priority instead of failing them
+
+    At most rate calls are granted in any window of per seconds: the grant
+    times still inside the window are kept, and once there are rate of
+    them the next call waits until the oldest one drops out. A caller
+    that finds the window full (or more urgent callers ahead of it) waits
+    in a priority queue; within a priority class callers are served in
+    arrival order.
+    """
+
+    def __init__(self, rate=60, per=60.0, wait_window=200):
+        self.rate = rate
+        self.per = per
+
+        # Monotonic times of the grants inside the current window, oldest first
+        self._granted_at = deque()
+        self._cond = threading.Condition()
+        self._waiting = []
+        self._sequence = itertools.count()
+
+        self.granted = {priority: 0 for priority in PRIORITY_NAMES}
+        self._waits = {priority: deque(maxlen=wait_window) for priority in PRIORITY_NAMES}
+
+    def _expire(self, now):
+        while self._granted_at and now - self._granted_at[0] >= self.per:
+            self._granted_at.popleft()
+
+    def acquire(self, priority=BACKGROUND):
+        """Block until this caller may make a call; returns seconds waited"""
+        started_at = time.monotonic()
+        with self._cond:
+            ticket = (priority, next(self._sequence))
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._expire(now)
+                    if self._waiting[0] == ticket and len(self._granted_at) < self.rate:
+                        heapq.heappop(self._waiting)
+                        self._granted_at.append(now)
+                        break
+
+                    if self._waiting[0] == ticket:
+                        # Sleep until the oldest grant leaves the window
+                        self._cond.wait(self._granted_at[0] + self.per - now)
+                    else:
+                        self._cond.wait()
+            except BaseException:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                raise
+            finally:
+                # Let the next caller in line re-check the bucket
+                self._cond.notify_all()
+
+            waited = time.monotonic() - started_at
+            self.granted[priority] += 1
+            self._waits[priority].append(waited)
+            return waited
+
+    def set_rate(self, rate):
+        """Change the budget, e.g. when API keys join or leave the pool"""
+        with self._cond:
+            self.rate = rate
+            self._cond.notify_all()
+
+    def remaining(self):
+        """Calls that may go out right now"""
+        with self._cond:
+            self._expire(time.monotonic())
+            return max(0, self.rate - len(self._granted_at))
+
+    def stats(self):
+        """Remaining budget and per-priority queue and wait metrics"""
+        with self._cond:
+            self._expire(time.monotonic())
+            queued = {priority: 0 for priority in PRIORITY_NAMES}
+            for priority, _ in self._waiting:
+                queued[priority] += 1
+
+            classes = {}
+            for priority, name in PRIORITY_NAMES.items():
+                waits = self._waits[priority]
+                classes[name] = {
+                    "queued": queued[priority],
+                    "granted": self.granted[priority],
+                    "avg_wait_ms": sum(waits) / len(waits) * 1000 if waits else 0.0,
+                    "max_wait_ms": max(waits) * 1000 if waits else 0.0,
+                }
+
+            return {
+                "remaining": max(0, self.rate - len(self._granted_at)),
+                "capacity": self.rate,
+                "rate_per_minute": self.rate / self.per * 60,
+                "queued": len(self._waiting),
+                "classes": classes,
+            }
@@ -0,0 +1,81 @@
+import html
+import io
+import re
+import xml.etree.ElementTree as ET
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+
+TAG_PATTERN = re.compile(r"<[^>]*>")
+
+# Item children that are read; everything else is skipped
+ITEM_FIELDS = {"title", "link", "pubDate", "description", "source"}
+
+
+class UnknownFeed(Exception):
+    """Not an RSS 2.0 feed this parser handles; use feedparser instead"""
+
+
+def strip_tags(text):
+    """Text without HTML tags, with entities decoded and whitespace collapsed"""
+    if not text:
+        return ""
+    if "<" in text:
+        text = TAG_PATTERN.sub("", text)
+    if "&" in text:
+        text = html.unescape(text)
+    return " ".join(text.split())
+
+
+def parse_date(value):
+    """RFC 822 pubDate as a naive UTC datetime, or None"""
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if date.tzinfo is not None:
+        date = date.astimezone(timezone.utc).replace(tzinfo=None)
+    return date
+
+
+def parse_rss(body):
+    """Articles of an RSS 2.0 feed such as Google News' search feeds
+
+    Returns [{"title", "link", "source", "date", "summary"}] in feed order,
+    with tags stripped from title and summary as each item closes. Items
+    are read one at a time with iterparse and cleared once used, and
+    channel metadata is skipped. Raises UnknownFeed for anything else
+    (Atom, RDF, malformed XML), which feedparser copes with.
+    """
+    articles = []
+    item = None
+    try:
+        events = ET.iterparse(io.BytesIO(body), events=("start", "end"))
+        _, root = next(events)
+        if root.tag != "rss" or not root.get("version", "").startswith("2."):
+            raise UnknownFeed(f"not an RSS 2.0 feed: <{root.tag}>")
+
+        for event, element in events:
+            if event == "start":
+                if element.tag == "item":
+                    item = {}
+                continue
+            if item is None:
+                continue
+
+            tag = element.tag
+            if tag == "item":
+                articles.append({
+                    "title": strip_tags(item.get("title")),
+                    "link": (item.get("link") or "").strip(),
+                    "source": strip_tags(item.get("source")),
+                    "date": parse_date(item.get("pubDate")),
+                    "summary": strip_tags(item.get("description")),
+                })
+                item = None
+                element.clear()
+            elif tag in ITEM_FIELDS:
+                item[tag] = element.text or ""
+    except (ET.ParseError, StopIteration) as e:
+        raise UnknownFeed(f"unreadable feed: {e}")
+
+    return articles
@@ -0,0 +1,102 @@
+import hashlib
+import re
+import struct
+
+# MinHash signature length (at most 32), filed under NUM_HASHES // BAND_ROWS
+# band keys. With 24 hashes in bands of 2, titles at SIMILARITY are paired
+# ~97% of the time
+NUM_HASHES = 24
+BAND_ROWS = 2
+# Headlines whose word-pair sets overlap this much (Jaccard) are one story
+SIMILARITY = 0.5
+# Only the most recent stories in a band bucket are compared, so crowded
+# buckets can't make grouping quadratic
+BUCKET_DEPTH = 16
+
+_WORD = re.compile(r"\w+")
+
+
+def headline(title, source=None):
+    """Title without the " - Source" suffix Google News appends"""
+    head, sep, tail = title.rpartition(" - ")
+    if sep and head.strip() and source and tail.strip().lower() == source.strip().lower():
+        return head.strip()
+    return title
+
+
+def word_pairs(words):
+    """Adjacent word pairs (shingles) of a word list; single words for one-word lists"""
+    if len(words) < 2:
+        return set(words)
+    return {f"{first} {second}" for first, second in zip(words, words[1:])}
+
+
+class StoryIndex:
+    """Groups near-duplicate headlines in one pass (MinHash with LSH bands)
+
+    Each headline is cut into word pairs and hashed into a MinHash
+    signature, which is filed under one key per band of BAND_ROWS values.
+    A new headline is only compared with the stories sharing one of its
+    band keys (at most BUCKET_DEPTH per key), so adding n headlines takes
+    linear time rather than n² comparisons. A candidate is the same story
+    if the word-pair sets overlap by at least similarity.
+    """
+
+    def __init__(self, similarity=SIMILARITY, num_hashes=NUM_HASHES, band_rows=BAND_ROWS):
+        self.similarity = similarity
+        self.band_rows = band_rows
+        # One blake2b digest per word pair, read as num_hashes 16-bit hash values
+        self._digest_size = 2 * num_hashes
+        self._unpack = struct.Struct(f"<{num_hashes}H").unpack
+        # Hash values per word pair; syndicated copies share all of theirs
+        self._pair_hashes = {}
+        # Stories by exact word sequence, found without hashing
+        self._exact = {}
+        self._buckets = {}
+        # [(word pairs, value)] per story, indexed from the buckets
+        self._stories = []
+
+    def signature(self, pairs):
+        columns = []
+        for pair in pairs:
+            hashed = self._pair_hashes.get(pair)
+            if hashed is None:
+                digest = hashlib.blake2b(pair.encode(), digest_size=self._digest_size).digest()
+                hashed = self._pair_hashes[pair] = self._unpack(digest)
+            columns.append(hashed)
+        return list(map(min, zip(*columns)))
+
+    def band_keys(self, pairs):
+        values = iter(self.signature(pairs))
+        return list(enumerate(zip(*[values] * self.band_rows)))
+
+    def find_or_add(self, text, value):
+        """value of the earlier story text duplicates, or None after filing text as a new story"""
+        tokens = _WORD.findall(text.lower())
+        exact = " ".join(tokens)
+        if exact in self._exact:
+            return self._exact[exact]
+        pairs = word_pairs(tokens)
+        if not pairs:
+            return None
+
+        keys = self.band_keys(pairs)
+        compared = set()
+        for key in keys:
+            for index in self._buckets.get(key, ())[-BUCKET_DEPTH:]:
+                if index in compared:
+                    continue
+                compared.add(index)
+                other, other_value = self._stories[index]
+                if len(pairs & other) >= self.similarity * len(pairs | other):
+                    return other_value
+
+        self._exact[exact] = value
+        index = len(self._stories)
+        self._stories.append((pairs, value))
+        for key in keys:
+            self._buckets.setdefault(key, []).append(index)
+        return None
+
+    def __len__(self):
+        return len(self._stories)
@@ -0,0 +1,187 @@
+import threading
+import time
+from collections import deque
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class TaskSignals(QObject):
+    """Signals for a Task, delivered on the thread that submitted it"""
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+    progress = pyqtSignal(object)
+    cancelled = pyqtSignal()
+
+
+class Task(QRunnable):
+    """A function call scheduled on the TaskExecutor's thread pool"""
+
+    def __init__(self, executor, fn, args, kwargs):
+        super().__init__()
+        # The executor owns the Python object and releases it after delivery
+        self.setAutoDelete(False)
+
+        self.executor = executor
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = TaskSignals()
+
+        self.submitted_at = time.perf_counter()
+        self.started_at = None
+        self.is_cancelled = False
+
+    def cancel(self):
+        """Cancel the task; see TaskExecutor.cancel"""
+        self.executor.cancel(self)
+
+    def report(self, value):
+        """Send a partial result to on_progress (called from the worker thread)"""
+        if not self.is_cancelled:
+            self.signals.progress.emit(value)
+
+    def run(self):
+        self.executor._task_started(self)
+        if self.is_cancelled:
+            # Cancelled after the pool had already dequeued it
+            self.executor._task_done(self)
+            self.signals.cancelled.emit()
+            return
+
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.executor._task_done(self)
+            if self.is_cancelled:
+                self.signals.cancelled.emit()
+            else:
+                self.signals.error.emit(str(e))
+        else:
+            self.executor._task_done(self)
+            # A result nobody wants any more is dropped here
+            if self.is_cancelled:
+                self.signals.cancelled.emit()
+            else:
+                self.signals.finished.emit(result)
+
+
+class TaskExecutor:
+    """Runs background work on a bounded QThreadPool
+
+    Replaces the one-QThread-per-request workers: at most max_workers
+    threads exist, extra tasks wait in the pool's queue, and finished
+    tasks are dropped as soon as their result has been delivered.
+    """
+
+    def __init__(self, max_workers=8, latency_window=200):
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max_workers)
+        # Idle threads exit after a minute instead of lingering forever
+        self.pool.setExpiryTimeout(60000)
+
+        self._tasks = set()
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self.submitted = 0
+        self.completed = 0
+        self.cancelled = 0
+        self._latencies = deque(maxlen=latency_window)
+        self._waits = deque(maxlen=latency_window)
+
+    @property
+    def max_workers(self):
+        return self.pool.maxThreadCount()
+
+    def submit(self, fn, *args, on_finished=None, on_error=None, on_progress=None, **kwargs):
+        """Queue fn(*args, **kwargs); callbacks run on the submitting thread
+
+        With on_progress, fn is also passed progress=callable, which it can
+        call any number of times with partial results before returning.
+        """
+        task = Task(self, fn, args, kwargs)
+        if on_progress:
+            task.kwargs["progress"] = task.report
+            task.signals.progress.connect(on_progress)
+        if on_finished:
+            task.signals.finished.connect(on_finished)
+        if on_error:
+            task.signals.error.connect(on_error)
+        # Connected last so it runs after the callbacks
+        task.signals.finished.connect(lambda _result, t=task: self._release(t))
+        task.signals.error.connect(lambda _err, t=task: self._release(t))
+        task.signals.cancelled.connect(lambda t=task: self._release(t))
+
+        with self._lock:
+            self._tasks.add(task)
+            self._queued += 1
+            self.submitted += 1
+
+        self.pool.start(task)
+        return task
+
+    def cancel(self, task):
+        """Cancel a task
+
+        A task still waiting in the queue is removed and never runs. A task
+        that is already running finishes, but its callbacks are not called.
+        """
+        with self._lock:
+            if task.is_cancelled or task not in self._tasks:
+                return
+            task.is_cancelled = True
+
+        if self.pool.tryTake(task):
+            with self._lock:
+                self._queued -= 1
+                self.cancelled += 1
+            self._release(task)
+        else:
+            with self._lock:
+                self.cancelled += 1
+
+    def cancel_all(self, tasks):
+        for task in tasks:
+            self.cancel(task)
+
+    def _task_started(self, task):
+        task.started_at = time.perf_counter()
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+            self._waits.append(task.started_at - task.submitted_at)
+
+    def _task_done(self, task):
+        with self._lock:
+            self._active -= 1
+            self.completed += 1
+            self._latencies.append(time.perf_counter() - task.started_at)
+
+    def _release(self, task):
+        with self._lock:
+            self._tasks.discard(task)
+
+    def stats(self):
+        """Queue depth, active count and task latency for monitoring"""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            waits = list(self._waits)
+            stats = {
+                "max_workers": self.max_workers,
+                "threads": self.pool.activeThreadCount(),
+                "queued": self._queued,
+                "active": self._active,
+                "held": len(self._tasks),
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "cancelled": self.cancelled,
+            }
+
+        stats["avg_latency_ms"] = sum(latencies) / len(latencies) * 1000 if latencies else 0.0
+        stats["p95_latency_ms"] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000 if latencies else 0.0
+        stats["avg_wait_ms"] = sum(waits) / len(waits) * 1000 if waits else 0.0
+        return stats
+
+    def wait_for_done(self, msecs=-1):
+        """Block until every queued task has run (used on shutdown)"""
+        return self.pool.waitForDone(msecs)
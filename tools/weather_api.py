@@ -1,84 +1,612 @@
+import copy
+import math
+import random
+import threading
+import time
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
+from tools.response_cache import ResponseCache
+from tools.disk_cache import DiskCache
+from tools.single_flight import SingleFlight
+from tools.rate_limiter import RateLimiter, VISIBLE
+from tools.quota_ledger import QuotaLedger
+from tools.key_pool import KeyPool
+from tools.providers import WeatherProvider
+from tools.circuit_breaker import CircuitBreaker
+from tools.api_errors import (
+    WeatherAPIError, CircuitOpenError, RequestTimeoutError, ConnectionFailedError, ServerError,
+    InvalidKeyError, RateLimitedError, error_for_response
+)
+from tools.city_resolver import CityResolver
+from tools.forecast_columns import ColumnarForecast
+from tools.weather_records import CurrentObservation, ForecastBlock, DailySummary, to_plain
 
-class WeatherAPI:
-    def __init__(self, api_key):
-        self.api_key = api_key
-        self.base_url = "https://api.openweathermap.org/data/2.5"
+
+DEFAULT_API_HOST = "https://api.openweathermap.org"
+
+# Matches the number of weather fetches the UI runs at once
+# (current + forecast for the open city plus sidebar cards)
+DEFAULT_POOL_SIZE = 10
+
+# OWM refreshes station observations roughly every 10 minutes, so a
+# "weather" payload stays current until dt + OBSERVATION_INTERVAL
+OBSERVATION_INTERVAL = 600
+CACHE_TTL = 600
+CACHE_MIN_TTL = 60
+
+# OWM publishes a new 5-day forecast every 3 hours
+FORECAST_TTL = 1800
+
+# The group endpoint accepts at most 20 city IDs per call
+GROUP_BATCH_SIZE = 20
+
+# OWM free tier: 60 calls per minute
+DEFAULT_RATE_LIMIT = 60
+DEFAULT_DAILY_LIMIT = 1000
+
+# (connect, read) timeouts: an unreachable host fails fast
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Retries for transient failures, with jittered exponential backoff
+MAX_ATTEMPTS = 3
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 8.0
+# A Retry-After longer than this is not waited out in a worker thread
+MAX_RETRY_AFTER = 30.0
+
+
+class WeatherAPI(WeatherProvider):
+    """OpenWeatherMap provider: request handling, caching and OWM parsing"""
+    name = "openweathermap"
+
+    def __init__(self, api_key, pool_size=DEFAULT_POOL_SIZE, cache_file=None, index_file=None,
+                 rate_limit=DEFAULT_RATE_LIMIT, ledger_file=None, daily_limit=DEFAULT_DAILY_LIMIT,
+                 key_routing="least_used", api_host=DEFAULT_API_HOST):
+        super().__init__()
+        # One key or a list of keys whose quotas are pooled
+        keys = [api_key] if isinstance(api_key, str) else list(api_key)
+        self.keys = KeyPool(keys, strategy=key_routing, per_key_rate=rate_limit)
+        self.api_key = self.keys.keys[0].key
+        self.rate_limit = rate_limit
+        # api_host can point at a local stand-in (benchmarks/standin_server.py)
+        api_host = api_host.rstrip("/")
+        self.base_url = f"{api_host}/data/2.5"
+        # Consolidated current + hourly + daily endpoint, for keys that have it
+        self.onecall_url = f"{api_host}/data/3.0/onecall"
+        self.pool_size = pool_size
+        self.session = self._create_session(pool_size)
+        self.cache = ResponseCache(max_entries=256, ttl=CACHE_TTL)
+        # Parsed forecasts with their derived views, validated by fingerprint
+        self.forecasts = ResponseCache(max_entries=64, ttl=6 * 3600)
+        self.disk_cache = DiskCache(cache_file) if cache_file else None
+        self.flights = SingleFlight()
+        # Calls over budget wait here, most urgent first
+        self.limiter = RateLimiter(rate=rate_limit * len(self.keys), per=60.0)
+        # Calls actually sent, per endpoint, persisted across restarts
+        self.quota = QuotaLedger(ledger_file, daily_limit=daily_limit * len(self.keys))
+        # Shared by all workers: one outage stops everyone, not each after a timeout
+        self.breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30.0)
+        # Set on shutdown so workers don't sit out a backoff delay
+        self._stopping = threading.Event()
+        self._stats_lock = threading.Lock()
+        self.error_counts = {}
+        self.retries = 0
+        self.fallbacks = 0
+        self.resolver = CityResolver(index_file)
+        # Name lookups for cities without a known ID, run side by side;
+        # not on the executor the calling task itself runs on
+        self.lookup_pool = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="city-lookup")
+        # Set on copies made by with_own_connections
+        self.shares_state = False
+
+    def with_own_connections(self, pool_size=2):
+        """Copy of this API on separate connections, for hedged requests
+
+        The copy shares keys, rate limiter, call ledger, circuit breaker,
+        caches and city index with this one, so hedged calls are counted
+        against the same budgets. It only has its own connection pool,
+        request coalescing and latency window.
+        """
+        replica = copy.copy(self)
+        WeatherProvider.__init__(replica)
+        replica.pool_size = pool_size
+        replica.session = self._create_session(pool_size)
+        replica.flights = SingleFlight()
+        replica.shares_state = True
+        return replica
+
+    # ---------------------------
+    # HTTP Session
+    # ---------------------------
+    def _create_session(self, pool_size):
+        """Create a keep-alive session shared by all worker threads"""
+        session = requests.Session()
+
+        # pool_block makes extra threads wait for a free connection
+        # instead of opening (and then discarding) one of their own
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def warm_up(self, background=True):
+        """Open a connection to the API host ahead of the first request"""
+        if background:
+            thread = threading.Thread(target=self._warm_up, name="weather-api-warmup", daemon=True)
+            thread.start()
+            return thread
+
+        self._warm_up()
+        return None
+
+    def _warm_up(self):
+        try:
+            # Any response will do, the point is the TCP + TLS handshake
+            self.session.head(self.base_url, timeout=5)
+        except requests.RequestException as e:
+            print(f"API warm-up failed: {e}")
+
+    def stop_retries(self):
+        """Make requests waiting to retry give up now (used on shutdown)"""
+        self._stopping.set()
+
+    def close(self):
+        """Release pooled connections and the disk cache"""
+        self.stop_retries()
+        self.session.close()
+        if self.shares_state:
+            # The ledger, disk cache and lookup pool belong to the API this was copied from
+            return
+        self.lookup_pool.shutdown(wait=False)
+        self.quota.flush()
+        if self.disk_cache:
+            self.disk_cache.close()
 
     # ---------------------------
     # Internal Request Handler
     # ---------------------------
-    def _request(self, endpoint, params):
-        params["appid"] = self.api_key
+    def _request(self, endpoint, params, priority=VISIBLE):
+        key = self._cache_key(endpoint, params)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Concurrent requests for the same key share one network call
+        return self.flights.do(key, self._fetch, key, endpoint, params, priority)
+
+    def _fetch(self, key, endpoint, params, priority=VISIBLE):
+        attempt = 1
+        while True:
+            if not self.breaker.allow():
+                raise CircuitOpenError(f"OpenWeatherMap unavailable, retrying in {self.breaker.retry_in():.0f} s")
+
+            # Set once the breaker has been told how the call went
+            settled = False
+            api_key = None
+            try:
+                # Only real network calls spend rate-limit budget
+                self._sync_rate_limit()
+                self.limiter.acquire(priority)
+                api_key = self.keys.acquire(shard=key[1], onecall=endpoint == "onecall")
+                if api_key is None:
+                    raise self._no_key_error()
+                data = self._send(endpoint, params, api_key)
+                self.breaker.record_success()
+                settled = True
+                break
+            except WeatherAPIError as e:
+                self._count_error(e)
+                if e.is_outage:
+                    self.breaker.record_failure()
+                    settled = True
+                elif api_key is not None:
+                    # OWM answered, so it is up even if this request was wrong
+                    self.breaker.record_success()
+                    settled = True
+                else:
+                    # No key was in rotation, so nothing was learned about OWM
+                    self.breaker.release_trial()
+                    settled = True
+
+                if api_key is not None and endpoint == "onecall" and e.kind == "invalid_key":
+                    # The key works, just not for One Call; callers fall back
+                    self.keys.revoke_onecall(api_key)
+                    raise
+
+                if api_key is not None and e.kind in ("invalid_key", "rate_limited") and len(self.keys) > 1:
+                    # Rotate this key out and go straight to the next one
+                    self.keys.disable(api_key, e)
+                    if self.keys.active_count():
+                        continue
+
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    print(f"API Error ({e.kind}): {e}")
+                    raise
+
+                print(f"API Error ({e.kind}): {e}; retry {attempt} in {delay:.1f} s")
+                with self._stats_lock:
+                    self.retries += 1
+                attempt += 1
+                if self._stopping.wait(delay):
+                    raise
+            finally:
+                if not settled:
+                    # Interrupted before any verdict: don't leave a half-open trial taken
+                    self.breaker.release_trial()
+
+        if endpoint == "forecast":
+            expires_at = time.time() + FORECAST_TTL
+        elif endpoint == "onecall":
+            # Current conditions are the part that goes stale first
+            expires_at = self._cache_expiry(data.get("current"))
+        else:
+            expires_at = self._cache_expiry(data)
+        self.cache.put(key, data, expires_at)
+
+        # A lookup by name also answers later lookups by the resolved ID
+        city_id = self._payload_city_id(data)
+        if "q" in params and city_id:
+            self.cache.put(self._cache_key(endpoint, {"id": city_id, "units": params.get("units")}), data, expires_at)
+        return data
+
+    def _send(self, endpoint, params, api_key):
+        """One HTTP call; failures are raised as classified WeatherAPIErrors"""
+        params = dict(params, appid=api_key.key)
+        url = self.onecall_url if endpoint == "onecall" else f"{self.base_url}/{endpoint}"
+        started_at = time.perf_counter()
+        try:
+            r = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+            self.record_latency(time.perf_counter() - started_at)
+        except requests.Timeout as e:
+            raise RequestTimeoutError(f"Request to {endpoint} timed out") from e
+        except requests.RequestException as e:
+            raise ConnectionFailedError(f"Could not reach OpenWeatherMap: {e}") from e
+
+        # OWM counts every request it answers, errors included
+        self.quota.record(endpoint, key=api_key.label if len(self.keys) > 1 else None)
+        if r.status_code >= 400:
+            raise error_for_response(r)
         try:
-            r = requests.get(f"{self.base_url}/{endpoint}", params=params, timeout=10)
-            r.raise_for_status()
-            
-            # Track successful API call
-            self.api_calls_made = getattr(self, 'api_calls_made', 0) + 1
-            
             return r.json()
-        except (requests.RequestException, ValueError) as e:
-            print(f"API Error: {e}")
+        except ValueError as e:
+            raise ServerError(f"Invalid response from {endpoint}", r.status_code) from e
+
+    def _sync_rate_limit(self):
+        """Scale the shared per-minute budget with the number of keys in rotation"""
+        rate = self.rate_limit * max(1, self.keys.active_count())
+        if rate != self.limiter.rate:
+            self.limiter.set_rate(rate)
+
+    def _no_key_error(self):
+        """Error for a request that found every API key out of rotation"""
+        retry_in = self.keys.retry_in()
+        if all(state["last_error"] == "invalid_key" for state in self.keys.stats()):
+            return InvalidKeyError("Every API key was rejected as invalid")
+        return RateLimitedError(f"Every API key is rate-limited, next one back in {retry_in:.0f} s",
+                                retry_after=retry_in)
+
+    def _retry_delay(self, attempt, error):
+        """Seconds to wait before retrying, or None to give up"""
+        if not error.retryable or attempt >= MAX_ATTEMPTS:
+            return None
+        if error.retry_after is not None and error.retry_after > MAX_RETRY_AFTER:
+            return None
+
+        # Equal jitter: at least half the exponential step, so workers spread out
+        step = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempt - 1))
+        delay = step / 2 + random.uniform(0, step / 2)
+        if error.retry_after is not None:
+            delay = max(delay, error.retry_after)
+        return delay
+
+    def _count_error(self, error):
+        with self._stats_lock:
+            self.error_counts[error.kind] = self.error_counts.get(error.kind, 0) + 1
+
+    def _fallback(self, kind, city, units, error):
+        """Serve the last stored result when OWM can't answer right now"""
+        if error.is_outage or error.retryable:
+            cached = self._load(kind, city, units)
+            if cached:
+                print(f"Serving cached {kind} weather for {city}: {error}")
+                with self._stats_lock:
+                    self.fallbacks += 1
+                return cached
+        raise error
+
+    def _payload_city_id(self, data):
+        if not isinstance(data, dict):
+            return None
+        if isinstance(data.get("city"), dict):
+            return data["city"].get("id")
+        return data.get("id")
+
+    def _cache_key(self, endpoint, params):
+        if "lat" in params:
+            return (endpoint, f"{params['lat']},{params['lon']}", params.get("units"))
+        city = str(params.get("q", params.get("id", ""))).strip().lower()
+        return (endpoint, city, params.get("units"))
+
+    def _cache_expiry(self, data):
+        """Keep observations until the next one is due, within the TTL bounds"""
+        now = time.time()
+        expires_at = now + CACHE_TTL
+
+        observed_at = data.get("dt") if isinstance(data, dict) else None
+        if observed_at:
+            expires_at = min(expires_at, observed_at + OBSERVATION_INTERVAL)
+
+        return max(expires_at, now + CACHE_MIN_TTL)
+
+    def cache_stats(self):
+        """Hit/miss/eviction counters for the response cache"""
+        return self.cache.stats()
+
+    def request_stats(self):
+        """Network calls issued versus requests coalesced onto them"""
+        return self.flights.stats()
+
+    def error_stats(self):
+        """Failures by kind, retries, cache fallbacks and circuit breaker state"""
+        with self._stats_lock:
+            stats = {
+                "errors": dict(self.error_counts),
+                "retries": self.retries,
+                "fallbacks": self.fallbacks,
+            }
+        stats["breaker"] = self.breaker.stats()
+        return stats
+
+    def key_stats(self):
+        """Per-key call counts and rotation state"""
+        return self.keys.stats()
+
+    def rate_limit_stats(self):
+        """Remaining per-minute budget and queue wait per priority class"""
+        return self.limiter.stats()
+
+    def quota_stats(self):
+        """Calls made today, in the last minute and overall"""
+        return self.quota.stats()
+
+    # ---------------------------
+    # Persistent Cache
+    # ---------------------------
+    def _store(self, kind, city, units, result):
+        if self.disk_cache and result:
+            self.disk_cache.put(kind, city, units, to_plain(result))
+        return result
+
+    def _load(self, kind, city, units):
+        if not self.disk_cache:
             return None
+        entry = self.disk_cache.get(kind, city, units)
+        return entry[0] if entry else None
+
+    def get_cached_current_weather(self, city, units="metric"):
+        """Last stored current weather for city, however old (no network)"""
+        return self._load("current", city, units)
+
+    def get_cached_daily_summary(self, city, units="metric"):
+        """Last stored daily summary for city, however old (no network)"""
+        return self._load("daily", city, units)
+
+    def has_fresh_current_weather(self, city, units="metric"):
+        """True if current weather for city would be answered from memory"""
+        keys = [self._cache_key("weather", self._location_params(city, units))]
+        record = self.resolver.lookup(city)
+        if self.keys.has_onecall() and record and record.get("lat") is not None and record.get("lon") is not None:
+            keys.append(self._cache_key("onecall", {"lat": record["lat"], "lon": record["lon"], "units": units}))
+        return any(self.cache.is_fresh(key) for key in keys)
+
+    def disk_cache_stats(self):
+        return self.disk_cache.stats() if self.disk_cache else None
 
     # ---------------------------
     # Current Weather
     # ---------------------------
-    def get_current_weather(self, city, units="metric"):
-        data = self._request("weather", {"q": city, "units": units})
+    def _location_params(self, city, units):
+        """Query by canonical OWM ID once the name has been resolved"""
+        params = self.resolver.query_params(city)
+        params["units"] = units
+        return params
+
+    def resolve_city(self, city):
+        """Canonical city record (ID, name, coordinates...) or None"""
+        return self.resolver.lookup(city)
+
+    def resolve_city_id(self, city):
+        """Canonical OWM ID for a city name, or None if not resolved yet"""
+        return self.resolver.lookup_id(city)
+
+    def get_current_weather(self, city, units="metric", priority=VISIBLE):
+        try:
+            onecall = self._get_onecall(city, units, priority)
+            if onecall:
+                return self._store("current", city, units, self._parse_onecall_current(*onecall))
+            data = self._request("weather", self._location_params(city, units), priority)
+        except WeatherAPIError as e:
+            return self._fallback("current", city, units, e)
         if not data:
             return None
 
+        self.resolver.record(city, data)
+        return self._store("current", city, units, self._parse_current(data))
+
+    def _parse_current(self, data):
+        """Normalize a 'weather' payload (or one entry of a 'group' payload)"""
         w = data["weather"][0]
         m = data["main"]
 
-        return {
-            "city": data["name"],
-            "country": data["sys"]["country"],
-
-            "temperature": m["temp"],
-            "feels_like": m["feels_like"],
-            "temp_min": m["temp_min"],
-            "temp_max": m["temp_max"],
-            "humidity": m["humidity"],
-            "pressure": m["pressure"],
-
-            "description": w["description"],
-            "main": w["main"],
-            "icon": w["icon"],
-            "id": w["id"],
-
-            "wind_speed": data["wind"]["speed"],
-            "wind_deg": data["wind"].get("deg", 0),
-            "clouds": data["clouds"]["all"],
-            "visibility": data.get("visibility", 0),
-
-            "rain": data.get("rain", {}),
-            "snow": data.get("snow", {}),
-
-            "timestamp": data["dt"],
-            "sunrise": data["sys"]["sunrise"],
-            "sunset": data["sys"]["sunset"],
-            "timezone": data["timezone"],
-        }
+        return CurrentObservation(
+            city=data["name"],
+            city_id=data.get("id"),
+            country=data["sys"]["country"],
+
+            temperature=m["temp"],
+            feels_like=m["feels_like"],
+            temp_min=m["temp_min"],
+            temp_max=m["temp_max"],
+            humidity=m["humidity"],
+            pressure=m["pressure"],
+
+            description=w["description"],
+            main=w["main"],
+            icon=w["icon"],
+            id=w["id"],
+
+            wind_speed=data["wind"]["speed"],
+            wind_deg=data["wind"].get("deg", 0),
+            clouds=data["clouds"]["all"],
+            visibility=data.get("visibility", 0),
+
+            rain=data.get("rain", {}),
+            snow=data.get("snow", {}),
+
+            timestamp=data["dt"],
+            sunrise=data["sys"]["sunrise"],
+            sunset=data["sys"]["sunset"],
+            # Group responses carry the offset under "sys"
+            timezone=data.get("timezone", data["sys"].get("timezone", 0)),
+        )
+
+    # ---------------------------
+    # Batched Current Weather
+    # ---------------------------
+    def _lookup_city_id(self, city, units):
+        city_id = self.resolver.lookup_id(city)
+        if city_id is None:
+            # Cards rendered from the disk cache already know their ID
+            cached = self.get_cached_current_weather(city, units)
+            if cached and cached.get("city_id"):
+                city_id = cached["city_id"]
+                self.resolver.learn_id(city, city_id)
+        return city_id
+
+    def get_current_weather_group(self, cities, units="metric", priority=VISIBLE):
+        """Fetch current weather for many cities, 20 per request
+
+        Cities with a known OWM ID go through the group endpoint; the rest
+        are looked up by name in parallel, which also records their ID for
+        next time. Cities OWM can't answer for fall back to their last
+        stored weather. Returns {city: normalized dict or None}.
+        """
+        results = {}
+        by_id = {}
+        lookups = {}
+
+        for city in cities:
+            city_id = self._lookup_city_id(city, units)
+            if city_id:
+                by_id.setdefault(city_id, []).append(city)
+            elif city not in lookups:
+                lookups[city] = self.lookup_pool.submit(self.get_current_weather, city, units, priority)
+
+        ids = list(by_id)
+        for start in range(0, len(ids), GROUP_BATCH_SIZE):
+            batch = ids[start:start + GROUP_BATCH_SIZE]
+            try:
+                data = self._request("group", {"id": ",".join(str(i) for i in batch), "units": units}, priority)
+            except WeatherAPIError as e:
+                for city_id in batch:
+                    for city in by_id[city_id]:
+                        try:
+                            results[city] = self._fallback("current", city, units, e)
+                        except WeatherAPIError:
+                            results[city] = None
+                continue
+            entries = {entry["id"]: entry for entry in data.get("list", [])} if data else {}
+
+            for city_id in batch:
+                entry = entries.get(city_id)
+                for city in by_id[city_id]:
+                    if entry is None:
+                        results[city] = None
+                        continue
+
+                    # Group entries carry coord, sys.country and sys.timezone too
+                    self.resolver.record(city, entry)
+                    # Seed the per-city cache so opening the card is free
+                    self.cache.put(self._cache_key("weather", self._location_params(city, units)),
+                                   entry, self._cache_expiry(entry))
+                    results[city] = self._store("current", city, units, self._parse_current(entry))
+
+        for city, future in lookups.items():
+            try:
+                results[city] = future.result()
+            except WeatherAPIError:
+                results[city] = None
+        return {city: results[city] for city in cities}
+
+    def estimate_refresh_calls(self, cities, units="metric"):
+        """Network calls one get_current_weather_group(cities) costs at most"""
+        ids = set()
+        unresolved = 0
+        for city in cities:
+            city_id = self.resolver.lookup_id(city)
+            if city_id:
+                ids.add(city_id)
+            else:
+                unresolved += 1
+        return math.ceil(len(ids) / GROUP_BATCH_SIZE) + unresolved
 
 
     # ---------------------------
     # 5-Day / 3-Hour Forecast
     # ---------------------------
-    def get_5day_forecast(self, city, units="metric"):
-        data = self._request("forecast", {"q": city, "units": units})
+    def get_5day_forecast(self, city, units="metric", priority=VISIBLE):
+        entry = self._get_forecast_entry(city, units, priority)
+        if not entry:
+            return None
+        return self._forecast_view(entry, "blocks", lambda: self._parse_forecast(entry["payload"]))
+
+    def _get_forecast_entry(self, city, units, priority=VISIBLE):
+        """Parsed forecast for city, re-parsed only when OWM's data changed"""
+        params = self._location_params(city, units)
+        data = self._request("forecast", params, priority)
         if not data:
             return None
 
+        key = (self._payload_city_id(data) or self._cache_key("forecast", params)[1], units)
+        fingerprint = self._forecast_fingerprint(data)
+        entry = self.forecasts.get(key)
+        if entry is not None and entry["fingerprint"] == fingerprint:
+            return entry
+
+        self.resolver.record(city, data)
+        entry = {
+            "fingerprint": fingerprint,
+            "payload": data,
+            "columns": ColumnarForecast.from_payload(data),
+            # Derived views (daily summary, ...) memoized per forecast
+            "views": {},
+        }
+        self.forecasts.put(key, entry)
+        return entry
+
+    def _forecast_fingerprint(self, data):
+        blocks = data.get("list") or [{}]
+        return (data.get("cnt"), blocks[0].get("dt"), blocks[-1].get("dt"), blocks[0].get("main", {}).get("temp"))
+
+    def _forecast_view(self, entry, view, build):
+        views = entry["views"]
+        if view not in views:
+            views[view] = build()
+        return views[view]
+
+    def _parse_forecast(self, data):
         forecast_by_day = {}
+        # Days and times in the city's own UTC offset, as in the daily summary
+        tz_offset = data["city"].get("timezone", 0)
 
         for item in data["list"]:
             ts = item["dt"]
-            date = datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
+            local_time = datetime.fromtimestamp(ts + tz_offset, tz=timezone.utc)
+            date = local_time.strftime("%Y-%m-%d")
 
             if date not in forecast_by_day:
                 forecast_by_day[date] = []
@@ -86,25 +614,25 @@ class WeatherAPI:
             w = item["weather"][0]
             m = item["main"]
 
-            forecast_by_day[date].append({
-                "time": datetime.fromtimestamp(ts).strftime("%H:%M"),
-                "timestamp": ts,
-                "temperature": m["temp"],
-                "feels_like": m["feels_like"],
-                "temp_min": m["temp_min"],
-                "temp_max": m["temp_max"],
-                "humidity": m["humidity"],
-                "pressure": m["pressure"],
-                "description": w["description"],
-                "main": w["main"],
-                "icon": w["icon"],
-                "id": w["id"],  # Added weather condition ID,
-                "visibility": data.get("visibility"),
-                "wind_speed": item["wind"]["speed"],
-                "wind_deg": item["wind"].get("deg", 0),
-                "clouds": item["clouds"]["all"],
-                "pop": item.get("pop", 0) * 100
-            })
+            forecast_by_day[date].append(ForecastBlock(
+                time=local_time.strftime("%H:%M"),
+                timestamp=ts,
+                temperature=m["temp"],
+                feels_like=m["feels_like"],
+                temp_min=m["temp_min"],
+                temp_max=m["temp_max"],
+                humidity=m["humidity"],
+                pressure=m["pressure"],
+                description=w["description"],
+                main=w["main"],
+                icon=w["icon"],
+                id=w["id"],  # Added weather condition ID,
+                visibility=item.get("visibility"),
+                wind_speed=item["wind"]["speed"],
+                wind_deg=item["wind"].get("deg", 0),
+                clouds=item["clouds"]["all"],
+                pop=item.get("pop", 0) * 100
+            ))
 
         return {
             "city": data["city"]["name"],
@@ -115,32 +643,119 @@ class WeatherAPI:
     # ---------------------------
     # Daily Summary
     # ---------------------------
-    def get_daily_summary(self, city, units="metric"):
-        forecast_data = self.get_5day_forecast(city, units)
-        if not forecast_data:
+    def get_daily_summary(self, city, units="metric", priority=VISIBLE):
+        try:
+            onecall = self._get_onecall(city, units, priority)
+            if onecall:
+                return self._store("daily", city, units, self._parse_onecall_daily(*onecall))
+            entry = self._get_forecast_entry(city, units, priority)
+        except WeatherAPIError as e:
+            return self._fallback("daily", city, units, e)
+        if not entry:
             return None
 
-        summaries = []
-
-        for date, blocks in forecast_data["forecast"].items():
-            temps = [b["temperature"] for b in blocks]
-            mid = blocks[len(blocks) // 2]  # mid-block → closest to midday
-
-            summaries.append({
-                "date": date,
-                "day_name": datetime.strptime(date, "%Y-%m-%d").strftime("%A"),
-                "temp_min": min(temps),
-                "temp_max": max(temps),
-                "temp_avg": sum(temps) / len(temps),
-                "description": mid["description"],
-                "icon": mid["icon"],
-                "id": mid["id"],  # Added weather condition ID
-                "humidity": sum(b["humidity"] for b in blocks) / len(blocks),
-                "wind_speed": sum(b["wind_speed"] for b in blocks) / len(blocks),
-            })
+        fresh = "daily" not in entry["views"]
+        summary = self._forecast_view(entry, "daily", lambda: self._build_daily_summary(entry["columns"]))
+        if fresh:
+            self._store("daily", city, units, summary)
+        return summary
 
+    def _build_daily_summary(self, columns):
+        # Days are bucketed in the city's timezone (see ColumnarForecast)
         return {
-            "city": forecast_data["city"],
-            "country": forecast_data["country"],
-            "daily": summaries
-        }
\ No newline at end of file
+            "city": columns.city,
+            "country": columns.country,
+            "daily": columns.daily()
+        }
+
+    # ---------------------------
+    # One Call
+    # ---------------------------
+    def _get_onecall(self, city, units, priority=VISIBLE):
+        """(city record, One Call payload), or None to use the classic endpoints
+
+        One Call is keyed by coordinates, so it is only used for cities the
+        resolver already knows and only with keys marked for One Call.
+        Current weather and daily summary then share one cached response.
+        """
+        if not self.keys.has_onecall():
+            return None
+        record = self.resolver.lookup(city)
+        if not record or record.get("lat") is None or record.get("lon") is None:
+            return None
+
+        params = {"lat": record["lat"], "lon": record["lon"], "units": units, "exclude": "minutely,alerts"}
+        try:
+            data = self._request("onecall", params, priority)
+        except InvalidKeyError:
+            # No key has One Call access after all
+            return None
+        return (record, data) if data else None
+
+    def _parse_onecall_current(self, record, data):
+        """Map One Call "current" onto the same record as a 'weather' payload"""
+        c = data["current"]
+        w = c["weather"][0]
+        # Today's range stands in for the station min/max of 'weather'
+        today = data["daily"][0]["temp"] if data.get("daily") else {}
+
+        return CurrentObservation(
+            city=record["name"],
+            city_id=record["id"],
+            country=record.get("country"),
+
+            temperature=c["temp"],
+            feels_like=c["feels_like"],
+            temp_min=today.get("min", c["temp"]),
+            temp_max=today.get("max", c["temp"]),
+            humidity=c["humidity"],
+            pressure=c["pressure"],
+
+            description=w["description"],
+            main=w["main"],
+            icon=w["icon"],
+            id=w["id"],
+
+            wind_speed=c["wind_speed"],
+            wind_deg=c.get("wind_deg", 0),
+            clouds=c.get("clouds", 0),
+            visibility=c.get("visibility", 0),
+
+            rain=c.get("rain", {}),
+            snow=c.get("snow", {}),
+
+            timestamp=c["dt"],
+            sunrise=c.get("sunrise", 0),
+            sunset=c.get("sunset", 0),
+            timezone=data.get("timezone_offset", 0),
+        )
+
+    def _parse_onecall_daily(self, record, data):
+        """Map One Call "daily" onto the daily summary structure"""
+        offset = data.get("timezone_offset", 0)
+        daily = []
+        for day in data.get("daily", []):
+            w = day["weather"][0]
+            temp = day["temp"]
+            # Dates in the city's own timezone, as for the classic forecast
+            date = datetime.fromtimestamp(day["dt"] + offset, tz=timezone.utc)
+
+            daily.append(DailySummary(
+                date=date.strftime("%Y-%m-%d"),
+                day_name=date.strftime("%A"),
+                temp_min=temp["min"],
+                temp_max=temp["max"],
+                temp_avg=(temp["morn"] + temp["day"] + temp["eve"] + temp["night"]) / 4,
+                description=w["description"],
+                icon=w["icon"],
+                id=w["id"],
+                humidity=day["humidity"],
+                wind_speed=day["wind_speed"],
+                pop_max=day.get("pop", 0) * 100,
+            ))
+
+        return {
+            "city": record["name"],
+            "country": record.get("country"),
+            "daily": daily
+        }
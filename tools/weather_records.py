@@ -0,0 +1,114 @@
+import sys
+
+
+def intern_text(value):
+    """Share one string object for repeated condition text ("light rain", "10d")"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class WeatherRecord:
+    """Base for compact weather records with dict-style read access
+
+    Records keep their fields in __slots__ instead of a per-instance dict,
+    while still supporting record["temperature"], record.get("rain", {}),
+    "key" in record and iteration over keys, so code written against the
+    old plain-dict results keeps working.
+    """
+    __slots__ = ()
+    FIELDS = ()
+    INTERNED = ("description", "main", "icon")
+
+    def __init__(self, **values):
+        for field in self.FIELDS:
+            value = values.get(field)
+            if field in self.INTERNED:
+                value = intern_text(value)
+            setattr(self, field, value)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        if key not in self.FIELDS:
+            return default
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.FIELDS
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self):
+        return len(self.FIELDS)
+
+    def keys(self):
+        return self.FIELDS
+
+    def items(self):
+        return [(field, getattr(self, field)) for field in self.FIELDS]
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __eq__(self, other):
+        if isinstance(other, WeatherRecord):
+            return type(self) is type(other) and self.items() == other.items()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class CurrentObservation(WeatherRecord):
+    """Normalized current weather for one city"""
+    FIELDS = (
+        "city", "city_id", "country",
+        "temperature", "feels_like", "temp_min", "temp_max", "humidity", "pressure",
+        "description", "main", "icon", "id",
+        "wind_speed", "wind_deg", "clouds", "visibility",
+        "rain", "snow",
+        "timestamp", "sunrise", "sunset", "timezone",
+    )
+    __slots__ = FIELDS
+
+
+class ForecastBlock(WeatherRecord):
+    """One 3-hour block of the 5-day forecast"""
+    FIELDS = (
+        "time", "timestamp",
+        "temperature", "feels_like", "temp_min", "temp_max", "humidity", "pressure",
+        "description", "main", "icon", "id",
+        "visibility", "wind_speed", "wind_deg", "clouds", "pop",
+    )
+    __slots__ = FIELDS
+
+
+class DailySummary(WeatherRecord):
+    """One day of the daily forecast summary"""
+    FIELDS = (
+        "date", "day_name",
+        "temp_min", "temp_max", "temp_avg",
+        "description", "icon", "id",
+        "humidity", "wind_speed", "pop_max",
+    )
+    __slots__ = FIELDS
+
+
+def to_plain(value):
+    """Convert records (also nested in dicts/lists) to plain JSON-ready values"""
+    if isinstance(value, WeatherRecord):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: to_plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_plain(item) for item in value]
+    return value
@@ -4,17 +4,23 @@ from PyQt5.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QPushButton,
     QFrame, QLineEdit, QLabel, QScrollArea, QMenu, QAction, QGraphicsBlurEffect, QGridLayout, QSizePolicy
 )
-from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QThread, pyqtSignal, QTimer, QPoint
+from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal, QTimer, QPoint
 from PyQt5.QtGui import QCursor, QPixmap, QIcon
 
 from ui.sidebar_card import WeatherCard
 from ui.news_card import NewsCard
 from ui.settings_page import SettingsPage
 
-from tools.weather_api import WeatherAPI
-from tools.news_api import NewsAPI
+from tools.weather_api import WeatherAPI, DEFAULT_API_HOST
+from tools.providers import HedgedProvider, StubProvider
+from tools.news_api import NewsAPI, DEFAULT_NEWS_HOST
+from tools.keyword_matcher import KeywordMatcher
 from tools.window_config import WindowConfig
 from tools.location_detector import LocationWorker
+from tools.task_executor import TaskExecutor
+from tools.city_bundle import CityBundle
+from tools.rate_limiter import VISIBLE, BACKGROUND
+from tools.weather_records import to_plain
 \
 from datetime import datetime, timezone, timedelta
 
@@ -22,12 +28,19 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-# Fetch API keys
+# Fetch API keys (OPENWEATHER_API_KEYS takes a comma-separated pool)
+weather_api_keys = [key.strip() for key in os.getenv("OPENWEATHER_API_KEYS", "").split(",") if key.strip()]
 weather_api_key = os.getenv("OPENWEATHER_API_KEY")
+if weather_api_key and weather_api_key not in weather_api_keys:
+    weather_api_keys.insert(0, weather_api_key)
 
-if not weather_api_key:
+if not weather_api_keys:
     raise RuntimeError("OPENWEATHER_API_KEY not found. Please add it to your .env file.")
 
+# Optional overrides, e.g. to run against benchmarks/standin_server.py
+weather_api_host = os.getenv("OPENWEATHER_API_HOST", DEFAULT_API_HOST)
+news_host = os.getenv("GOOGLE_NEWS_HOST", DEFAULT_NEWS_HOST)
+
 # Dad jokes for easter egg
 DAD_JOKES = [
     "Why did the weather report go to therapy? It had too many issues with precipitation!",
@@ -62,30 +75,36 @@ class SassySearchBar(QLineEdit):
         self.clicked.emit()
         super().mousePressEvent(event)
 
-class WeatherWorker(QThread):
-    """Background thread for fetching weather data"""
-    finished = pyqtSignal(dict)
-    error = pyqtSignal(str)
+class WeatherWorker:
+    """Weather fetch task, run on the shared TaskExecutor"""
     
-    def __init__(self, weather_api, city, fetch_type="current"):
-        super().__init__()
+    def __init__(self, weather_api, city, fetch_type="current", priority=VISIBLE):
         self.weather_api = weather_api
         self.city = city
         self.fetch_type = fetch_type
+        self.priority = priority
     
     def run(self):
-        try:
-            if self.fetch_type == "current":
-                data = self.weather_api.get_current_weather(self.city)
-            elif self.fetch_type == "forecast":
-                data = self.weather_api.get_daily_summary(self.city)
-            
-            if data:
-                self.finished.emit(data)
-            else:
-                self.error.emit(f"Could not fetch weather for {self.city}")
-        except Exception as e:
-            self.error.emit(str(e))
+        if self.fetch_type == "current":
+            data = self.weather_api.get_current_weather(self.city, priority=self.priority)
+        elif self.fetch_type == "forecast":
+            data = self.weather_api.get_daily_summary(self.city, priority=self.priority)
+        
+        if not data:
+            raise RuntimeError(f"Could not fetch weather for {self.city}")
+        return data
+
+
+class GroupWeatherWorker:
+    """Task fetching current weather for many cities at once"""
+    
+    def __init__(self, weather_api, cities, priority=VISIBLE):
+        self.weather_api = weather_api
+        self.cities = list(cities)
+        self.priority = priority
+    
+    def run(self):
+        return self.weather_api.get_current_weather_group(self.cities, priority=self.priority)
 
 
 class MainWindow(QWidget):
@@ -107,24 +126,52 @@ class MainWindow(QWidget):
         self.setGeometry(start_x, start_y, width, height)
         self.setMinimumSize(min_width, min_height)        
 
-        # Initialize APIs
-        self.weather_api = WeatherAPI(weather_api_key)
-        self.total_api_calls = 0
-        self.news_api = NewsAPI()
+        # Load settings from file
+        self.settings_file = "settings.json"
+        self.settings = self.load_settings()
+        self.use_24h = self.settings.get("time_format", "24h") == "24h"
+
+        # Shared bounded thread pool for all background fetches
+        pool_size = int(self.settings.get("worker_pool_size", 8))
+        self.executor = TaskExecutor(max_workers=pool_size)
+
+        # Initialize APIs (one pooled connection per worker thread)
+        self.weather_api = WeatherAPI(
+            weather_api_keys,
+            pool_size=pool_size,
+            cache_file="weather_cache.db",
+            index_file="city_index.json",
+            rate_limit=int(self.settings.get("api_rate_limit", 60)),
+            ledger_file="api_usage.json",
+            daily_limit=int(self.settings.get("daily_call_budget", 1000)),
+            key_routing=self.settings.get("key_routing", "least_used"),
+            api_host=weather_api_host
+        )
+        # Provider used for the open city, optionally hedged
+        self.weather_provider = self.create_weather_provider(pool_size)
+        self.news_api = NewsAPI(self.executor, news_host, cache_file="news_cache.db",
+                                matcher=self.create_news_matcher())
 
         self.current_city = None
         self.saved_cities = []
         self.city_cards = {}
-        self.news_workers = []
+        # [(news item, NewsCard)] in display order
+        self.news_cards = []
+        
+        # Every view request gets a generation; older results are dropped
+        self.view_generation = 0
+        self.view_tasks = []
+        self.last_view_timings = {}
+        # Plain copies of the "current" and "forecast" data the right panel shows
+        self.shown_weather = {}
         
         # Load saved cities from file
         self.cities_file = "saved_cities.json"
         self.load_cities_from_file()
 
-        # Load settings from file
-        self.settings_file = "settings.json"
-        self.settings = self.load_settings()
-        self.use_24h = self.settings.get("time_format", "24h") == "24h"
+        # Open the API connection early so the first search skips the handshake
+        if self.settings.get("connection_warmup", "enabled") == "enabled":
+            self.weather_api.warm_up()
 
 
         # Refresh button spam tracking
@@ -228,6 +275,7 @@ class MainWindow(QWidget):
 
         # Scrollable cities list
         sidebar_scroll = QScrollArea()
+        self.sidebar_scroll = sidebar_scroll
         sidebar_scroll.setWidgetResizable(True)
         sidebar_scroll.setStyleSheet("""
             QScrollArea {
@@ -493,11 +541,12 @@ class MainWindow(QWidget):
         self.location_button.setIcon(QIcon())  # Clear the icon temporarily while loading
         self.location_button.setEnabled(False)
         
-        # Create worker thread
-        self.location_worker = LocationWorker()
-        self.location_worker.finished.connect(self.on_location_detected)
-        self.location_worker.error.connect(self.on_location_error)
-        self.location_worker.start()
+        # Run detection on the worker pool
+        self.executor.submit(
+            LocationWorker().run,
+            on_finished=self.on_location_detected,
+            on_error=self.on_location_error
+        )
     
     def on_location_detected(self, city):
         """Handle successful location detection"""
@@ -533,6 +582,23 @@ class MainWindow(QWidget):
         self.city_label.setText("Location Detection Failed")
         self.description_label.setText(error_msg)
         
+    def create_weather_provider(self, pool_size):
+        """OWM, hedged with the secondary_provider setting when one is configured"""
+        secondary_name = self.settings.get("secondary_provider", "none")
+        if secondary_name == "stub" and weather_api_host != DEFAULT_API_HOST:
+            # Canned data, only when running against a local stand-in
+            secondary = StubProvider()
+        elif secondary_name == "openweathermap":
+            # Fresh connections to OWM, counted against the same keys and budgets
+            secondary = self.weather_api.with_own_connections(pool_size=2)
+        else:
+            if secondary_name == "stub":
+                print("The stub provider is only used with OPENWEATHER_API_HOST set; not hedging")
+            return self.weather_api
+        
+        print(f"Hedging foreground requests with {secondary.name}")
+        return HedgedProvider(self.weather_api, secondary)
+
     def setup_refresh_timer(self):
         """Setup auto-refresh timer based on settings"""
         self.refresh_timer.stop()
@@ -540,13 +606,28 @@ class MainWindow(QWidget):
         interval = self.settings.get("refresh_interval", "manual")
         
         if interval != "manual":
-            minutes = int(interval)
+            minutes = self.budget_refresh_minutes()
             milliseconds = minutes * 60 * 1000
             self.refresh_timer.start(milliseconds)
-            print(f"Auto-refresh enabled: every {minutes} minutes")
+            if minutes != int(interval):
+                print(f"Auto-refresh enabled: every {minutes} minutes (stretched from {interval} to stay under the daily call budget)")
+            else:
+                print(f"Auto-refresh enabled: every {minutes} minutes")
         else:
             print("Auto-refresh disabled (manual mode)")
 
+    def refresh_calls_estimate(self):
+        """API calls one auto-refresh costs with the current cities"""
+        calls = self.weather_api.estimate_refresh_calls(self.saved_cities)
+        if self.current_city:
+            # Current weather + forecast for the open city
+            calls += 2
+        return calls
+
+    def budget_refresh_minutes(self):
+        """Configured refresh interval, stretched if needed to fit the daily budget"""
+        minutes = int(self.settings.get("refresh_interval", "manual"))
+        return self.weather_api.quota.budget_interval(self.refresh_calls_estimate(), minutes)
     
     def auto_refresh_weather(self):
         """Auto-refresh weather data"""
@@ -554,9 +635,15 @@ class MainWindow(QWidget):
         if self.current_city:
             self.search_weather()
         
-        # Refresh all sidebar cities
-        for city in self.saved_cities:
-            self.fetch_city_weather(city)
+        # Refresh all sidebar cities behind any user-initiated fetch
+        self.refresh_sidebar_weather(priority=BACKGROUND)
+        
+        # City count and today's usage change; re-check the interval
+        milliseconds = self.budget_refresh_minutes() * 60 * 1000
+        if milliseconds != self.refresh_timer.interval():
+            self.refresh_timer.setInterval(milliseconds)
+            print(f"Auto-refresh interval adjusted to {milliseconds // 60000} minutes")
+
     def load_cities_from_file(self):
         """Load saved cities from JSON file"""
         if os.path.exists(self.cities_file):
@@ -829,10 +916,32 @@ class MainWindow(QWidget):
     # ---------------- Weather Data Fetching ----------------
     def load_saved_cities(self):
         """Load weather cards for saved cities"""
+        self.dedupe_saved_cities()
+        
         for city in self.saved_cities:
-            self.create_city_card(city)
+            self.create_city_card(city, fetch=False)
+        
+        # One batched request for the whole sidebar
+        self.refresh_sidebar_weather()
+    
+    def dedupe_saved_cities(self):
+        """Drop saved cities that resolve to the same place as an earlier one"""
+        seen_ids = set()
+        unique_cities = []
+        for city in self.saved_cities:
+            city_id = self.weather_api.resolve_city_id(city)
+            if city_id is not None:
+                if city_id in seen_ids:
+                    print(f"Skipping duplicate city: {city}")
+                    continue
+                seen_ids.add(city_id)
+            unique_cities.append(city)
+        
+        if len(unique_cities) != len(self.saved_cities):
+            self.saved_cities = unique_cities
+            self.save_cities_to_file()
     
-    def create_city_card(self, city):
+    def create_city_card(self, city, fetch=True):
         """Create a city card with all event handlers"""
         card = WeatherCard(city)
         card.city_name = city
@@ -850,8 +959,14 @@ class MainWindow(QWidget):
         self.city_cards[city] = card
         self.sidebar_layout.addWidget(card)
         
+        # Show the last known weather right away, then revalidate
+        cached = self.weather_api.get_cached_current_weather(city)
+        if cached:
+            self.update_city_card(city, cached)
+        
         # Fetch weather for this card
-        self.fetch_city_weather(city)
+        if fetch:
+            self.fetch_city_weather(city)
     
     def create_card_click_handler(self, city, card):
         """Create a click handler for a city card"""
@@ -907,16 +1022,63 @@ class MainWindow(QWidget):
     def fetch_city_weather(self, city):
         """Fetch weather for a sidebar city card"""
         try:
-            worker = WeatherWorker(self.weather_api, city, "current")
-            worker.finished.connect(lambda data, c=city: self.update_city_card(c, data))
-            worker.error.connect(lambda err, c=city: self.handle_city_card_error(c, err))
-            worker.start()
-            if not hasattr(self, 'workers'):
-                self.workers = []
-            self.workers.append(worker)
+            self.executor.submit(
+                WeatherWorker(self.weather_api, city, "current").run,
+                on_finished=lambda data, c=city: self.update_city_card(c, data),
+                on_error=lambda err, c=city: self.handle_city_card_error(c, err)
+            )
         except Exception as e:
             print(f"Error creating worker for {city}: {e}")
 
+    def refresh_sidebar_weather(self, priority=VISIBLE):
+        """Fetch all sidebar cities in batches through the group endpoint
+        
+        Cards on screen are fetched at the given priority, cards scrolled
+        out of view (or a collapsed sidebar) as background work.
+        """
+        if not self.saved_cities:
+            return
+        
+        visible = set(self.visible_sidebar_cities())
+        batches = [
+            ([city for city in self.saved_cities if city in visible], priority),
+            ([city for city in self.saved_cities if city not in visible], BACKGROUND),
+        ]
+        
+        for cities, batch_priority in batches:
+            if not cities:
+                continue
+            try:
+                self.executor.submit(
+                    GroupWeatherWorker(self.weather_api, cities, batch_priority).run,
+                    on_finished=self.update_city_cards,
+                    on_error=lambda err: print(f"Error refreshing sidebar: {err}")
+                )
+            except Exception as e:
+                print(f"Error creating sidebar worker: {e}")
+
+    def visible_sidebar_cities(self):
+        """Saved cities whose cards are currently inside the sidebar viewport"""
+        if self.current_sidebar_width == self.sidebar_collapsed:
+            return []
+        
+        top = self.sidebar_scroll.verticalScrollBar().value()
+        bottom = top + self.sidebar_scroll.viewport().height()
+        visible = []
+        for city in self.saved_cities:
+            card = self.city_cards.get(city)
+            if card and card.geometry().bottom() >= top and card.geometry().top() <= bottom:
+                visible.append(city)
+        return visible
+
+    def update_city_cards(self, results):
+        """Fan batched results back out to the individual city cards"""
+        for city, data in results.items():
+            if data:
+                self.update_city_card(city, data)
+            else:
+                self.handle_city_card_error(city, f"Could not fetch weather for {city}")
+
     def get_current_weather(self, city, units="metric"):
         data = self._request("weather", {"q": city, "units": units})
         if not data:
@@ -951,6 +1113,9 @@ class MainWindow(QWidget):
     def handle_city_card_error(self, city, err):
         """Handle errors when loading city card weather"""
         print(f"Error loading {city}: {err}")
+        # Keep showing stale data rather than replacing it with an error
+        if self.weather_api.get_cached_current_weather(city):
+            return
         if city in self.city_cards:
             card = self.city_cards[city]
             card.update_weather("--°", "Error", "--°", "--°")
@@ -994,44 +1159,112 @@ class MainWindow(QWidget):
             return
         
         try:
+            generation = self.start_new_view()
             self.current_city = city
             
-            # Add city to sidebar if not already there
-            self.add_city_to_sidebar(city)
-            
-            # Fetch current weather
-            current_worker = WeatherWorker(self.weather_api, city, "current")
-            current_worker.finished.connect(self.update_current_weather)
-            current_worker.error.connect(self.show_error)
-            current_worker.start()
+            # Add city to sidebar if not already there. Names OWM hasn't
+            # resolved yet wait for the response, so an alias of a saved
+            # city (Bengaluru / Bangalore) doesn't get a card of its own
+            if self.weather_api.resolve_city_id(city) is not None:
+                self.add_city_to_sidebar(city)
             
-            # Fetch forecast
-            forecast_worker = WeatherWorker(self.weather_api, city, "forecast")
-            forecast_worker.finished.connect(self.update_forecast)
-            forecast_worker.error.connect(self.show_error)
-            forecast_worker.start()
+            # Render from the disk cache while fresh data loads
+            self.show_cached_weather(city)
             
-            # Fetch news
-            self.fetch_news(city)
+            # Fetch current weather, forecast and news as one bundle
+            self.show_news_loading(city)
+            bundle = CityBundle(self.executor, self.weather_provider, self.news_api, city)
+            bundle.finished.connect(self.for_view(generation, self.update_city_view))
+            bundle.news_batch.connect(self.for_view(generation, self.merge_news))
+            self.view_tasks.append(bundle.start())
             
             # Clear the search bar after starting the search
             self.search_bar.clear()  # ADD THIS LINE
-            
-            if not hasattr(self, 'workers'):
-                self.workers = []
-            self.workers.extend([current_worker, forecast_worker])
         except Exception as e:
             print(f"Error in search_weather: {e}")
             import traceback
             traceback.print_exc()
         
+    def start_new_view(self):
+        """Supersede the current view request: cancel its work, bump the generation"""
+        for task in self.view_tasks:
+            task.cancel()
+        self.view_tasks = []
+        self.view_generation += 1
+        return self.view_generation
+
+    def for_view(self, generation, callback):
+        """Wrap a callback so it only runs while its view is still the latest"""
+        def handler(*args):
+            if generation == self.view_generation:
+                callback(*args)
+        return handler
+
+    def show_cached_weather(self, city):
+        """Render the last stored weather for a city without touching the network
+
+        Skipped when the in-memory cache is fresh, since the bundle then
+        answers within milliseconds and would paint the panel a second time.
+        """
+        if self.weather_api.has_fresh_current_weather(city):
+            return
+        
+        cached_current = self.weather_api.get_cached_current_weather(city)
+        if cached_current and self.mark_shown("current", cached_current):
+            self.update_current_weather(cached_current)
+        
+        cached_forecast = self.weather_api.get_cached_daily_summary(city)
+        if cached_forecast and self.mark_shown("forecast", cached_forecast):
+            self.update_forecast(cached_forecast)
+
+    def mark_shown(self, part, data):
+        """Record data as shown; False if the panel already shows the same data"""
+        plain = to_plain(data)
+        if self.shown_weather.get(part) == plain:
+            return False
+        self.shown_weather[part] = plain
+        return True
+
+    def update_city_view(self, bundle):
+        """Apply a completed city bundle to the right panel in one pass"""
+        city = bundle["city"]
+        errors = bundle["errors"]
+        
+        self.right.setUpdatesEnabled(False)
+        try:
+            if bundle["current"]:
+                self.on_current_weather_loaded(city, bundle["current"])
+            elif "current" in errors:
+                self.show_error(errors["current"])
+            
+            if bundle["forecast"] and self.mark_shown("forecast", bundle["forecast"]):
+                self.update_forecast(bundle["forecast"])
+            
+            if bundle["news"] is not None:
+                self.update_news(bundle["news"])
+            elif not self.news_cards:
+                self.show_news_error(errors.get("news", "Unknown error"))
+        finally:
+            self.right.setUpdatesEnabled(True)
+        
+        self.last_view_timings = bundle["timings"]
+
+    def on_current_weather_loaded(self, city, data):
+        """Save a searched city once OWM has resolved it, then display it unless already shown"""
+        self.add_city_to_sidebar(city)
+        if self.mark_shown("current", data):
+            self.update_current_weather(data)
+
     def add_city_to_sidebar(self, city):
         """Add a city to the sidebar if it doesn't exist"""
-        # Check if city already exists (case-insensitive)
+        # Check if city already exists (case-insensitive or same OWM city)
         city_lower = city.lower()
+        city_id = self.weather_api.resolve_city_id(city)
         for existing_city in self.saved_cities:
             if existing_city.lower() == city_lower:
                 return  # City already exists
+            if city_id is not None and self.weather_api.resolve_city_id(existing_city) == city_id:
+                return  # Another name for a saved city
         
         # Add to saved cities list
         self.saved_cities.append(city)
@@ -1065,7 +1298,9 @@ class MainWindow(QWidget):
             
             # If this was the current city, clear the display
             if self.current_city == city:
+                self.start_new_view()
                 self.current_city = None
+                self.shown_weather.clear()
                 self.city_label.setText("Select a city to view weather")
                 self.temp_label.setText("--°C")
                 self.description_label.setText("--")
@@ -1088,7 +1323,9 @@ class MainWindow(QWidget):
         self.city_cards.clear()
         
         # Clear current weather display
+        self.start_new_view()
         self.current_city = None
+        self.shown_weather.clear()
         self.city_label.setText("Select a city to view weather")
         self.temp_label.setText("--°C")
         self.description_label.setText("--")
@@ -1180,19 +1417,57 @@ class MainWindow(QWidget):
             cpu_percent = 0
             uptime_str = "Unknown"
             
-        # Real API call tracking (you'll need to add this)
-        api_calls_made = getattr(self, 'total_api_calls', 0)
+        # Persistent API call accounting
+        quota = self.weather_api.quota_stats()
+        if self.settings.get("refresh_interval", "manual") == "manual":
+            quota_projection = "n/a (manual refresh)"
+        else:
+            limit_at = self.weather_api.quota.projected_limit_time(
+                self.refresh_calls_estimate(), self.refresh_timer.interval() / 60000
+            )
+            quota_projection = datetime.fromtimestamp(limit_at).strftime("%H:%M") if limit_at else "not today"
             
-        # Calculate cache size
-        cache_size_mb = 0
-        try:
-            if os.path.exists(self.cities_file):
-                cache_size_mb += os.path.getsize(self.cities_file) / (1024 * 1024)
-            if os.path.exists(self.settings_file):
-                cache_size_mb += os.path.getsize(self.settings_file) / (1024 * 1024)
-        except:
-            pass
+        # Persistent weather cache
+        disk_cache = self.weather_api.disk_cache_stats() or {
+            "entries": 0, "file_bytes": 0, "max_entries": 0, "max_bytes": 0
+        }
+        cache_size_mb = disk_cache["file_bytes"] / (1024 * 1024)
             
+        # In-memory API response cache
+        response_cache = self.weather_api.cache_stats()
+        news_cache = self.news_api.cache_stats()
+        request_stats = self.weather_api.request_stats()
+        rate_limit = self.weather_api.rate_limit_stats()
+        error_stats = self.weather_api.error_stats()
+        key_stats = self.weather_api.key_stats()
+        key_usage = " / ".join(
+            f"{key['label']}{' [onecall]' if key['onecall'] else ''} {key['calls']}"
+            + ("" if key["active"] else f" (out: {key['last_error']})")
+            for key in key_stats
+        )
+        breaker = error_stats["breaker"]
+        error_summary = ", ".join(
+            f"{kind} {count}" for kind, count in sorted(error_stats["errors"].items())
+        ) or "none"
+        rate_waits = " / ".join(
+            f"{name} {stats['avg_wait_ms']:.0f}" for name, stats in rate_limit["classes"].items()
+        )
+        executor_stats = self.executor.stats()
+        if isinstance(self.weather_provider, HedgedProvider):
+            hedge = self.weather_provider.hedge_stats()
+            hedge_status = (f"{hedge['hedged']}/{hedge['foreground_calls']} hedged to {hedge['secondary']} "
+                            f"after {hedge['hedge_delay_ms']:.0f} ms, {hedge['secondary_wins']} won")
+        else:
+            hedge_status = "off"
+        view_timings = " / ".join(
+            f"{stage} {self.last_view_timings[stage]:.0f}"
+            for stage in ("current", "forecast", "news", "total") if stage in self.last_view_timings
+        ) or "n/a"
+        feed_timings = " / ".join(
+            f"{feed['ms']:.0f}" + ("" if feed["status"] == "ok" else f" {feed['status']}")
+            for feed in self.news_api.last_feed_timings
+        ) or "n/a"
+
         # Count Easter eggs found
         easter_eggs_found = 0
         if hasattr(self, 'dev_mode_active') and self.dev_mode_active:
@@ -1206,6 +1481,9 @@ class MainWindow(QWidget):
             refresh_status = "MANUAL (Disabled)"
         else:
             refresh_status = f"EVERY {refresh_interval} MINUTES"
+            effective_minutes = self.refresh_timer.interval() // 60000
+            if effective_minutes != int(refresh_interval):
+                refresh_status = f"EVERY {effective_minutes} MINUTES (stretched from {refresh_interval} for budget)"
             
         # Current weather API info
         current_city = self.current_city if self.current_city else "None"
@@ -1223,14 +1501,31 @@ class MainWindow(QWidget):
     └─ Platform: {self.window_config.get_platform_name()}
 
     [API STATISTICS]
-    ├─ Total Calls Made: {api_calls_made:,}
+    ├─ Total Calls Made: {quota['total']:,}
+    ├─ Calls Today: {quota['today']:,}/{quota['daily_limit']:,} ({quota['last_minute']:.0f} in the last minute)
+    ├─ Daily Limit Reached: {quota_projection}
     ├─ API Key: {'*' * 28}{self.weather_api.api_key[-4:]}
+    ├─ Key Pool: {sum(key['active'] for key in key_stats)}/{len(key_stats)} in rotation ({self.weather_api.keys.strategy})
+    ├─ Calls per Key: {key_usage}
+    ├─ Requests Issued: {request_stats['issued']:,}
+    ├─ Requests Coalesced: {request_stats['coalesced']:,} ({request_stats['coalesce_rate']:.0%})
+    ├─ Rate Budget: {rate_limit['remaining']}/{rate_limit['capacity']} left ({rate_limit['rate_per_minute']:.0f}/min)
+    ├─ Rate-Limited Queue: {rate_limit['queued']} waiting
+    ├─ Rate Wait (ms avg): {rate_waits}
+    ├─ Errors: {error_summary}
+    ├─ Retries / Cache Fallbacks: {error_stats['retries']:,} / {error_stats['fallbacks']:,}
+    ├─ Circuit Breaker: {breaker['state'].upper()} (opened {breaker['times_opened']}x, {breaker['rejected']:,} calls refused)
     ├─ Current City: {current_city}
     ├─ Saved Cities: {len(self.saved_cities)}
     └─ Auto-Refresh: {refresh_status}
 
     [CACHE & STORAGE]
-    ├─ Cache Size: {cache_size_mb:.2f} MB
+    ├─ Cache Size: {cache_size_mb:.2f} MB ({disk_cache['entries']}/{disk_cache['max_entries']} entries)
+    ├─ Cache Limit: {disk_cache['max_bytes'] / (1024 * 1024):.0f} MB
+    ├─ Response Cache: {response_cache['entries']}/{response_cache['max_entries']} entries
+    ├─ Cache Hits/Misses: {response_cache['hits']:,}/{response_cache['misses']:,} ({response_cache['hit_rate']:.0%})
+    ├─ Cache Evictions: {response_cache['evictions']:,} (+{response_cache['expirations']:,} expired)
+    ├─ News Cache: {news_cache['fresh_hits']:,} fresh / {news_cache['not_modified']:,} not modified / {news_cache['downloads']:,} downloaded
     ├─ Cities File: {self.cities_file}
     ├─ Settings File: {self.settings_file}
     └─ Config Files: 3 loaded
@@ -1238,8 +1533,14 @@ class MainWindow(QWidget):
     [PERFORMANCE METRICS]
     ├─ Memory Usage: {memory_mb:.1f} MB
     ├─ CPU Usage: {cpu_percent:.1f}%
-    ├─ Active Workers: {len(getattr(self, 'workers', []))}
-    └─ News Workers: {len(self.news_workers)}
+    ├─ Active Workers: {executor_stats['active']}/{executor_stats['max_workers']} ({executor_stats['threads']} threads)
+    ├─ Queued Tasks: {executor_stats['queued']}
+    ├─ Tasks Completed: {executor_stats['completed']:,}
+    ├─ Task Latency: {executor_stats['avg_latency_ms']:.0f} ms avg, {executor_stats['p95_latency_ms']:.0f} ms p95
+    ├─ Queue Wait: {executor_stats['avg_wait_ms']:.0f} ms avg
+    ├─ Hedged Requests: {hedge_status}
+    ├─ News Feeds (ms): {feed_timings}
+    └─ Last View (ms): {view_timings}
 
     [CURRENT SETTINGS]
     ├─ Temperature: {self.settings.get('temperature_unit', 'celsius').upper()}
@@ -1381,6 +1682,9 @@ class MainWindow(QWidget):
             ("The Upside Down", "Extremely strange things", "🙃👾", 666, 666),
         ]
         
+        # Drop anything still loading for the previous city
+        self.start_new_view()
+        
         location = random.choice(locations)
         city_name, description, emoji, temp_min, temp_max = location
         temp = random.randint(temp_min, temp_max)
@@ -1638,6 +1942,14 @@ class MainWindow(QWidget):
         QTimer.singleShot(4000, joke_label.deleteLater)
 
     # ---------------- Settings Management ----------------
+    def create_news_matcher(self):
+        """Relevance filter for news, from the news_keywords / news_blocklist settings"""
+        try:
+            return KeywordMatcher(self.settings.get("news_keywords"), self.settings.get("news_blocklist"))
+        except ValueError as e:
+            print(f"News keywords error: {e}")
+            return KeywordMatcher()
+
     def load_settings(self):
         """Load settings from JSON file"""
         if os.path.exists(self.settings_file):
@@ -1766,8 +2078,8 @@ class MainWindow(QWidget):
 
         return "Precipitation", "—"
 
-    def fetch_news(self, city):
-        """Fetch weather news for the city"""
+    def show_news_loading(self, city):
+        """Show the news loading indicator"""
         # Clear existing news
         self.clear_news()
         
@@ -1782,10 +2094,6 @@ class MainWindow(QWidget):
         """)
         loading_label.setAlignment(Qt.AlignCenter)
         self.news_layout.addWidget(loading_label)
-        
-        # Fetch news
-        worker = self.news_api.get_weather_news(city, self.update_news, self.show_news_error)
-        self.news_workers.append(worker)
 
     def clear_news(self):
         """Clear existing news cards"""
@@ -1793,12 +2101,25 @@ class MainWindow(QWidget):
             item = self.news_layout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
+        self.news_cards = []
 
     def update_news(self, news_items):
-        """Update news display"""
-        self.clear_news()
+        """Update news display, keeping the cards of items already shown"""
+        items_by_link = {item["link"]: item for item in news_items}
+        kept = []
+        for item, card in self.news_cards:
+            if item["link"] in items_by_link:
+                # Copies of the story found in later feeds add to its sources
+                item = items_by_link[item["link"]]
+                card.set_source(self.news_source_text(item))
+                kept.append((item, card))
+            else:
+                self.news_layout.removeWidget(card)
+                card.deleteLater()
+        self.news_cards = kept
         
         if not news_items:
+            self.clear_news()
             no_news_label = QLabel("🔭 No recent weather news found for this location.")
             no_news_label.setStyleSheet("""
                 font-size: 15px; 
@@ -1811,21 +2132,54 @@ class MainWindow(QWidget):
             self.news_layout.addWidget(no_news_label)
             return
         
+        self.merge_news(news_items)
+
+    def merge_news(self, news_items):
+        """Insert news items into the rendered list by date, without rebuilding it"""
+        if not self.news_cards:
+            # Replace the loading / no news / error label
+            self.clear_news()
+        
         # Get news count from settings
         news_count = int(self.settings.get("news_count", "10"))
         
-        # Limit news items to the configured count
-        for item in news_items[:news_count]:
+        shown = {item["link"] for item, _ in self.news_cards}
+        for item in news_items:
+            if item["link"] in shown:
+                continue
+            
+            # Most recent first; an item as old as a shown one goes after it
+            date = item.get("date") or datetime.min
+            position = sum(1 for shown_item, _ in self.news_cards if (shown_item.get("date") or datetime.min) >= date)
+            if position >= news_count:
+                continue
+            
             news_card = NewsCard(
                 item["title"],
-                item["source"],
+                self.news_source_text(item),
                 item["published"],
                 item["summary"],
                 item["link"]
             )
 
             news_card.setMaximumWidth(850)
-            self.news_layout.addWidget(news_card)
+            self.news_layout.insertWidget(position, news_card)
+            self.news_cards.insert(position, (item, news_card))
+            shown.add(item["link"])
+
+            # Limit news items to the configured count
+            if len(self.news_cards) > news_count:
+                _, dropped = self.news_cards.pop()
+                self.news_layout.removeWidget(dropped)
+                dropped.deleteLater()
+
+    def news_source_text(self, item):
+        """"BBC News", or "BBC News, Reuters +2" for a story several outlets ran"""
+        sources = item.get("sources") or [item["source"]]
+        text = ", ".join(sources[:2])
+        if len(sources) > 2:
+            text += f" +{len(sources) - 2}"
+        return text
 
     def show_news_error(self, error_msg):
         """Display news error"""
@@ -1989,6 +2343,17 @@ class MainWindow(QWidget):
         if hasattr(self, 'dim_overlay'):
             self.dim_overlay.setGeometry(0, 0, self.right.width(), self.right.height())
     
+    def closeEvent(self, event):
+        """Stop background work and persist API usage before the window goes away"""
+        self.start_new_view()
+        self.weather_api.stop_retries()
+        if self.executor.wait_for_done(5000):
+            self.weather_provider.close()
+            self.news_api.close()
+        else:
+            self.weather_api.quota.flush()
+        super().closeEvent(event)
+
     def resizeEvent(self, event):
         """Handle window resize to update background"""
         super().resizeEvent(event)
@@ -2060,6 +2425,7 @@ class MainWindow(QWidget):
 
     def show_error(self, error_msg):
         """Display error message"""
+        self.shown_weather.pop("current", None)
         self.city_label.setText("Error")
         self.temp_label.setText("--°C")
         self.description_label.setText(error_msg)
@@ -2070,8 +2436,7 @@ class MainWindow(QWidget):
         if self.current_city:
             self.search_weather()
         
-        for city in self.saved_cities:
-            self.fetch_city_weather(city)
+        self.refresh_sidebar_weather()
 
     # ---------------- Sidebar Animation ----------------
     def toggle_sidebar(self):
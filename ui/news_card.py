@@ -39,13 +39,13 @@ class NewsCard(QFrame):
         meta_layout = QHBoxLayout()
         meta_layout.setSpacing(15)
         
-        source_label = QLabel(f"📌 {source}")
-        source_label.setStyleSheet("font-size: 13px; color: #999; background: none;")
+        self.source_label = QLabel(f"📌 {source}")
+        self.source_label.setStyleSheet("font-size: 13px; color: #999; background: none;")
         
         date_label = QLabel(published.split(',')[0] if ',' in published else published[:20])
         date_label.setStyleSheet("font-size: 13px; color: #777; background: none;")
         
-        meta_layout.addWidget(source_label)
+        meta_layout.addWidget(self.source_label)
         meta_layout.addStretch()
         meta_layout.addWidget(date_label)
         
@@ -65,6 +65,9 @@ class NewsCard(QFrame):
         layout.addWidget(summary_label)
         layout.addWidget(read_more)
     
+    def set_source(self, source):
+        self.source_label.setText(f"📌 {source}")
+    
     def mousePressEvent(self, event):
         """Open link in browser when clicked"""
         QDesktopServices.openUrl(QUrl(self.link))